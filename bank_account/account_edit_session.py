@@ -0,0 +1,138 @@
+"""
+Description: Provides the AccountEditSession class, which records deposits and
+withdrawals against a BankAccount without changing it, and applies them all at
+once, under the account's lock, when the session is committed.
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+from bank_account.bank_account import BankAccount
+from bank_account.transaction_journal import TransactionJournal
+
+class AccountEditSession:
+    """
+    Pending transactions on one account.
+
+    deposit() and withdraw() check each amount against the balance the
+    account would have after the pending transactions, and only record it.
+    commit() re-checks the whole sequence against the account's current
+    balance and applies it holding the account's lock throughout, so either
+    every transaction is applied or none is. The transactions are written to
+    the journal as one batch and the notification checks run once, on the
+    final balance. rollback() forgets them.
+
+        with AccountEditSession(account) as session:
+            session.deposit(100.0)
+            session.withdraw(25.0)
+
+    Attributes:
+        account (BankAccount): The account being edited.
+    """
+
+    __slots__ = ("account", "_pending", "_delta")
+
+    def __init__(self, account: BankAccount):
+        """
+        Starts a session with no pending transactions.
+
+        Args:
+            account (BankAccount): The account to edit.
+        """
+        self.account = account
+        self._pending = []
+        self._delta = 0.0
+
+    @property
+    def pending(self) -> list[tuple[int, float]]:
+        """Return the pending (TransactionJournal operation, amount) pairs, in order."""
+        return list(self._pending)
+
+    @property
+    def delta(self) -> float:
+        """Return the net change the pending transactions make to the balance."""
+        return self._delta
+
+    @property
+    def balance(self) -> float:
+        """Return the balance the account will have once the session is committed."""
+        return self.account.balance + self._delta
+
+    def deposit(self, amount: float) -> None:
+        """
+        Records a deposit.
+
+        Args:
+            amount (float): Amount to deposit.
+
+        Raises:
+            ValueError: If amount is not numeric or not positive.
+        """
+        self._check_amount("Deposit", amount)
+        self._pending.append((TransactionJournal.DEPOSIT, amount))
+        self._delta += amount
+
+    def withdraw(self, amount: float) -> None:
+        """
+        Records a withdrawal.
+
+        Args:
+            amount (float): Amount to withdraw.
+
+        Raises:
+            ValueError: If amount is not numeric, not positive, or exceeds the
+                balance left by the pending transactions.
+        """
+        self._check_amount("Withdraw", amount)
+        if amount > self.balance:
+            raise ValueError(f"Withdraw amount: ${amount:,.2f} must not exceed the account balance: ${self.balance:,.2f}.")
+        self._pending.append((TransactionJournal.WITHDRAW, amount))
+        self._delta -= amount
+
+    def commit(self) -> int:
+        """
+        Applies every pending transaction to the account, in order.
+
+        Returns:
+            int: The number of transactions applied.
+
+        Raises:
+            ValueError: If the account's balance changed since the transactions
+                were recorded so that a withdrawal no longer fits; nothing is
+                applied and the transactions stay pending.
+        """
+        with self.account.lock:
+            balance = self.account.balance
+            for operation, amount in self._pending:
+                if operation == TransactionJournal.WITHDRAW and amount > balance:
+                    raise ValueError(f"Withdraw amount: ${amount:,.2f} must not exceed the account balance: ${balance:,.2f}.")
+                balance += amount if operation == TransactionJournal.DEPOSIT else -amount
+
+            self.account._apply_transactions(self._pending)
+
+            applied = len(self._pending)
+            self.rollback()
+            return applied
+
+    def rollback(self) -> None:
+        """Forgets every pending transaction."""
+        self._pending.clear()
+        self._delta = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    @staticmethod
+    def _check_amount(kind: str, amount) -> None:
+        """Raise ValueError unless amount is a positive number."""
+        if not isinstance(amount, (int, float)):
+            raise ValueError(f"{kind} amount: {amount} must be numeric.")
+        if amount <= 0:
+            raise ValueError(f"{kind} amount: ${amount:,.2f} must be positive.")
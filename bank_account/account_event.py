@@ -0,0 +1,34 @@
+"""
+Description: Provides the AccountEvent class, the notification a BankAccount
+sends its observers. Events carry the raw values; the text is only built when
+an observer or sink turns the event into a string.
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+from typing import NamedTuple
+
+class AccountEvent(NamedTuple):
+    """
+    An account notification.
+
+    Attributes:
+        kind (str): The kind of event, LOW_BALANCE or LARGE_TRANSACTION.
+        account_number (int): The account the event happened on.
+        amount (float): The transaction amount that triggered the event.
+        balance (float): The balance after the transaction.
+    """
+
+    kind: str
+    account_number: int
+    amount: float
+    balance: float
+
+    LOW_BALANCE = "Low balance warning"
+    LARGE_TRANSACTION = "Large transaction"
+
+    def __str__(self) -> str:
+        """Return the event as the message text observers have always received."""
+        value = self.balance if self.kind == self.LOW_BALANCE else self.amount
+        return f"{self.kind} ${value:.2f}: on account {self.account_number}."
@@ -0,0 +1,73 @@
+"""
+Description: Provides the AccountLocks class, a fixed pool of re-entrant locks
+shared by every BankAccount. Each account number maps to one lock (a stripe),
+so a balance check and the change that depends on it happen atomically without
+giving every account object a lock of its own.
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import threading
+from contextlib import ExitStack, contextmanager
+
+class AccountLocks:
+    """
+    Striped re-entrant locks keyed by account number.
+
+    Accounts whose numbers share a stripe share a lock, which only costs
+    some parallelism. Several accounts are locked together with locked(),
+    which always takes stripes in ascending order so two threads locking
+    overlapping accounts cannot deadlock.
+
+    Attributes:
+        DEFAULT_STRIPES (int): Number of locks in the default pool.
+    """
+
+    DEFAULT_STRIPES = 64
+
+    __slots__ = ("_locks",)
+
+    def __init__(self, stripes: int = DEFAULT_STRIPES):
+        """
+        Creates the pool.
+
+        Args:
+            stripes (int): Number of locks.
+        """
+        self._locks = tuple(threading.RLock() for _ in range(max(int(stripes), 1)))
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def stripe(self, account_number: int) -> int:
+        """Return the index of the lock guarding an account."""
+        return hash(account_number) % len(self._locks)
+
+    def lock_for(self, account_number: int) -> threading.RLock:
+        """
+        Returns the lock guarding an account.
+
+        Args:
+            account_number (int): The account.
+
+        Returns:
+            threading.RLock: The account's stripe lock.
+        """
+        return self._locks[self.stripe(account_number)]
+
+    @contextmanager
+    def locked(self, *account_numbers: int):
+        """
+        Holds the locks of every given account for the duration of a with block.
+
+        Args:
+            *account_numbers (int): The accounts to lock.
+        """
+        with ExitStack() as stack:
+            for stripe in sorted({self.stripe(number) for number in account_numbers}):
+                stack.enter_context(self._locks[stripe])
+            yield
+
+# Pool shared by every BankAccount
+account_locks = AccountLocks()
@@ -0,0 +1,261 @@
+"""
+Description: Provides the AccountTable class, a columnar store of bank account
+data held in NumPy arrays for fast reporting over every account. Single rows
+can be converted to and from the BankAccount classes when an account object
+is needed.
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import csv
+from datetime import datetime, time
+
+import numpy as np
+
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.investment_account import InvestmentAccount
+
+class AccountTable:
+    """
+    Account data stored one NumPy array per column.
+
+    Missing values (the "Null" placeholders of accounts.csv, or attributes an
+    account type does not have) are stored as NaN in the float columns.
+
+    Attributes:
+        ACCOUNT_TYPES (tuple[type]): Account classes, indexed by account-type code.
+        COLUMNS (dict[str, str]): Column names and their NumPy dtypes.
+    """
+
+    ACCOUNT_TYPES = (ChequingAccount, SavingsAccount, InvestmentAccount)
+
+    COLUMNS = {
+        "account_number": "int64",
+        "client_number": "int64",
+        "balance": "float64",
+        "date_created": "datetime64[D]",
+        "account_type": "int8",
+        "overdraft_limit": "float64",
+        "minimum_balance": "float64",
+        "management_fee": "float64",
+    }
+
+    def __init__(self, **columns):
+        """
+        Initializes a table from one array (or sequence) per column.
+
+        Args:
+            **columns: A value for every name in COLUMNS, all of the same length.
+
+        Raises:
+            ValueError: If a column is missing or the columns differ in length.
+        """
+        lengths = set()
+
+        for name, dtype in self.COLUMNS.items():
+            if name not in columns:
+                raise ValueError(f"Missing column: {name}")
+            array = np.asarray(columns[name], dtype=dtype)
+            setattr(self, name, array)
+            lengths.add(len(array))
+
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length.")
+
+        self._sorted_rows = None
+        self._sorted_numbers = None
+
+    @classmethod
+    def type_code(cls, account_type) -> int:
+        """
+        Returns the account-type code for an account class or class name.
+
+        Raises:
+            ValueError: If the type is not one of ACCOUNT_TYPES.
+        """
+        for code, account_class in enumerate(cls.ACCOUNT_TYPES):
+            if account_type is account_class or account_type == account_class.__name__:
+                return code
+        raise ValueError(f"Invalid account type: {account_type}")
+
+    @classmethod
+    def from_csv(cls, path: str, client_numbers=None) -> "AccountTable":
+        """
+        Builds a table straight from an accounts CSV file without creating
+        any account objects.
+
+        Rows with an invalid number, date or account type are skipped, as
+        load_data does.
+
+        Args:
+            path (str): Path to accounts.csv.
+            client_numbers (Container[int]): If given, rows for other clients are skipped.
+
+        Returns:
+            AccountTable: The table.
+        """
+        columns = {name: [] for name in cls.COLUMNS}
+        type_codes = {account_class.__name__: code
+                      for code, account_class in enumerate(cls.ACCOUNT_TYPES)}
+
+        def optional_float(text):
+            return float("nan") if text in (None, "", "Null") else float(text)
+
+        with open(path, newline="") as csvfile:
+            for row in csv.DictReader(csvfile):
+                try:
+                    values = (
+                        int(row["account_number"]),
+                        int(row["client_number"]),
+                        float(row["balance"]),
+                        np.datetime64(row["date_created"], "D"),
+                        type_codes[row["account_type"]],
+                        optional_float(row["overdraft_limit"]),
+                        optional_float(row["minimum_balance"]),
+                        optional_float(row["management_fee"]),
+                    )
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+                if client_numbers is not None and values[1] not in client_numbers:
+                    continue
+
+                for name, value in zip(cls.COLUMNS, values):
+                    columns[name].append(value)
+
+        return cls(**columns)
+
+    @classmethod
+    def from_accounts(cls, accounts) -> "AccountTable":
+        """
+        Builds a table from BankAccount objects.
+
+        Args:
+            accounts (Iterable[BankAccount]): The accounts.
+
+        Returns:
+            AccountTable: The table.
+        """
+        rows = [cls._account_row(account) for account in accounts]
+        columns = zip(*rows) if rows else ([] for _ in cls.COLUMNS)
+        return cls(**dict(zip(cls.COLUMNS, columns)))
+
+    @classmethod
+    def _account_row(cls, account: BankAccount) -> tuple:
+        """Return the column values for one account, in COLUMNS order."""
+        nan = float("nan")
+        date_created = (np.datetime64(account.date_created, "D")
+                        if account.date_created is not None else np.datetime64("NaT", "D"))
+
+        return (
+            account.account_number,
+            account.client_number,
+            account.balance,
+            date_created,
+            cls.type_code(type(account)),
+            getattr(account, "overdraft_limit", nan),
+            getattr(account, "minimum_balance", nan),
+            getattr(account, "management_fee", nan),
+        )
+
+    def __len__(self) -> int:
+        return len(self.account_number)
+
+    def row_of(self, account_number: int) -> int:
+        """
+        Returns the row index of an account, using a binary search over the
+        account numbers (sorted once, on first use).
+
+        Raises:
+            KeyError: If the account is not in the table.
+        """
+        if self._sorted_rows is None:
+            self._sorted_rows = np.argsort(self.account_number, kind="stable")
+            self._sorted_numbers = self.account_number[self._sorted_rows]
+
+        sorted_numbers = self._sorted_numbers
+        position = np.searchsorted(sorted_numbers, account_number)
+
+        if position >= len(sorted_numbers) or sorted_numbers[position] != account_number:
+            raise KeyError(account_number)
+        return int(self._sorted_rows[position])
+
+    def to_account(self, account_number: int) -> BankAccount:
+        """
+        Materializes one row as a ChequingAccount, SavingsAccount or InvestmentAccount.
+
+        Args:
+            account_number (int): The account to materialize.
+
+        Returns:
+            BankAccount: A new account object holding the row's values.
+        """
+        row = self.row_of(account_number)
+
+        def value_or_zero(column):
+            value = float(column[row])
+            return 0.0 if np.isnan(value) else value
+
+        date_created = self.date_created[row]
+        date_created = (None if np.isnat(date_created)
+                        else datetime.combine(date_created.astype(object), time()))
+        arguments = (int(self.account_number[row]), int(self.client_number[row]),
+                     float(self.balance[row]), date_created)
+        account_class = self.ACCOUNT_TYPES[self.account_type[row]]
+
+        if account_class is ChequingAccount:
+            return ChequingAccount(*arguments,
+                                   minimum_balance=value_or_zero(self.minimum_balance),
+                                   overdraft_limit=value_or_zero(self.overdraft_limit))
+        if account_class is SavingsAccount:
+            return SavingsAccount(*arguments, date_created,
+                                  value_or_zero(self.minimum_balance))
+        return InvestmentAccount(*arguments, value_or_zero(self.management_fee))
+
+    def update_from_account(self, account: BankAccount) -> None:
+        """
+        Copies an account object's current values back into its row.
+
+        Args:
+            account (BankAccount): The account, which must already be in the table.
+        """
+        row = self.row_of(account.account_number)
+
+        for name, value in zip(self.COLUMNS, self._account_row(account)):
+            getattr(self, name)[row] = value
+
+    def total_balance(self) -> float:
+        """Return the sum of every balance."""
+        return float(self.balance.sum())
+
+    def average_balance(self) -> float:
+        """Return the mean balance, or 0.0 for an empty table."""
+        return float(self.balance.mean()) if len(self) else 0.0
+
+    def counts_by_type(self) -> dict[str, int]:
+        """Return the number of accounts of each type, keyed by class name."""
+        counts = np.bincount(self.account_type, minlength=len(self.ACCOUNT_TYPES))
+        return {account_class.__name__: int(count)
+                for account_class, count in zip(self.ACCOUNT_TYPES, counts)}
+
+    def totals_by_type(self) -> dict[str, float]:
+        """Return the total balance of each account type, keyed by class name."""
+        totals = np.bincount(self.account_type, weights=self.balance,
+                             minlength=len(self.ACCOUNT_TYPES))
+        return {account_class.__name__: float(total)
+                for account_class, total in zip(self.ACCOUNT_TYPES, totals)}
+
+    def averages_by_type(self) -> dict[str, float]:
+        """Return the mean balance of each account type (0.0 if it has no accounts)."""
+        counts = self.counts_by_type()
+        return {name: total / counts[name] if counts[name] else 0.0
+                for name, total in self.totals_by_type().items()}
+
+    def totals_by_client(self) -> dict[int, float]:
+        """Return the total balance held by each client, keyed by client_number."""
+        clients, inverse = np.unique(self.client_number, return_inverse=True)
+        totals = np.bincount(inverse, weights=self.balance, minlength=len(clients))
+        return dict(zip(clients.tolist(), totals.tolist()))
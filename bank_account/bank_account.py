@@ -7,7 +7,11 @@ __author__ = "Komalpreet Kaur"
 __version__ = "1.0.0"
 
 from abc import ABC, abstractmethod
+from copy import deepcopy
 from patterns.observer.subject import Subject
+from bank_account.account_event import AccountEvent
+from bank_account.transaction_journal import TransactionJournal
+from bank_account.account_locks import account_locks
 class BankAccount(Subject, ABC):
     """
     Generic bank account class. Inherits Subject first to support observer behaviour.
@@ -15,11 +19,24 @@ class BankAccount(Subject, ABC):
     Attributes:
         LOW_BALANCE_LEVEL (float): Threshold below which a low balance notification is sent.
         LARGE_TRANSACTION_THRESHOLD (float): Absolute transaction amount that triggers a large-transaction notification.
+        journal (TransactionJournal): Records every balance change when set; None (the default) records nothing.
+
+    Every balance change, and every check a change depends on, holds the
+    account's lock from account_locks, so concurrent transactions on one
+    account never lose an update.
+
+    A copy made with copy.copy() or copy.deepcopy() is not journaled: it is
+    not the stored account, so its changes must never be replayed under its
+    account number.
     """
 
     LOW_BALANCE_LEVEL = 25.00
     LARGE_TRANSACTION_THRESHOLD = 10000.00
 
+    __slots__ = ("__account_number", "__client_number", "__balance", "date_created", "_journaled")
+
+    journal = None
+
     def __init__(self, account_number: int, client_number: int, balance: float, date_created=None):
         """
         Initialize a BankAccount instance.
@@ -49,6 +66,7 @@ class BankAccount(Subject, ABC):
             self.__balance = 0.0
 
         self.date_created = date_created
+        self._journaled = True
 
     @property
     def account_number(self) -> int:
@@ -64,23 +82,32 @@ class BankAccount(Subject, ABC):
     def balance(self) -> float:
         """Return the current account balance."""
         return self.__balance
+
+    @property
+    def lock(self):
+        """Return the re-entrant lock guarding this account's balance."""
+        return account_locks.lock_for(self.__account_number)
     
     def _post_transaction_checks(self, transaction_amount: float):
         """
         Check for conditions that should trigger observer notifications.
 
-        Sends notifications for low balance and for large absolute transactions.
+        Sends AccountEvent notifications for low balance and for large absolute
+        transactions. Nothing is checked or built when no observer is listening.
 
         Args:
             transaction_amount (float): The amount of the transaction (positive for deposit, positive for withdraw amount).
         """
+        if not self.has_observers():
+            return
+
         if self.__balance < self.LOW_BALANCE_LEVEL:
-            message = f"Low balance warning ${self.__balance:.2f}: on account {self.__account_number}."
-            self.notify(message)
+            self.notify(AccountEvent(AccountEvent.LOW_BALANCE, self.__account_number,
+                                     transaction_amount, self.__balance))
 
         if abs(transaction_amount) > self.LARGE_TRANSACTION_THRESHOLD:
-            message = f"Large transaction ${transaction_amount:.2f}: on account {self.__account_number}."
-            self.notify(message)
+            self.notify(AccountEvent(AccountEvent.LARGE_TRANSACTION, self.__account_number,
+                                     transaction_amount, self.__balance))
     
     def update_balance(self, amount: float):
         """Update the account balance by the specified amount.
@@ -90,11 +117,79 @@ class BankAccount(Subject, ABC):
         Args:
             amount (float): Amount to add (deposit) or subtract (withdraw).
         """
+        self._change_balance(amount, TransactionJournal.UPDATE)
+
+    def _change_balance(self, amount: float, operation: int):
+        """Add amount to the balance and record the change in the journal, if one is set.
+
+        The account's lock is held until the change is journaled, so journal
+        records of one account are in the order the changes were made.
+
+        Args:
+            amount (float): Amount to add (negative to subtract); invalid amounts are ignored.
+            operation (int): The TransactionJournal operation code to record.
+        """
         try:
             amount_converted = float(amount)
-            self.__balance = self.__balance + amount_converted  
         except (ValueError, TypeError):
-            pass
+            return
+
+        with self.lock:
+            self.__balance = self.__balance + amount_converted
+            if self.journal is not None and self._journaled:
+                self.journal.append(operation, self.__account_number, amount_converted, self.__balance)
+
+    def _apply_transactions(self, transactions):
+        """Apply deposits and withdrawals together, journal them as one batch and run notification checks once.
+
+        The caller checks the amounts; the checks see the final balance and the
+        largest amount.
+
+        Args:
+            transactions (list[tuple[int, float]]): (TransactionJournal.DEPOSIT or WITHDRAW, positive amount) pairs.
+        """
+        if not transactions:
+            return
+
+        with self.lock:
+            balance = self.__balance
+            records = []
+            for operation, amount in transactions:
+                change = float(amount) if operation == TransactionJournal.DEPOSIT else -float(amount)
+                balance += change
+                records.append((operation, self.__account_number, change, balance))
+
+            self.__balance = balance
+            if self.journal is not None and self._journaled:
+                self.journal.append_many(records)
+        self._post_transaction_checks(max((amount for _, amount in transactions), key=abs))
+
+    def __copy__(self):
+        """Return a shallow copy that is not journaled."""
+        return self._unjournaled_copy(lambda value: value, {})
+
+    def __deepcopy__(self, memo):
+        """Return a deep copy that is not journaled."""
+        return self._unjournaled_copy(lambda value: deepcopy(value, memo), memo)
+
+    def _unjournaled_copy(self, copy_value, memo):
+        """Copy every attribute with copy_value into a new account whose changes are not journaled."""
+        duplicate = self.__class__.__new__(self.__class__)
+        memo[id(self)] = duplicate
+
+        # Slotted objects reduce to (instance dict, slot values)
+        state = self.__reduce_ex__(4)[2]
+        for part in state if isinstance(state, tuple) else (state,):
+            for name, value in (part or {}).items():
+                setattr(duplicate, name, copy_value(value))
+
+        duplicate._journaled = False
+        return duplicate
+
+    def _restore_balance(self, balance: float):
+        """Set the balance recovered from the journal, without recording or notifying."""
+        with self.lock:
+            self.__balance = float(balance)
 
     def deposit(self, amount: float):
         """
@@ -111,7 +206,7 @@ class BankAccount(Subject, ABC):
         if amount <= 0:
             raise ValueError(f"Deposit amount: ${amount:,.2f} must be positive.")
         
-        self.update_balance(amount)
+        self._change_balance(amount, TransactionJournal.DEPOSIT)
         self._post_transaction_checks(amount)
 
     def withdraw(self, amount: float):
@@ -128,10 +223,12 @@ class BankAccount(Subject, ABC):
             raise ValueError(f"Withdraw amount: {amount} must be numeric.")
         if amount <= 0:
             raise ValueError(f"Withdraw amount: ${amount:,.2f} must be positive.")
-        if amount > self.__balance:
-            raise ValueError(f"Withdraw amount: ${amount:,.2f} must not exceed the account balance: ${self.__balance:,.2f}.")
-        
-        self.update_balance(-amount)
+
+        with self.lock:
+            if amount > self.__balance:
+                raise ValueError(f"Withdraw amount: ${amount:,.2f} must not exceed the account balance: ${self.__balance:,.2f}.")
+
+            self._change_balance(-amount, TransactionJournal.WITHDRAW)
         self._post_transaction_checks(amount)
 
     @abstractmethod
@@ -8,6 +8,7 @@ __author__ = "Komalpreet Kaur"
 __version__ = "1.0.0"
 
 from bank_account.bank_account import BankAccount 
+from bank_account.transaction_journal import TransactionJournal
 from patterns.strategy.overdraft_strategy import OverdraftStrategy
 
 class ChequingAccount(BankAccount):
@@ -16,6 +17,8 @@ class ChequingAccount(BankAccount):
     This class delegates service charge calculation to OverdraftStrategy.
     """
 
+    __slots__ = ("_minimum_balance", "_overdraft_limit", "_service_charge_strategy")
+
     def __init__(self, account_number: int, client_number: int, balance: float, date_created=None, minimum_balance: float = 0.0, overdraft_limit: float = 0.0):
         """
         Initialize ChequingAccount.
@@ -31,7 +34,7 @@ class ChequingAccount(BankAccount):
         self._minimum_balance = float(minimum_balance)
         self._overdraft_limit = float(overdraft_limit)
 
-        self._service_charge_strategy = OverdraftStrategy(
+        self._service_charge_strategy = OverdraftStrategy.shared(
             minimum_balance=self._minimum_balance,
             base_service_charge=0.50,
             overdraft_limit=self._overdraft_limit
@@ -77,9 +80,10 @@ class ChequingAccount(BankAccount):
         """
         if amount <= 0:
             raise ValueError("Debit amount must be positive.")
-        if self.balance - amount < self.minimum_balance:
-            raise ValueError("Cannot withdraw beyond minimum balance.")
-        self.update_balance(-amount)
+        with self.lock:
+            if self.balance - amount < self.minimum_balance:
+                raise ValueError("Cannot withdraw beyond minimum balance.")
+            self._change_balance(-amount, TransactionJournal.DEBIT)
         self._post_transaction_checks(amount)
 
     def deposit(self, amount: float):
@@ -94,9 +98,14 @@ class ChequingAccount(BankAccount):
         """
         if amount <= 0:
             raise ValueError("Deposit amount must be positive.")
-        self.update_balance(amount)
+        self._change_balance(amount, TransactionJournal.DEPOSIT)
         self._post_transaction_checks(amount)
 
+    @property
+    def service_charge_strategy(self) -> OverdraftStrategy:
+        """Return the (shared) strategy used to calculate service charges."""
+        return self._service_charge_strategy
+
     def get_service_charges(self) -> float:
         """
         Delegate calculation to the configured strategy.
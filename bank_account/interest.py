@@ -0,0 +1,127 @@
+"""
+Description: Provides the InterestEngine class, which calculates month-end
+interest for many accounts in one vectorized pass and posts it either to
+BankAccount objects (followed by a single bulk save) or to an AccountTable.
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import numpy as np
+
+from bank_account.account_table import AccountTable
+from bank_account.chequing_account import ChequingAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.investment_account import InvestmentAccount
+
+class InterestEngine:
+    """
+    Calculates and posts interest with a rate rule per account type.
+
+    A rule is either a fixed rate for every account of the type, or None to
+    use each account's own interest_rate. The default rules match the
+    accounts' apply_interest() methods: investment accounts earn their own
+    rate, chequing and savings accounts earn nothing.
+
+    Attributes:
+        DEFAULT_RATES (dict[type, float | None]): Default rate rule per account class.
+    """
+
+    DEFAULT_RATES = {
+        ChequingAccount: 0.0,
+        SavingsAccount: 0.0,
+        InvestmentAccount: None,
+    }
+
+    def __init__(self, rates: dict = None):
+        """
+        Initializes the engine.
+
+        Args:
+            rates (dict[type, float | None]): Rate rules overriding DEFAULT_RATES.
+        """
+        self.rates = dict(self.DEFAULT_RATES)
+        if rates:
+            self.rates.update(rates)
+
+    def _rate_for(self, account) -> float:
+        """Return the rate that applies to one account."""
+        rule = self.rates.get(type(account), 0.0)
+        if rule is None:
+            return getattr(account, "interest_rate", 0.0)
+        return rule
+
+    def calculate_interest(self, accounts) -> np.ndarray:
+        """
+        Calculates the interest each account would earn.
+
+        Args:
+            accounts (Sequence[BankAccount]): The accounts.
+
+        Returns:
+            numpy.ndarray: The interest of each account, aligned with accounts.
+        """
+        balances = np.fromiter((account.balance for account in accounts),
+                               dtype=float, count=len(accounts))
+        rates = np.fromiter((self._rate_for(account) for account in accounts),
+                            dtype=float, count=len(accounts))
+        return balances * rates
+
+    def post_interest(self, accounts, save=None) -> dict[int, float]:
+        """
+        Posts interest to every account in one pass, then saves the changed
+        accounts with a single call.
+
+        Interest is posted through update_balance(), exactly as the accounts'
+        own apply_interest() does, so observers see the same notifications.
+
+        Args:
+            accounts (Iterable[BankAccount]): The accounts.
+            save (Callable[[list[BankAccount]], object]): Saves the changed accounts
+                in bulk, e.g. manage_data.update_many (optional).
+
+        Returns:
+            dict[int, float]: The interest posted, keyed by account number.
+        """
+        accounts = list(accounts)
+        interest = self.calculate_interest(accounts)
+        posted = {}
+        changed = []
+
+        for index in np.flatnonzero(interest):
+            account = accounts[index]
+            amount = float(interest[index])
+            account.update_balance(amount)
+            posted[account.account_number] = amount
+            changed.append(account)
+
+        if save is not None and changed:
+            save(changed)
+
+        return posted
+
+    def post_table_interest(self, table: AccountTable, interest_rates=None) -> np.ndarray:
+        """
+        Posts interest to every row of a table with one vectorized update.
+
+        Args:
+            table (AccountTable): The accounts; the balance column is updated.
+            interest_rates (numpy.ndarray): Each row's own interest rate, used
+                for types whose rule is None (rows without one earn nothing).
+
+        Returns:
+            numpy.ndarray: The interest posted to each row.
+        """
+        rates = np.zeros(len(table))
+
+        for account_class, rule in self.rates.items():
+            rows = table.account_type == AccountTable.type_code(account_class)
+
+            if rule is not None:
+                rates[rows] = rule
+            elif interest_rates is not None:
+                rates[rows] = np.asarray(interest_rates, dtype=float)[rows]
+
+        interest = table.balance * rates
+        table.balance += interest
+        return interest
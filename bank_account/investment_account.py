@@ -7,13 +7,16 @@ __author__ = "Komalpreet Kaur"
 __version__ = "1.0.0"
 
 from bank_account.bank_account import BankAccount
+from bank_account.transaction_journal import TransactionJournal
 from patterns.strategy.management_fee_strategy import ManagementFeeStrategy
 from datetime import date
 
 class InvestmentAccount(BankAccount):
     """Represents an investment account with interest."""
 
-    def __init__(self, account_number, client_number, balance, date_created, management_fee):
+    __slots__ = ("__interest_rate", "__service_strategy", "management_fee")
+
+    def __init__(self, account_number, client_number, balance, date_created, management_fee, interest_rate=0.0):
         """
         Initialize InvestmentAccount.
 
@@ -21,8 +24,9 @@ class InvestmentAccount(BankAccount):
             account_number (int): Unique account number.
             client_number (int): Owner client number.
             balance (float): Initial balance.
+            date_created (date): Date when account was opened (optional).
+            management_fee (float): Management fee for the account.
             interest_rate (float): Annual interest rate as decimal (e.g., 0.02).
-            opened_date (date): Date when account was opened (optional).
         """
         super().__init__(account_number, client_number, balance, date_created)
         try:
@@ -30,7 +34,7 @@ class InvestmentAccount(BankAccount):
         except (ValueError, TypeError):
             self.__interest_rate = 0.0
 
-        self.__service_strategy = ManagementFeeStrategy(annual_fee_percent=0.001, opened_date=opened_date)
+        self.__service_strategy = ManagementFeeStrategy.shared(annual_fee_percent=0.001)
         self.management_fee = management_fee
         
     @property
@@ -40,8 +44,9 @@ class InvestmentAccount(BankAccount):
     
     def apply_interest(self):
         """Apply interest to the account balance using the configured interest rate."""
-        interest_amount = self.balance * self.__interest_rate
-        self.update_balance(interest_amount)
+        with self.lock:
+            interest_amount = self.balance * self.__interest_rate
+            self.update_balance(interest_amount)
 
     def debit(self, amount: float):
         """
@@ -55,9 +60,10 @@ class InvestmentAccount(BankAccount):
         """
         if amount <= 0:
             raise ValueError("Debit amount must be positive")
-        if amount > self.balance:
-            raise ValueError("Insufficient funds")
-        self.update_balance(-amount)
+        with self.lock:
+            if amount > self.balance:
+                raise ValueError("Insufficient funds")
+            self._change_balance(-amount, TransactionJournal.DEBIT)
         self._post_transaction_checks(amount)
 
     def account_info(self) -> str:
@@ -69,6 +75,11 @@ class InvestmentAccount(BankAccount):
             f"Interest Rate: {self.__interest_rate * 100:.2f%}"
         )
     
+    @property
+    def service_charge_strategy(self) -> ManagementFeeStrategy:
+        """Return the (shared) strategy used to calculate service charges."""
+        return self.__service_strategy
+
     def get_service_charges(self) -> float:
         """
         Delegates service charge calculation to ManagementFeeStrategy.
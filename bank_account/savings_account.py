@@ -9,6 +9,7 @@ __version__ = "1.0.0"
 
 from datetime import date
 from bank_account.bank_account import BankAccount
+from bank_account.transaction_journal import TransactionJournal
 from patterns.strategy.minimum_balance_strategy import MinimumBalanceStrategy
 
 class SavingsAccount(BankAccount):
@@ -17,6 +18,8 @@ class SavingsAccount(BankAccount):
     Service charge is delegated to MinimumBalanceStrategy.
     """
 
+    __slots__ = ("creation_date", "__minimum_balance", "__service_strategy")
+
     def __init__(self, account_number, client_number, balance, date_created, creation_date, minimum_balance):
         """
         Initialize SavingsAccount.
@@ -31,7 +34,7 @@ class SavingsAccount(BankAccount):
         super().__init__(account_number, client_number, balance, date_created)
         self.creation_date = creation_date
         self.__minimum_balance = float(minimum_balance)
-        self.__service_strategy = MinimumBalanceStrategy(minimum_balance=self.__minimum_balance, service_charge_premium=0.50)
+        self.__service_strategy = MinimumBalanceStrategy.shared(minimum_balance=self.__minimum_balance, service_charge_premium=0.50)
 
         self.creation_date = date_created
 
@@ -40,6 +43,11 @@ class SavingsAccount(BankAccount):
         """Return the minimum balance for this savings account."""
         return self.__minimum_balance
     
+    @property
+    def service_charge_strategy(self) -> MinimumBalanceStrategy:
+        """Return the (shared) strategy used to calculate service charges."""
+        return self.__service_strategy
+
     def get_service_charges(self) -> float:
         """
         Delegate service charge calculation to strategy.
@@ -67,9 +75,10 @@ class SavingsAccount(BankAccount):
         """
         if amount <= 0:
             raise ValueError("Debit amount must be positive.")
-        if amount > self.balance:
-            raise ValueError("Insufficient funds.")
-        self.update_balance(-amount)
+        with self.lock:
+            if amount > self.balance:
+                raise ValueError("Insufficient funds.")
+            self._change_balance(-amount, TransactionJournal.DEBIT)
         self._post_transaction_checks(amount)
 
     def account_info(self) -> str:
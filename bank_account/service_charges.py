@@ -0,0 +1,101 @@
+"""
+Description: Applies service charges to many accounts in one pass using the
+vectorized calculate_service_charges_batch() of each service charge strategy,
+either to an AccountTable or to BankAccount objects.
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import numpy as np
+
+from bank_account.account_table import AccountTable
+from bank_account.chequing_account import ChequingAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.investment_account import InvestmentAccount
+
+def _default_strategies() -> dict:
+    """
+    Returns the strategy each account type is created with, keyed by
+    account class, taken from a blank account so the charge settings stay
+    defined in one place (the account classes).
+    """
+    return {
+        ChequingAccount: ChequingAccount(0, 0, 0.0).service_charge_strategy,
+        SavingsAccount: SavingsAccount(0, 0, 0.0, None, None, 0.0).service_charge_strategy,
+        InvestmentAccount: InvestmentAccount(0, 0, 0.0, None, 0.0).service_charge_strategy,
+    }
+
+def calculate_table_service_charges(table: AccountTable) -> np.ndarray:
+    """
+    Calculates the service charge of every account in a table.
+
+    Args:
+        table (AccountTable): The accounts.
+
+    Returns:
+        numpy.ndarray: The service charge of each row.
+    """
+    charges = np.zeros(len(table))
+    strategies = _default_strategies()
+    minimum_balance = np.nan_to_num(table.minimum_balance)
+    overdraft_limit = np.nan_to_num(table.overdraft_limit)
+
+    for account_class, strategy in strategies.items():
+        rows = table.account_type == AccountTable.type_code(account_class)
+        if not rows.any():
+            continue
+
+        if account_class is InvestmentAccount:
+            params = {}
+        else:
+            params = {"minimum_balance": minimum_balance[rows]}
+            if account_class is ChequingAccount:
+                params["overdraft_limit"] = overdraft_limit[rows]
+
+        charges[rows] = strategy.calculate_service_charges_batch(table.balance[rows], params)
+
+    return charges
+
+def apply_table_service_charges(table: AccountTable) -> np.ndarray:
+    """
+    Deducts the service charge of every account from its balance in the table.
+
+    Args:
+        table (AccountTable): The accounts; the balance column is updated.
+
+    Returns:
+        numpy.ndarray: The service charge deducted from each row.
+    """
+    charges = calculate_table_service_charges(table)
+    table.balance -= charges
+    return charges
+
+def apply_service_charges(accounts) -> dict[int, float]:
+    """
+    Deducts service charges from BankAccount objects.
+
+    Accounts sharing a strategy instance (all accounts with the same charge
+    settings) are charged with one batch calculation.
+
+    Args:
+        accounts (Iterable[BankAccount]): The accounts to charge.
+
+    Returns:
+        dict[int, float]: The charge deducted, keyed by account number.
+    """
+    groups = {}
+    for account in accounts:
+        groups.setdefault(id(account.service_charge_strategy), []).append(account)
+
+    charged = {}
+    for group in groups.values():
+        strategy = group[0].service_charge_strategy
+        balances = np.fromiter((account.balance for account in group), dtype=float, count=len(group))
+        charges = strategy.calculate_service_charges_batch(balances)
+
+        for account, charge in zip(group, charges.tolist()):
+            account.update_balance(-charge)
+            charged[account.account_number] = charge
+
+    return charged
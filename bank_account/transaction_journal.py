@@ -0,0 +1,447 @@
+"""
+Description: Provides the TransactionJournal class, a binary append-only log of
+every balance change made to a BankAccount. Records are made durable with group
+commit (one fsync per batch) and replayed over the loaded accounts at startup.
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import os
+import struct
+import threading
+import zlib
+from typing import NamedTuple
+
+from utility.file_lock import file_lock
+
+class JournalRecord(NamedTuple):
+    """
+    One balance change read back from a journal.
+
+    Attributes:
+        sequence (int): Position of the change in the journal's history, starting at 1.
+        operation (int): TransactionJournal.DEPOSIT, WITHDRAW, DEBIT, UPDATE or CHECKPOINT.
+        account_number (int): The account that changed.
+        amount (float): The amount added to the balance (negative for withdrawals).
+        balance (float): The balance after the change.
+    """
+
+    sequence: int
+    operation: int
+    account_number: int
+    amount: float
+    balance: float
+
+class TransactionJournal:
+    """
+    An append-only file of fixed-size binary balance-change records.
+
+    The file starts with a header holding a magic number and the base
+    sequence, the sequence number of the last change removed by
+    truncate_through(). Records of sequence, operation, account number,
+    amount and resulting balance follow, each followed by a CRC-32 of its
+    bytes. A record torn by a crash fails its CRC; it and anything after it
+    are cut off when the journal is next opened.
+
+    append() returns once its record is on disk. Threads appending at the
+    same time share one write and one fsync: the first becomes the committer
+    and writes every record queued so far, the others wait for it. A
+    commit_delay makes the committer wait that long first, so more records
+    join each batch.
+
+    Several processes may append to one journal. Every write, recovery and
+    truncation holds the file's advisory lock (see utility.file_lock), and a
+    batch is numbered when it is written, following the last record in the
+    file, so sequence numbers stay unique and in file order.
+
+    Attributes:
+        DEPOSIT, WITHDRAW, DEBIT, UPDATE (int): Operation codes of balance changes.
+        CHECKPOINT (int): Operation code of a balance written to accounts.csv;
+            its amount is 0.0.
+    """
+
+    DEPOSIT = 1
+    WITHDRAW = 2
+    DEBIT = 3
+    UPDATE = 4
+    CHECKPOINT = 5
+
+    MAGIC = b"PXJ1"
+    _HEADER = struct.Struct("<4sQ")
+    _RECORD = struct.Struct("<QBqdd")
+    _CRC = struct.Struct("<I")
+    HEADER_SIZE = _HEADER.size
+    RECORD_SIZE = _RECORD.size + _CRC.size
+
+    def __init__(self, path: str, commit_delay: float = 0.0, base_sequence: int = 0):
+        """
+        Opens a journal, cutting off any torn records at its end.
+
+        Args:
+            path (str): Path of the journal file; it is created by the first append.
+            commit_delay (float): Seconds a committer waits for more records to join its batch.
+            base_sequence (int): The lowest sequence number already accounted for
+                elsewhere, e.g. by a snapshot; numbering never restarts below it.
+
+        Raises:
+            ValueError: If the file exists but is not a journal.
+        """
+        self.path = path
+        self.commit_delay = commit_delay
+        self._condition = threading.Condition()
+        self._pending = []
+        self._committing = False
+        self._file = None
+        self._file_size = None
+        self._file_lock = file_lock(path)
+        with self._file_lock:
+            self._base_sequence, last = self._recover()
+        self._base_sequence = max(self._base_sequence, base_sequence)
+        self._sequence = max(last, self._base_sequence)
+        self._durable_sequence = self._sequence
+
+    @property
+    def last_sequence(self) -> int:
+        """Return the sequence number of the last record this journal appended or found on opening."""
+        return self._sequence
+
+    @property
+    def durable_sequence(self) -> int:
+        """Return the sequence number of the last record known to be on disk."""
+        return self._durable_sequence
+
+    @property
+    def base_sequence(self) -> int:
+        """Return the sequence number of the last record removed by truncate_through()."""
+        return self._base_sequence
+
+    def append(self, operation: int, account_number: int, amount: float, balance: float) -> int:
+        """
+        Appends one balance change and waits until it is on disk.
+
+        Args:
+            operation (int): DEPOSIT, WITHDRAW, DEBIT, UPDATE or CHECKPOINT.
+            account_number (int): The account that changed.
+            amount (float): The amount added to the balance.
+            balance (float): The balance after the change.
+
+        Returns:
+            int: The sequence number of the record.
+        """
+        return self.append_many([(operation, account_number, amount, balance)])
+
+    def append_many(self, records) -> int:
+        """
+        Appends several balance changes in one batch and waits until they are on disk.
+
+        Args:
+            records (Iterable[tuple[int, int, float, float]]): (operation,
+                account_number, amount, balance) of each change, in order.
+
+        Returns:
+            int: The sequence number of the last record, or last_sequence if there are none.
+        """
+        # The committer stores each record's sequence number in its last slot
+        entries = [[operation, account_number, amount, balance, 0]
+                   for operation, account_number, amount, balance in records]
+        if not entries:
+            return self._sequence
+
+        with self._condition:
+            # A committer takes every pending entry, so these are written together
+            self._pending.extend(entries)
+
+            while not entries[-1][4]:
+                if self._committing:
+                    self._condition.wait()
+                else:
+                    self._commit_pending()
+
+        return entries[-1][4]
+
+    def records(self, after_sequence: int = 0):
+        """
+        Yields every complete, intact record in the journal file, in order.
+
+        Args:
+            after_sequence (int): Only yield records with a higher sequence number.
+
+        Yields:
+            JournalRecord: The next record.
+        """
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "rb") as file:
+            data = file.read()
+
+        for body in self._valid_records(data):
+            record = JournalRecord(*self._RECORD.unpack(body))
+            if record.sequence > after_sequence:
+                yield record
+
+    def balances(self, after_sequence: int = 0) -> dict[int, float]:
+        """
+        Returns the last journaled balance of each account.
+
+        Args:
+            after_sequence (int): Ignore records up to this sequence number.
+
+        Returns:
+            dict[int, float]: Balances keyed by account number.
+        """
+        balances = {}
+        for record in self.records(after_sequence):
+            balances[record.account_number] = record.balance
+        return balances
+
+    def replay(self, accounts, after_sequence: int = 0) -> int:
+        """
+        Sets each journaled account to the balance of its last record.
+
+        Records hold resulting balances, so replaying over accounts that
+        already include some of the changes gives the same result. Accounts
+        no longer in accounts are skipped.
+
+        Args:
+            accounts (MutableMapping[int, BankAccount]): The loaded accounts, keyed by account number.
+            after_sequence (int): Ignore records up to this sequence number.
+
+        Returns:
+            int: The number of accounts restored.
+        """
+        return restore_balances(accounts, self.balances(after_sequence))
+
+    def truncate_through(self, sequence: int) -> int:
+        """
+        Removes the records up to and including sequence, once they are
+        covered by a snapshot. The remaining records are copied to a new file
+        which atomically replaces the journal.
+
+        Args:
+            sequence (int): The last sequence number to remove.
+
+        Returns:
+            int: The number of records removed.
+        """
+        with self._condition:
+            while self._committing:
+                self._condition.wait()
+
+            with self._file_lock:
+                data = b""
+                if os.path.exists(self.path):
+                    with open(self.path, "rb") as file:
+                        data = file.read()
+
+                # Another process may have truncated the journal further already
+                if len(data) >= self.HEADER_SIZE:
+                    self._base_sequence = max(self._base_sequence, self._HEADER.unpack_from(data)[1])
+
+                sequence = min(sequence, self._durable_sequence)
+                if sequence <= self._base_sequence:
+                    return 0
+
+                kept = []
+                removed = 0
+                if data:
+                    for body in self._valid_records(data):
+                        if self._RECORD.unpack_from(body)[0] > sequence:
+                            kept.append(body + self._CRC.pack(zlib.crc32(body)))
+                        else:
+                            removed += 1
+
+                temp_path = self.path + ".tmp"
+                with open(temp_path, "wb") as file:
+                    file.write(self._HEADER.pack(self.MAGIC, sequence))
+                    file.write(b"".join(kept))
+                    file.flush()
+                    os.fsync(file.fileno())
+
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                os.replace(temp_path, self.path)
+                self._base_sequence = sequence
+
+                return removed
+
+    def close(self):
+        """Closes the journal file. A later append reopens it."""
+        with self._condition:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _valid_records(self, data: bytes):
+        """Yield the body of each record of data up to the first damaged one."""
+        if len(data) < self.HEADER_SIZE:
+            return
+        if data[:len(self.MAGIC)] != self.MAGIC:
+            raise ValueError(f"{self.path} is not a transaction journal.")
+
+        body_size = self._RECORD.size
+        for offset in range(self.HEADER_SIZE, len(data) - self.RECORD_SIZE + 1, self.RECORD_SIZE):
+            body = data[offset:offset + body_size]
+            (crc,) = self._CRC.unpack_from(data, offset + body_size)
+            if zlib.crc32(body) != crc:
+                return
+            yield body
+
+    def _recover(self) -> tuple[int, int]:
+        """Cut off torn or damaged records and return the base and last intact sequence numbers."""
+        if not os.path.exists(self.path):
+            return 0, 0
+
+        with open(self.path, "rb") as file:
+            data = file.read()
+
+        if len(data) < self.HEADER_SIZE:
+            if not self.MAGIC.startswith(data[:len(self.MAGIC)]):
+                raise ValueError(f"{self.path} is not a transaction journal.")
+            base = last = 0
+            valid_size = 0
+        else:
+            _, base = self._HEADER.unpack_from(data)
+            last = base
+            count = 0
+            for body in self._valid_records(data):
+                count += 1
+                last = self._RECORD.unpack_from(body)[0]
+            valid_size = self.HEADER_SIZE + count * self.RECORD_SIZE
+
+        if len(data) > valid_size:
+            with open(self.path, "r+b") as file:
+                file.truncate(valid_size)
+                file.flush()
+                os.fsync(file.fileno())
+
+        return base, last
+
+    def _commit_pending(self):
+        """Write and fsync every queued record; the caller holds the lock and it is released during I/O."""
+        self._committing = True
+        try:
+            if self.commit_delay:
+                self._condition.wait(self.commit_delay)
+
+            batch, self._pending = self._pending, []
+
+            self._condition.release()
+            try:
+                first = self._write(batch)
+            except BaseException:
+                self._condition.acquire()
+                self._pending[:0] = batch
+                raise
+            self._condition.acquire()
+
+            for offset, entry in enumerate(batch):
+                entry[4] = first + offset
+            self._sequence = self._durable_sequence = first + len(batch) - 1
+        finally:
+            self._committing = False
+            self._condition.notify_all()
+
+    def _write(self, batch: list) -> int:
+        """
+        Numbers the batch after the last record in the file, appends it and
+        forces it to disk, holding the file lock throughout.
+
+        Returns:
+            int: The sequence number given to the first record of the batch.
+        """
+        with self._file_lock:
+            sequence = max(self._last_sequence_on_disk(), self._sequence, self._base_sequence)
+            first = sequence + 1
+
+            records = []
+            for operation, account_number, amount, balance, _ in batch:
+                sequence += 1
+                body = self._RECORD.pack(sequence, operation, account_number, amount, balance)
+                records.append(body + self._CRC.pack(zlib.crc32(body)))
+
+            self._file.write(b"".join(records))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file_size = self._file.tell()
+
+        return first
+
+    def _last_sequence_on_disk(self) -> int:
+        """
+        Opens the current journal file for appending, if it is not open, and
+        returns the sequence number of its last record. The file is only read
+        when another process has changed it since this journal last wrote.
+        The caller holds the file lock.
+        """
+        if self._file is not None:
+            try:
+                replaced = os.fstat(self._file.fileno()).st_ino != os.stat(self.path).st_ino
+            except FileNotFoundError:
+                replaced = True
+            if replaced:
+                self._file.close()
+                self._file = None
+
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "ab")
+            self._file_size = None
+
+        size = self._file.seek(0, os.SEEK_END)
+        if size == self._file_size:
+            return self._sequence
+
+        if size == 0:
+            self._file.write(self._HEADER.pack(self.MAGIC, self._base_sequence))
+            return self._base_sequence
+
+        with open(self.path, "rb") as file:
+            header = file.read(self.HEADER_SIZE)
+            tail = b""
+            if size >= self.HEADER_SIZE + self.RECORD_SIZE:
+                file.seek(size - self.RECORD_SIZE)
+                tail = file.read(self.RECORD_SIZE)
+
+        base = last = 0
+        if len(header) == self.HEADER_SIZE and header[:len(self.MAGIC)] == self.MAGIC:
+            _, base = self._HEADER.unpack(header)
+            last = base
+        if tail:
+            body = tail[:self._RECORD.size]
+            if (size - self.HEADER_SIZE) % self.RECORD_SIZE or \
+                    zlib.crc32(body) != self._CRC.unpack_from(tail, self._RECORD.size)[0]:
+                # A writer died mid-record; cut the torn tail off before appending
+                base, last = self._recover()
+                self._file.seek(0, os.SEEK_END)
+            else:
+                last = self._RECORD.unpack_from(body)[0]
+
+        self._base_sequence = max(self._base_sequence, base)
+        return last
+
+def restore_balances(accounts, balances: dict) -> int:
+    """
+    Sets recovered balances on the loaded accounts, without recording or
+    notifying. Accounts missing from accounts are skipped.
+
+    Args:
+        accounts (MutableMapping[int, BankAccount]): The loaded accounts, keyed by account number.
+        balances (dict[int, float]): Recovered balances keyed by account number.
+
+    Returns:
+        int: The number of accounts restored.
+    """
+    restored = 0
+    for account_number, balance in balances.items():
+        account = accounts.get(account_number)
+        if account is None:
+            continue
+        account._restore_balance(balance)
+        accounts[account_number] = account
+        restored += 1
+    return restored
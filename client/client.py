@@ -6,24 +6,57 @@ Implements Observer interface so instances can receive notifications from BankAc
 __author__ = "Komalpreet Kaur"
 __version__ = "1.0.0"
 
-from email_validator import validate_email, EmailNotValidError
+from client.email_validation import validate_client_email
 from patterns.observer.observer import Observer
-from utility.file_utils import simulate_send_email
+from utility.file_utils import email_sink
 from datetime import datetime
+import time
+
+class _AlertSubject:
+    """Subject line of a notification email, formatted when the email is written."""
+
+    __slots__ = ("timestamp",)
+
+    def __init__(self, timestamp: float):
+        self.timestamp = timestamp
+
+    def __str__(self) -> str:
+        return f"ALERT: Unusual Activity: {datetime.fromtimestamp(self.timestamp):%Y-%m-%d %H:%M:%S}"
+
+class _NotificationBody:
+    """Body of a notification email, formatted when the email is written."""
+
+    __slots__ = ("client_number", "first_name", "last_name", "message")
+
+    def __init__(self, client_number: int, first_name: str, last_name: str, message):
+        self.client_number = client_number
+        self.first_name = first_name
+        self.last_name = last_name
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"Notification for {self.client_number}: {self.first_name} {self.last_name}: {self.message}"
 
 class Client(Observer):
     """
     Represents a banking client and acts as an Observer for bank accounts.
     """
 
-    def __init__(self, client_number: int, first_name: str, last_name: str, email_address: str):
+    __slots__ = ("__client_number", "__first_name", "__last_name",
+                 "__email_address", "__unvalidated_email_address", "__weakref__")
+
+    def __init__(self, client_number: int, first_name: str, last_name: str, email_address: str,
+                 defer_validation: bool = False):
         """Initialize a Client with validation.
 
         Args:
             client_number (int): Unique integer client number.
             first_name (str): Client's first name.
             last_name (str): Client's last name.
-            email_address (str): Client's email address.
+            email_address (str): Client's email address. Invalid addresses are
+                replaced by email@pixell-river.com.
+            defer_validation (bool): For trusted sources, validate the email
+                address when it is first read instead of now.
 
         Raises:
             ValueError: If client_number, first_name or last_name are invalid.
@@ -43,11 +76,12 @@ class Client(Observer):
         else:
             raise ValueError("Last name cannot be blank.")
 
-        try:
-            validate_email(email_address)
-            self.__email_address = email_address
-        except EmailNotValidError:
-            self.__email_address = "email@pixell-river.com"
+        if defer_validation:
+            self.__email_address = None
+            self.__unvalidated_email_address = email_address
+        else:
+            self.__email_address = validate_client_email(email_address)
+            self.__unvalidated_email_address = None
 
     @property
     def client_number(self) -> int:
@@ -66,7 +100,10 @@ class Client(Observer):
 
     @property
     def email_address(self) -> str:
-        """Return the email address."""
+        """Return the email address, validating it first if validation was deferred."""
+        if self.__email_address is None:
+            self.__email_address = validate_client_email(self.__unvalidated_email_address)
+            self.__unvalidated_email_address = None
         return self.__email_address
     
     def update(self, message: str):
@@ -74,13 +111,13 @@ class Client(Observer):
         Receive a notification and produce a simulated email.
 
         The subject and message formats follow the assignment specification.
+        Both are formatted by the email sink when the email is written.
 
         Args:
-            message (str): Message describing the event.
+            message (AccountEvent | str): The event being reported.
         """
-        subject = f"ALERT: Unusual Activity: {datetime.now():%Y-%m-%d %H:%M:%S}"
-        body = f"Notification for {self.client_number}: {self.first_name} {self.last_name}: {message}"
-        simulate_send_email(self.email_address, subject, body)
+        email_sink.send(self.email_address, _AlertSubject(time.time()),
+                        _NotificationBody(self.__client_number, self.__first_name, self.__last_name, message))
 
     def __str__(self) -> str:
         """Return a string representation of the client."""
@@ -88,5 +125,5 @@ class Client(Observer):
             f"Client Number: {self.__client_number}\n"
             f"First Name: {self.__first_name}\n"
             f"Last Name: {self.__last_name}\n"
-            f"Email Address: {self.__email_address}"
+            f"Email Address: {self.email_address}"
         )
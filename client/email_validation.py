@@ -0,0 +1,155 @@
+"""
+Description: Provides a memoizing email validation layer for Client objects.
+Address syntax results are cached per address and DNS deliverability results
+per domain, each in a bounded least-recently-used cache, so bulk loads do not
+validate the same address or look up the same domain more than once.
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import threading
+from collections import OrderedDict
+from email_validator import validate_email, EmailNotValidError
+
+FALLBACK_EMAIL_ADDRESS = "email@pixell-river.com"
+
+class EmailValidationCache:
+    """
+    Validates email addresses, remembering the results.
+
+    Attributes:
+        DEFAULT_MAX_SIZE (int): Default number of addresses (and domains) remembered.
+    """
+
+    DEFAULT_MAX_SIZE = 10000
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, check_deliverability: bool = True):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size (int): The most addresses, and the most domains, remembered at once.
+            check_deliverability (bool): Whether domains are checked with a DNS lookup.
+        """
+        self._max_size = max(int(max_size), 1)
+        self._check_deliverability = check_deliverability
+        self._addresses = OrderedDict()
+        self._domains = OrderedDict()
+        self._lock = threading.Lock()
+
+    def validate(self, email_address: str) -> str:
+        """
+        Returns the address if it is valid, otherwise the fallback address.
+
+        Args:
+            email_address (str): The address to validate.
+
+        Returns:
+            str: email_address, or FALLBACK_EMAIL_ADDRESS if it is invalid.
+        """
+        valid = self._lookup(self._addresses, email_address)
+
+        if valid is None:
+            valid = self._validate_address(email_address)
+            self._remember(self._addresses, email_address, valid)
+
+        return email_address if valid else FALLBACK_EMAIL_ADDRESS
+
+    def clear(self) -> None:
+        """Forgets every cached address and domain."""
+        with self._lock:
+            self._addresses.clear()
+            self._domains.clear()
+
+    def _validate_address(self, email_address: str) -> bool:
+        """
+        Checks an address's syntax, then its domain's deliverability.
+
+        Returns:
+            bool: True if the address is valid.
+        """
+        try:
+            result = validate_email(email_address, check_deliverability=False)
+        except EmailNotValidError:
+            return False
+
+        # Domain literals such as [127.0.0.1] have nothing to look up
+        if not self._check_deliverability or getattr(result, "domain_address", None) is not None:
+            return True
+
+        deliverable = self._lookup(self._domains, result.ascii_domain)
+
+        if deliverable is None:
+            deliverable = self._validate_domain(result.ascii_domain, result.domain)
+            self._remember(self._domains, result.ascii_domain, deliverable)
+
+        return deliverable
+
+    def _validate_domain(self, ascii_domain: str, domain: str) -> bool:
+        """
+        Checks that a domain can receive email.
+
+        Returns:
+            bool: True if the domain is deliverable.
+        """
+        # Imported lazily in the same way email_validator does, as it loads dns.resolver
+        from email_validator.deliverability import validate_email_deliverability
+
+        try:
+            validate_email_deliverability(ascii_domain, domain)
+        except EmailNotValidError:
+            return False
+        return True
+
+    def _lookup(self, cache: OrderedDict, key: str) -> bool | None:
+        """Return a cached result and mark it as recently used, or None."""
+        with self._lock:
+            if key not in cache:
+                return None
+            cache.move_to_end(key)
+            return cache[key]
+
+    def _remember(self, cache: OrderedDict, key: str, value: bool) -> None:
+        """Caches a result, evicting the least recently used one if full."""
+        with self._lock:
+            cache[key] = value
+            cache.move_to_end(key)
+
+            while len(cache) > self._max_size:
+                cache.popitem(last=False)
+
+# Cache shared by every Client
+email_validation_cache = EmailValidationCache()
+
+def validate_client_email(email_address: str) -> str:
+    """
+    Validates an address with the shared cache.
+
+    Args:
+        email_address (str): The address to validate.
+
+    Returns:
+        str: email_address, or FALLBACK_EMAIL_ADDRESS if it is invalid.
+    """
+    return email_validation_cache.validate(email_address)
+
+def validate_in_background(clients) -> threading.Thread:
+    """
+    Validates the email addresses of clients created with deferred
+    validation on a background thread.
+
+    Args:
+        clients (Iterable[Client]): The clients to validate.
+
+    Returns:
+        threading.Thread: The started (daemon) thread.
+    """
+    def run():
+        for client in list(clients):
+            # Reading the property runs any deferred validation
+            client.email_address
+
+    thread = threading.Thread(target=run, name="email-validation", daemon=True)
+    thread.start()
+    return thread
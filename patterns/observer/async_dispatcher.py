@@ -0,0 +1,173 @@
+import atexit
+import threading
+from collections import deque
+
+class AsyncDispatcher:
+    """
+    Delivers Subject notifications on a background worker thread.
+
+    Subject.notify() only places the notification on a bounded queue and
+    returns; the worker calls each observer's update method in the order the
+    notifications were queued. When the queue is full the back-pressure
+    policy decides what happens:
+
+        BLOCK:       the notifying thread waits for space.
+        DROP_OLDEST: the oldest queued notification is discarded.
+        COALESCE:    a notification identical to one already queued for the
+                     same subject is merged into it (at any queue size); if the
+                     queue is still full the notifying thread waits.
+
+    Attributes:
+        dropped (int): Notifications discarded or merged because of the policy.
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+
+    DEFAULT_MAXSIZE = 10000
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, policy: str = BLOCK):
+        """
+        Initialize the dispatcher. The worker thread starts with the first notification.
+
+        Args:
+            maxsize (int): Most notifications queued at once.
+            policy (str): BLOCK, DROP_OLDEST or COALESCE.
+
+        Raises:
+            ValueError: If the policy is unknown.
+        """
+        if policy not in (self.BLOCK, self.DROP_OLDEST, self.COALESCE):
+            raise ValueError(f"Unknown back-pressure policy: {policy}")
+
+        self.maxsize = max(int(maxsize), 1)
+        self.policy = policy
+        self.dropped = 0
+        self._queue = deque()
+        self._pending = {}
+        self._in_progress = 0
+        self._condition = threading.Condition()
+        self._worker = None
+        self._stopping = False
+        atexit.register(self.drain)
+
+    def dispatch(self, subject, observers, message):
+        """
+        Queue a notification for delivery.
+
+        Args:
+            subject: The Subject sending the notification.
+            observers (tuple): References to the observers to notify.
+            message: The notification.
+        """
+        key = self._coalesce_key(subject, message)
+
+        with self._condition:
+            if key is not None and key in self._pending:
+                self.dropped += 1
+                return
+
+            while len(self._queue) >= self.maxsize:
+                if self.policy == self.DROP_OLDEST:
+                    self._forget(self._queue.popleft())
+                    self.dropped += 1
+                else:
+                    self._condition.wait()
+
+            self._queue.append((key, subject, observers, message))
+            if key is not None:
+                self._pending[key] = True
+
+            self._start_worker()
+            self._condition.notify_all()
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Wait until every queued notification has been delivered.
+
+        Args:
+            timeout (float): Longest time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            bool: True if the queue was emptied, False if the timeout expired.
+        """
+        if threading.current_thread() is self._worker:
+            return False
+
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queue and not self._in_progress, timeout)
+
+    def drain(self, timeout: float = None) -> bool:
+        """
+        Deliver every queued notification, then stop the worker thread. A
+        later notification starts a new worker.
+
+        Args:
+            timeout (float): Longest time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            bool: True if every notification was delivered.
+        """
+        delivered = self.flush(timeout)
+
+        with self._condition:
+            worker = self._worker
+            self._stopping = True
+            self._condition.notify_all()
+
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(timeout)
+
+        return delivered
+
+    def _coalesce_key(self, subject, message):
+        """Return the key identical notifications share, or None if they are not coalesced."""
+        if self.policy != self.COALESCE:
+            return None
+        try:
+            hash(message)
+        except TypeError:
+            return None
+        return (id(subject), message)
+
+    def _forget(self, item):
+        """Remove a dequeued notification from the coalescing index."""
+        key = item[0]
+        if key is not None:
+            self._pending.pop(key, None)
+
+    def _start_worker(self):
+        """Start the worker thread if it is not running; the caller holds the lock."""
+        if self._worker is None:
+            self._stopping = False
+            self._worker = threading.Thread(target=self._run, name="notification-dispatcher", daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        """Worker loop: deliver notifications until drained."""
+        from patterns.observer.subject import Subject
+
+        while True:
+            with self._condition:
+                while not self._queue and not self._stopping:
+                    self._condition.wait()
+
+                if not self._queue:
+                    self._worker = None
+                    self._condition.notify_all()
+                    return
+
+                item = self._queue.popleft()
+                self._forget(item)
+                self._in_progress += 1
+                self._condition.notify_all()
+
+            _, subject, observers, message = item
+            try:
+                Subject.deliver(observers, message)
+            finally:
+                with self._condition:
+                    self._in_progress -= 1
+                    self._condition.notify_all()
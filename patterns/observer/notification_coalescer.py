@@ -0,0 +1,213 @@
+import atexit
+import threading
+import time
+from collections import OrderedDict
+
+from patterns.observer.subject import Subject
+
+class NotificationDigest:
+    """
+    Stands in for notifications held back by a NotificationCoalescer.
+
+    Attributes:
+        message: The latest notification held back.
+        count (int): Number of notifications held back.
+        window (float): Length of the coalescing window in seconds.
+    """
+
+    __slots__ = ("message", "count", "window")
+
+    def __init__(self, message, count: int, window: float):
+        self.message = message
+        self.count = count
+        self.window = window
+
+    @property
+    def kind(self) -> str:
+        """Return the kind of the notifications held back."""
+        return NotificationCoalescer.kind_of(self.message)
+
+    def __str__(self) -> str:
+        """Return the digest text."""
+        plural = "s" if self.count != 1 else ""
+        return f"{self.message} (repeated {self.count} more time{plural} in {self.window:g}s)"
+
+class NotificationCoalescer:
+    """
+    Merges repeated notifications before they reach the observers.
+
+    The first notification of a kind for an account is delivered at once and
+    opens a window of window seconds. Later notifications of the same kind
+    for the same account within the window are held back and counted; when
+    the window closes, one digest carrying the count and the latest message
+    is delivered in their place.
+
+    A coalescer is installed like any dispatcher (Subject.dispatcher) and
+    passes what it delivers to the downstream dispatcher, for example an
+    AsyncDispatcher, or directly to the observers when there is none.
+
+    Attributes:
+        suppressed (int): Notifications merged into digests so far.
+    """
+
+    DEFAULT_WINDOW = 60.0
+
+    def __init__(self, window: float = DEFAULT_WINDOW, downstream=None, clock=time.monotonic):
+        """
+        Initialize the coalescer. The thread that closes windows starts with the first notification.
+
+        Args:
+            window (float): Length of a coalescing window in seconds.
+            downstream: Dispatcher receiving the delivered notifications (optional).
+            clock (Callable[[], float]): Source of the current time in seconds.
+
+        Raises:
+            ValueError: If the window is negative.
+        """
+        if window < 0:
+            raise ValueError("Coalescing window cannot be negative.")
+
+        self.window = window
+        self.downstream = downstream
+        self.clock = clock
+        self.suppressed = 0
+        self._windows = OrderedDict()
+        self._condition = threading.Condition(threading.RLock())
+        self._timer = None
+        atexit.register(self.flush)
+
+    @staticmethod
+    def kind_of(message) -> str:
+        """
+        Return the kind of a notification: its kind attribute, such as
+        AccountEvent.kind, or for plain text the part before its first amount,
+        e.g. "Low balance warning" for "Low balance warning $10.00: on account 1.".
+
+        Args:
+            message: The notification.
+
+        Returns:
+            str: The notification kind.
+        """
+        kind = getattr(message, "kind", None)
+        if kind is not None:
+            return kind
+        return str(message).split("$", 1)[0].strip()
+
+    def dispatch(self, subject, observers, message):
+        """
+        Deliver a notification, or hold it back if one of the same kind for
+        the same account was delivered within the window.
+
+        Args:
+            subject: The Subject sending the notification.
+            observers (tuple): References to the observers to notify.
+            message: The notification.
+        """
+        key = (id(subject), self.kind_of(message))
+
+        with self._condition:
+            now = self.clock()
+            entry = self._windows.get(key)
+
+            if entry is not None and now - entry[0] < self.window:
+                entry[1:] = [subject, observers, message, entry[4] + 1]
+                self.suppressed += 1
+                return
+
+            deliveries = self._close(key) if entry is not None else []
+            deliveries.append((subject, observers, message))
+            self._windows[key] = [now, subject, observers, message, 0]
+
+            if len(self._windows) == 1:
+                self._start_timer()
+
+        # Observers and the downstream dispatcher run without the lock held
+        self._forward_all(deliveries)
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Close every open window, delivering its digest now.
+
+        Args:
+            timeout (float): Passed to the downstream dispatcher's flush().
+
+        Returns:
+            bool: The downstream dispatcher's result, or True without one.
+        """
+        with self._condition:
+            deliveries = [delivery for key in list(self._windows) for delivery in self._close(key)]
+        self._forward_all(deliveries)
+
+        if self.downstream is not None:
+            return self.downstream.flush(timeout)
+        return True
+
+    def drain(self, timeout: float = None) -> bool:
+        """
+        Close every open window, then drain the downstream dispatcher.
+
+        Args:
+            timeout (float): Passed to the downstream dispatcher's drain().
+
+        Returns:
+            bool: The downstream dispatcher's result, or True without one.
+        """
+        self.flush(timeout)
+
+        if self.downstream is not None:
+            return self.downstream.drain(timeout)
+        return True
+
+    def _forward_all(self, deliveries):
+        """Hand (subject, observers, message) notifications to the downstream dispatcher or the observers."""
+        for subject, observers, message in deliveries:
+            if self.downstream is not None:
+                self.downstream.dispatch(subject, observers, message)
+            else:
+                Subject.deliver(observers, message)
+
+    def _close(self, key) -> list:
+        """
+        Remove a window; the caller holds the lock and forwards what is returned after releasing it.
+
+        Returns:
+            list: The window's digest as a (subject, observers, message) delivery,
+            if notifications were held, or an empty list.
+        """
+        _, subject, observers, message, count = self._windows.pop(key)
+        if count:
+            return [(subject, observers, NotificationDigest(message, count, self.window))]
+        return []
+
+    def _start_timer(self):
+        """Start the thread that closes expired windows; the caller holds the lock."""
+        if self._timer is None:
+            self._timer = threading.Thread(target=self._run_timer, name="notification-coalescer", daemon=True)
+            self._timer.start()
+        self._condition.notify_all()
+
+    def _run_timer(self):
+        """
+        Close each window once it expires, delivering digests of held
+        notifications. Windows are kept in the order they opened, so only the
+        oldest ones need checking. Digests are delivered without the lock held.
+        """
+        while True:
+            deliveries = []
+            with self._condition:
+                while not deliveries:
+                    now = self.clock()
+                    expires = None
+
+                    while self._windows:
+                        key, entry = next(iter(self._windows.items()))
+                        if entry[0] + self.window > now:
+                            expires = entry[0] + self.window
+                            break
+                        deliveries.extend(self._close(key))
+
+                    if not deliveries:
+                        self._condition.wait(None if expires is None else expires - now)
+
+            self._forward_all(deliveries)
@@ -9,12 +9,14 @@ class Observer(ABC):
         update(message): Called by Subject to notify the observer.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def update(self, message: str):
         """
         Handle notification from subject.
         
         Args:
-            message (str): formatted message describing the event.
+            message: the event, e.g. an AccountEvent; str(message) gives its text.
         """
         raise NotImplementedError
\ No newline at end of file
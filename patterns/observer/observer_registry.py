@@ -0,0 +1,119 @@
+import weakref
+
+class _StrongRef:
+    """A reference with the weakref.ref call interface that keeps its observer alive."""
+
+    __slots__ = ("_observer",)
+
+    def __init__(self, observer):
+        self._observer = observer
+
+    def __call__(self):
+        return self._observer
+
+class ObserverRegistry:
+    """
+    Holds the observers of a Subject in the order they were attached.
+
+    Observers are keyed by identity, so adding, removing and membership
+    checks take constant time whatever the observers' own equality. Each
+    observer is held either strongly or through a weak reference; an
+    observer held weakly is dropped once nothing else refers to it.
+
+    notify() uses snapshot(), an immutable tuple of references that is only
+    rebuilt after the registry changes, so notifying does not copy the
+    observers and a change during delivery does not affect the delivery in
+    progress.
+    """
+
+    __slots__ = ("_entries", "_snapshot")
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._entries = {}
+        self._snapshot = ()
+
+    def add(self, observer, weak: bool = False) -> bool:
+        """
+        Add an observer if it is not already registered.
+
+        Args:
+            observer: An object implementing the Observer interface.
+            weak (bool): Hold the observer through a weak reference.
+
+        Returns:
+            bool: True if the observer was added.
+
+        Raises:
+            TypeError: If weak is True and the observer cannot be weakly referenced.
+        """
+        if observer in self:
+            return False
+
+        self._entries.pop(id(observer), None)
+        self._entries[id(observer)] = weakref.ref(observer) if weak else _StrongRef(observer)
+        self._snapshot = None
+        return True
+
+    def discard(self, observer) -> bool:
+        """
+        Remove an observer if it is registered.
+
+        Args:
+            observer: The observer to remove.
+
+        Returns:
+            bool: True if the observer was removed.
+        """
+        if observer not in self:
+            return False
+
+        del self._entries[id(observer)]
+        self._snapshot = None
+        return True
+
+    def snapshot(self) -> tuple:
+        """
+        Return the registered observers as a tuple of references; call a
+        reference to get its observer, or None if a weakly held observer is gone.
+
+        Returns:
+            tuple: The references, in the order the observers were added.
+        """
+        if self._snapshot is None:
+            self._entries = {key: ref for key, ref in self._entries.items() if ref() is not None}
+            self._snapshot = tuple(self._entries.values())
+        return self._snapshot
+
+    @staticmethod
+    def resolve(references):
+        """
+        Yield the observers that are still alive.
+
+        Args:
+            references (Iterable): References returned by snapshot().
+        """
+        for reference in references:
+            observer = reference()
+            if observer is not None:
+                yield observer
+
+    def __contains__(self, observer) -> bool:
+        reference = self._entries.get(id(observer))
+        return reference is not None and reference() is observer
+
+    def __iter__(self):
+        return self.resolve(self.snapshot())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        if any(reference() is not None for reference in self._entries.values()):
+            return True
+
+        # Only released weak references are left
+        if self._entries:
+            self._entries.clear()
+            self._snapshot = ()
+        return False
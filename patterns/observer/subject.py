@@ -1,26 +1,45 @@
+from patterns.observer.observer_registry import ObserverRegistry
+
 class Subject:
     """
     Subject base class that maintains and notifies observers.
 
      Attributes:
-        _observers (list): Internal list of attached observers.
+        _observers (ObserverRegistry): Internal registry of attached observers,
+            or None until the first observer is attached.
+        _class_observers (dict[type, ObserverRegistry]): Observers subscribed
+            with subscribe_all(), keyed by the class they subscribed to.
+        dispatcher: Delivers notifications instead of notify() calling the
+            observers itself, e.g. an AsyncDispatcher. Set it on Subject or on
+            a subclass; None (the default) delivers synchronously.
     """
 
+    __slots__ = ("_observers",)
+
+    _class_observers = {}
+
+    dispatcher = None
+
     def __init__(self):
         """
-        Initialize the Subject with an empty observer list.
+        Initialize the Subject without an observer registry; the registry is
+        created when the first observer is attached.
         """
-        self._observers = []
+        self._observers = None
 
-    def attach(self, observer):
+    def attach(self, observer, weak: bool = False):
         """
         Attach an observer if it is not already attached.
 
         Args:
             observer: An object implementing the Observer interface.
+            weak (bool): Hold only a weak reference, so the observer is
+                detached automatically once nothing else refers to it.
         """
-        if observer not in self._observers:
-            self._observers.append(observer)
+        if self._observers is None:
+            self._observers = ObserverRegistry()
+
+        self._observers.add(observer, weak)
 
     def detach(self, observer):
         """
@@ -29,18 +48,95 @@ class Subject:
         Args:
             observer: The observer to remove.
         """
-        if observer in self._observers:
-            self._observers.remove(observer)
-    
+        if self._observers:
+            self._observers.discard(observer)
+
+    @classmethod
+    def subscribe_all(cls, observer, weak: bool = False):
+        """
+        Subscribe an observer to every instance of this class and its
+        subclasses, without attaching it to each one. An observer subscribed
+        this way should not also be attached to an instance, or it receives
+        that instance's notifications twice.
+
+        Args:
+            observer: An object implementing the Observer interface.
+            weak (bool): Hold only a weak reference to the observer.
+        """
+        registry = Subject._class_observers.get(cls)
+        if registry is None:
+            registry = Subject._class_observers[cls] = ObserverRegistry()
+
+        registry.add(observer, weak)
+
+    @classmethod
+    def unsubscribe_all(cls, observer):
+        """
+        Remove an observer subscribed with subscribe_all() on this class.
+
+        Args:
+            observer: The observer to remove.
+        """
+        registry = Subject._class_observers.get(cls)
+        if registry is not None:
+            registry.discard(observer)
+            if not registry:
+                del Subject._class_observers[cls]
+
+    def has_observers(self) -> bool:
+        """
+        Return True if a notification from this subject could reach an observer.
+
+        Returns:
+            bool: Whether any observer is attached or subscribed to its class.
+        """
+        if self._observers:
+            return True
+        if Subject._class_observers:
+            return any(cls in Subject._class_observers for cls in type(self).__mro__)
+        return False
+
+    def _observer_snapshot(self) -> tuple:
+        """Return references to every observer of this subject: attached ones, then class subscribers."""
+        references = self._observers.snapshot() if self._observers else ()
+
+        if Subject._class_observers:
+            for cls in type(self).__mro__:
+                registry = Subject._class_observers.get(cls)
+                if registry is not None:
+                    references += registry.snapshot()
+
+        return references
+
     def notify(self, message: str):
         """
         Notify all attached observers by calling their update method.
         Exceptions from one observer are caught so others still receive notifications.
+        When a dispatcher is set the notification is handed to it, and this
+        method returns as soon as the dispatcher has queued it.
+        Args:
+            message (str): A formatted message describing the event.
+        """
+        references = self._observer_snapshot()
+        if not references:
+            return
+
+        if self.dispatcher is not None:
+            self.dispatcher.dispatch(self, references, message)
+        else:
+            Subject.deliver(references, message)
+
+    @staticmethod
+    def deliver(observers, message):
+        """
+        Call update on each observer, ignoring exceptions raised by any of them.
+
         Args:
+            observers (tuple): Observer references, as returned by ObserverRegistry.snapshot().
             message (str): A formatted message describing the event.
         """
-        for observer in list(self._observers):
+        for observer in ObserverRegistry.resolve(observers):
             try:
                 observer.update(message)
             except Exception:
-                pass
\ No newline at end of file
+                pass
@@ -1,3 +1,4 @@
+import numpy as np
 from .service_charge_strategy import ServiceChargeStrategy
 from datetime import date, timedelta
 
@@ -35,3 +36,33 @@ class ManagementFeeStrategy(ServiceChargeStrategy):
             fee = balance * self._annual_fee_percent
             charge += fee
         return round(max(charge, 0.0), 2)
+
+    def calculate_service_charges_batch(self, balances, params: dict = None):
+        """
+        Calculate management fees for many balances with the same rules as
+        calculate_service_charges().
+
+        Args:
+            balances (numpy.ndarray): Account balances.
+            params (dict): Optional 'annual_fee_percent' value (scalar or array)
+                overriding this strategy's.
+
+        Returns:
+            numpy.ndarray: The service charge amounts, rounded to cents.
+        """
+        params = params or {}
+        balances = np.asarray(balances, dtype=float)
+        annual_fee_percent = params.get("annual_fee_percent", self._annual_fee_percent)
+
+        charges = self.BASE_SERVICE_CHARGE + np.where(balances > 0, balances * annual_fee_percent, 0.0)
+        charges = np.maximum(charges, 0.0)
+        rounded = np.round(charges, 2)
+
+        # np.round scales by 100 before rounding, which can differ from round()
+        # for values within floating-point error of a half cent; redo those exactly
+        scaled = charges * 100
+        near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+        for index in np.flatnonzero(near_half):
+            rounded[index] = round(float(charges[index]), 2)
+
+        return rounded
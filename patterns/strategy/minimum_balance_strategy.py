@@ -1,3 +1,4 @@
+import numpy as np
 from .service_charge_strategy import ServiceChargeStrategy
 
 class MinimumBalanceStrategy(ServiceChargeStrategy):
@@ -28,4 +29,26 @@ class MinimumBalanceStrategy(ServiceChargeStrategy):
         """
         if account.balance < self._minimum_balance:
             return self._service_charge_premium * 2  
-        return self._service_charge_premium       
\ No newline at end of file
+        return self._service_charge_premium
+
+    def calculate_service_charges_batch(self, balances, params: dict = None):
+        """
+        Calculate service charges for many balances with the same rules as
+        calculate_service_charges().
+
+        Args:
+            balances (numpy.ndarray): Account balances.
+            params (dict): Optional 'minimum_balance' and 'service_charge_premium'
+                values (scalars or arrays) overriding this strategy's.
+
+        Returns:
+            numpy.ndarray: Calculated service charges.
+        """
+        params = params or {}
+        balances = np.asarray(balances, dtype=float)
+        minimum_balance = params.get("minimum_balance", self._minimum_balance)
+        premium = params.get("service_charge_premium", self._service_charge_premium)
+
+        return np.where(balances < minimum_balance,
+                        np.multiply(premium, 2),
+                        np.multiply(premium, 1)).astype(float)
@@ -1,3 +1,4 @@
+import numpy as np
 from .service_charge_strategy import ServiceChargeStrategy
 
 class OverdraftStrategy(ServiceChargeStrategy):
@@ -37,3 +38,28 @@ class OverdraftStrategy(ServiceChargeStrategy):
         elif balance < self.minimum_balance:
             return self.base_service_charge * 2
         return self.base_service_charge
+
+    def calculate_service_charges_batch(self, balances, params: dict = None):
+        """
+        Calculate service charges for many balances with the same rules as
+        calculate_service_charges().
+
+        Args:
+            balances (numpy.ndarray): Account balances.
+            params (dict): Optional 'minimum_balance', 'base_service_charge' and
+                'overdraft_limit' values (scalars or arrays) overriding this strategy's.
+
+        Returns:
+            numpy.ndarray: Calculated service charges.
+        """
+        params = params or {}
+        balances = np.asarray(balances, dtype=float)
+        minimum_balance = params.get("minimum_balance", self.minimum_balance)
+        base_service_charge = params.get("base_service_charge", self.base_service_charge)
+        overdraft_limit = params.get("overdraft_limit", self.overdraft_limit)
+
+        return np.select(
+            [balances < overdraft_limit, balances < minimum_balance],
+            [np.multiply(base_service_charge, 3), np.multiply(base_service_charge, 2)],
+            default=base_service_charge
+        ).astype(float)
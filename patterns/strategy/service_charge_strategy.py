@@ -9,6 +9,31 @@ class ServiceChargeStrategy(ABC):
     """
     BASE_SERVICE_CHARGE = 0.50
 
+    # Shared instances, keyed by strategy class and constructor arguments
+    _shared_instances = {}
+
+    @classmethod
+    def shared(cls, *args, **kwargs):
+        """
+        Return the one shared instance of this strategy for the given arguments,
+        creating it on first use. Accounts with the same parameters then share a
+        single strategy object, so shared instances must not be modified.
+
+        Args:
+            *args: Positional arguments for the strategy's constructor.
+            **kwargs: Keyword arguments for the strategy's constructor.
+
+        Returns:
+            ServiceChargeStrategy: The shared strategy instance.
+        """
+        key = (cls, args, tuple(sorted(kwargs.items())))
+        strategy = ServiceChargeStrategy._shared_instances.get(key)
+
+        if strategy is None:
+            strategy = ServiceChargeStrategy._shared_instances.setdefault(key, cls(*args, **kwargs))
+
+        return strategy
+
     @abstractmethod
     def calculate_service_charges(self, account) -> float:
         """
@@ -20,4 +45,21 @@ class ServiceChargeStrategy(ABC):
         Returns:
             float: service charge amount (>= 0)
         """
+        raise NotImplementedError
+
+    @abstractmethod
+    def calculate_service_charges_batch(self, balances, params: dict = None):
+        """
+        Calculate service charges for many balances in one vectorized call.
+        The result for each balance is identical to the scalar calculation.
+
+        Args:
+            balances (numpy.ndarray): Account balances.
+            params (dict): Strategy parameters to override, by constructor argument
+                name. Each value is a scalar or an array aligned with balances.
+                Parameters not given use this strategy's own values.
+
+        Returns:
+            numpy.ndarray: service charge amounts, aligned with balances.
+        """
         raise NotImplementedError
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""
+Description: Unit tests for the AccountEditSession class.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_account_edit_session.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from bank_account.account_edit_session import AccountEditSession
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.transaction_journal import TransactionJournal
+
+
+class TestAccountEditSession(unittest.TestCase):
+    """Test cases for AccountEditSession."""
+
+    def setUp(self):
+        self.account = ChequingAccount(20001, 1001, 100.0)
+        self.session = AccountEditSession(self.account)
+
+    def test_transactions_recorded_not_applied(self):
+        """Pending transactions change the projected balance but not the account."""
+        self.session.deposit(50.0)
+        self.session.withdraw(120.0)
+
+        self.assertEqual(100.0, self.account.balance)
+        self.assertEqual(30.0, self.session.balance)
+        self.assertEqual(-70.0, self.session.delta)
+        self.assertEqual([(TransactionJournal.DEPOSIT, 50.0), (TransactionJournal.WITHDRAW, 120.0)],
+                         self.session.pending)
+
+    def test_invalid_transactions_rejected(self):
+        """Invalid amounts and withdrawals beyond the projected balance are rejected."""
+        self.session.withdraw(60.0)
+        for record, amount in ((self.session.deposit, -1), (self.session.deposit, "5"),
+                               (self.session.withdraw, 50.0)):
+            with self.assertRaises(ValueError):
+                record(amount)
+        self.assertEqual(1, len(self.session.pending))
+
+    def test_commit_applies_in_order(self):
+        """Committing applies every transaction to the account and clears the session."""
+        self.session.withdraw(100.0)
+        self.session.deposit(25.0)
+
+        self.assertEqual(2, self.session.commit())
+        self.assertEqual(25.0, self.account.balance)
+        self.assertEqual([], self.session.pending)
+
+    def test_commit_journals_one_batch(self):
+        """Committed transactions are journaled together and checked for notifications once."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        journal = TransactionJournal(os.path.join(directory.name, "accounts.journal"))
+        self.addCleanup(journal.close)
+        self.session.deposit(50.0)
+        self.session.withdraw(120.0)
+
+        with patch.object(BankAccount, "journal", journal), \
+                patch("bank_account.transaction_journal.os.fsync") as fsync, \
+                patch.object(ChequingAccount, "_post_transaction_checks") as checks:
+            self.session.commit()
+
+        self.assertEqual(1, fsync.call_count)
+        checks.assert_called_once_with(120.0)
+        self.assertEqual([(TransactionJournal.DEPOSIT, 50.0, 150.0), (TransactionJournal.WITHDRAW, -120.0, 30.0)],
+                         [(record.operation, record.amount, record.balance) for record in journal.records()])
+
+    def test_commit_is_all_or_nothing(self):
+        """A withdrawal the current balance no longer covers stops the whole commit."""
+        self.session.deposit(10.0)
+        self.session.withdraw(100.0)
+        self.account.withdraw(50.0)
+
+        with self.assertRaises(ValueError):
+            self.session.commit()
+        self.assertEqual(50.0, self.account.balance)
+        self.assertEqual(2, len(self.session.pending))
+
+    def test_rollback_on_error(self):
+        """Leaving the with block with an exception discards the transactions."""
+        with self.assertRaises(RuntimeError):
+            with AccountEditSession(self.account) as session:
+                session.deposit(10.0)
+                raise RuntimeError()
+
+        self.assertEqual(100.0, self.account.balance)
+        self.assertEqual([], session.pending)
+
+
+if __name__ == "__main__":
+    unittest.main()
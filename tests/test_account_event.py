@@ -0,0 +1,65 @@
+"""
+Description: Unit tests for AccountEvent notifications.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_account_event.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import unittest
+from unittest.mock import patch
+from bank_account.account_event import AccountEvent
+from bank_account.chequing_account import ChequingAccount
+from client.client import Client
+
+
+class TestAccountEvent(unittest.TestCase):
+    """Test cases for AccountEvent."""
+
+    def test_event_text(self):
+        """Events read like the messages observers received before."""
+        low = AccountEvent(AccountEvent.LOW_BALANCE, 40075, 90.0, 10.0)
+        large = AccountEvent(AccountEvent.LARGE_TRANSACTION, 40075, 15000.0, 15100.0)
+        self.assertEqual("Low balance warning $10.00: on account 40075.", str(low))
+        self.assertEqual("Large transaction $15000.00: on account 40075.", str(large))
+
+    def test_observer_receives_events(self):
+        """An attached observer receives the raw event values."""
+        account = ChequingAccount(40075, 2828, 100.0)
+        client = Client(2828, "Jane", "Doe", "jane@pixell.com", defer_validation=True)
+        account.attach(client)
+
+        with patch.object(Client, "update") as update:
+            account.withdraw(90)
+
+        update.assert_called_once_with(AccountEvent(AccountEvent.LOW_BALANCE, 40075, 90.0, 10.0))
+
+    def test_no_observers_no_notification(self):
+        """Without observers no event is built or sent."""
+        account = ChequingAccount(40075, 2828, 100.0)
+
+        with patch.object(ChequingAccount, "notify") as notify:
+            account.deposit(15000)
+            account.withdraw(15090)
+
+        notify.assert_not_called()
+
+    def test_client_email_formatted_at_sink(self):
+        """Client.update passes unformatted parts that render the usual email text."""
+        client = Client(2828, "Jane", "Doe", "jane@pixell.com", defer_validation=True)
+        event = AccountEvent(AccountEvent.LARGE_TRANSACTION, 40075, 15000.0, 15100.0)
+
+        with patch("client.client.email_sink") as sink:
+            client.update(event)
+
+        email_address, subject, body = sink.send.call_args.args
+        self.assertEqual(client.email_address, email_address)
+        self.assertTrue(str(subject).startswith("ALERT: Unusual Activity: "))
+        self.assertEqual("Notification for 2828: Jane Doe: Large transaction $15000.00: on account 40075.",
+                         str(body))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Description: Unit tests for the AccountFile class and its conversion tools.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_account_file.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import csv
+import math
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from user_interface.account_file import AccountFile, binary_to_csv, csv_to_binary
+
+ACCOUNTS_CSV = (
+    "account_number,client_number,balance,date_created,account_type,"
+    "overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+    "20001,1001,15000.0,2023-01-10,ChequingAccount,-50.0,0.035,Null,Null\n"
+    "20002,1001,301.54,2023-01-15,SavingsAccount,Null,Null,50.0,Null\n"
+    "20003,1002,1200.87,2023-02-01,InvestmentAccount,Null,Null,Null,2.55\n"
+    "20004,1002,12.5,2023-02-30,ChequingAccount,-100.0,0.035,Null,Null\n"
+    "20005,1002,12.5,2023-02-01,SavingsAccount,Null,Null,Null,Null\n"
+    "20006,1002,12.5,2023-02-01,LoanAccount,Null,Null,Null,Null\n"
+)
+
+
+class TestAccountFile(unittest.TestCase):
+    """Test cases for AccountFile."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.directory.name, "accounts.csv")
+        self.path = os.path.join(self.directory.name, "accounts.npy")
+
+        with open(self.csv_path, "w", newline="") as file:
+            file.write(ACCOUNTS_CSV)
+
+        patcher = patch("user_interface.account_file.logging.error")
+        self.log_error = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_invalid_rows_not_converted(self):
+        """Rows with a bad date, a missing required value or an unknown type are left out and logged."""
+        self.assertEqual(3, csv_to_binary(self.csv_path, self.path))
+        self.assertEqual(3, self.log_error.call_count)
+
+        records = AccountFile(self.path).records()
+        self.assertEqual([20001, 20002, 20003], records["account_number"].tolist())
+        self.assertEqual([0, 1, 2], records["account_type"].tolist())
+        self.assertEqual(50.0, records["minimum_balance"][1])
+        self.assertTrue(math.isnan(records["management_fee"][0]))
+
+    def test_round_trip(self):
+        """Converting to binary and back reproduces the valid rows."""
+        csv_to_binary(self.csv_path, self.path)
+        out_path = os.path.join(self.directory.name, "out.csv")
+
+        self.assertEqual(3, binary_to_csv(self.path, out_path))
+        with open(out_path, newline="") as file:
+            written = list(csv.DictReader(file))
+        with open(self.csv_path, newline="") as file:
+            original = list(csv.DictReader(file))[:3]
+
+        self.assertEqual(original, written)
+
+    def test_update_balance_in_place(self):
+        """Balances are written into the mapped file without rewriting it."""
+        csv_to_binary(self.csv_path, self.path)
+        account_file = AccountFile(self.path)
+        size = os.path.getsize(self.path)
+
+        self.assertTrue(account_file.update_balance(20002, 99.5))
+        self.assertFalse(account_file.update_balance(29999, 1.0))
+        self.assertEqual(2, account_file.update_balances({20001: 1.0, 20003: 2.0, 1: 3.0}))
+
+        self.assertEqual(size, os.path.getsize(self.path))
+        self.assertEqual([1.0, 99.5, 2.0], AccountFile(self.path).records()["balance"].tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
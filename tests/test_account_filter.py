@@ -0,0 +1,78 @@
+"""
+Description: Unit tests for the account filter engine.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_account_filter.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from user_interface import account_filter
+from user_interface.account_filter import (ACCOUNT_NUMBER, ACCOUNT_TYPE, BALANCE, DATE_CREATED,
+                                           AccountFilterIndex, FilterQuery, parse_filter)
+
+
+class TestAccountFilter(unittest.TestCase):
+    """Test cases for parse_filter and AccountFilterIndex."""
+
+    def setUp(self):
+        self.accounts = [
+            ChequingAccount(20010, 1001, 50.0, datetime(2023, 3, 1)),
+            InvestmentAccount(20001, 1001, 900.0, datetime(2023, 1, 1), 2.55),
+            ChequingAccount(30001, 1001, 5.5, None),
+            ChequingAccount(20011, 1001, 900.0, datetime(2023, 2, 1)),
+        ]
+        self.index = AccountFilterIndex(self.accounts)
+
+    def matching(self, column, text):
+        return self.index.matching(parse_filter(column, text))
+
+    def test_parse_filter(self):
+        """Filter text is parsed into prefix, equality and range queries."""
+        self.assertEqual(FilterQuery(ACCOUNT_TYPE, True, "cheq"), parse_filter(ACCOUNT_TYPE, " Cheq "))
+        self.assertEqual(FilterQuery(BALANCE, False, 10.0, 10.0), parse_filter(BALANCE, "=10"))
+        self.assertEqual(FilterQuery(BALANCE, False, 10.0, None, include_low=False), parse_filter(BALANCE, ">10"))
+        self.assertEqual(FilterQuery(ACCOUNT_NUMBER, False, None, 20010), parse_filter(ACCOUNT_NUMBER, "..20010"))
+        with self.assertRaises(ValueError):
+            parse_filter(DATE_CREATED, ">=2023-13-01")
+
+    def test_prefix_queries(self):
+        """Prefix queries match the displayed text, ignoring case."""
+        self.assertEqual([0, 1, 3], self.matching(ACCOUNT_NUMBER, "200"))
+        self.assertEqual([0, 3], self.matching(ACCOUNT_NUMBER, "2001"))
+        self.assertEqual([1], self.matching(ACCOUNT_TYPE, "INV"))
+        self.assertEqual([2], self.matching(DATE_CREATED, "none"))
+
+    def test_range_and_equality_queries(self):
+        """Range and equality queries compare the column values."""
+        self.assertEqual([1, 3], self.matching(BALANCE, "=900"))
+        self.assertEqual([0, 2], self.matching(BALANCE, "<900"))
+        self.assertEqual([0, 1, 3], self.matching(BALANCE, "10..1000"))
+        self.assertEqual([0, 3], self.matching(DATE_CREATED, ">2023-01-01"))
+        self.assertEqual([2], self.matching(ACCOUNT_NUMBER, ">=30001"))
+
+    def test_narrowing_query_searches_previous_matches(self):
+        """A query narrowing the previous one searches only the previous matches."""
+        self.matching(ACCOUNT_NUMBER, "2001")
+
+        with patch.object(account_filter, "bisect_left", wraps=account_filter.bisect_left) as bisect:
+            self.assertEqual([3], self.matching(ACCOUNT_NUMBER, "20011"))
+
+        lo, hi = bisect.call_args_list[0].args[2:4]
+        self.assertEqual(2, hi - lo)
+
+    def test_invalidate_rebuilds_index(self):
+        """Changed values are found once their column's index is invalidated."""
+        self.accounts[2].update_balance(894.5)
+        self.index.invalidate(BALANCE)
+        self.assertEqual([1, 2, 3], self.matching(BALANCE, "=900"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Description: Unit tests for the AccountLocks class and concurrent account updates.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_account_locks.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import threading
+import unittest
+from bank_account.account_locks import AccountLocks
+from bank_account.chequing_account import ChequingAccount
+
+
+class TestAccountLocks(unittest.TestCase):
+    """Test cases for AccountLocks and locked balance changes."""
+
+    def test_account_shares_its_stripe(self):
+        """Accounts whose numbers share a stripe share a lock."""
+        locks = AccountLocks(4)
+        self.assertIs(locks.lock_for(1), locks.lock_for(5))
+        self.assertIsNot(locks.lock_for(1), locks.lock_for(2))
+
+    def test_locked_in_any_order(self):
+        """Threads locking the same accounts in opposite orders do not deadlock."""
+        locks = AccountLocks(8)
+
+        def lock_repeatedly(*numbers):
+            for _ in range(200):
+                with locks.locked(*numbers):
+                    pass
+
+        threads = [threading.Thread(target=lock_repeatedly, args=(1, 2, 3)),
+                   threading.Thread(target=lock_repeatedly, args=(3, 2, 1))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+
+    def test_concurrent_updates_not_lost(self):
+        """Deposits and withdrawals from many threads all reach the balance."""
+        account = ChequingAccount(20001, 1001, 1000.0)
+
+        def transact():
+            for _ in range(500):
+                account.deposit(2.0)
+                account.withdraw(1.0)
+
+        threads = [threading.Thread(target=transact) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(5000.0, account.balance)
+
+    def test_overdraft_check_is_atomic(self):
+        """Concurrent withdrawals never take the balance below zero."""
+        account = ChequingAccount(20002, 1001, 100.0)
+        failures = []
+
+        def withdraw():
+            for _ in range(50):
+                try:
+                    account.withdraw(1.0)
+                except ValueError:
+                    failures.append(1)
+
+        threads = [threading.Thread(target=withdraw) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(0.0, account.balance)
+        self.assertEqual(100, len(failures))
+
+
+if __name__ == "__main__":
+    unittest.main()
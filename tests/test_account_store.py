@@ -0,0 +1,62 @@
+"""
+Description: Unit tests for the AccountStore class.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_account_store.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import unittest
+from bank_account.chequing_account import ChequingAccount
+from user_interface.account_store import AccountStore
+
+
+class TestAccountStore(unittest.TestCase):
+    """Test cases for AccountStore."""
+
+    def setUp(self):
+        self.store = AccountStore()
+        self.store[20001] = ChequingAccount(20001, 1001, 100.00)
+        self.store[20002] = ChequingAccount(20002, 1002, 200.00)
+        self.store[20003] = ChequingAccount(20003, 1001, 300.00)
+
+    def test_accounts_for_client(self):
+        """Accounts are returned for the requested client only."""
+        accounts = self.store.accounts_for_client(1001)
+        self.assertEqual([20001, 20003], [acc.account_number for acc in accounts])
+
+    def test_unknown_client_returns_empty_list(self):
+        """A client without accounts has an empty listing."""
+        self.assertEqual([], self.store.accounts_for_client(9999))
+
+    def test_replace_account_keeps_index(self):
+        """Replacing an account keeps a single index entry and the new object."""
+        updated = ChequingAccount(20001, 1001, 150.00)
+        self.store[20001] = updated
+        self.assertEqual([20001, 20003], self.store.account_numbers_for_client(1001))
+        self.assertIs(updated, self.store[20001])
+
+    def test_replace_account_with_new_client_moves_index(self):
+        """Replacing an account with a different owner re-indexes it."""
+        self.store[20001] = ChequingAccount(20001, 1002, 100.00)
+        self.assertEqual([20003], self.store.account_numbers_for_client(1001))
+        self.assertEqual([20002, 20001], self.store.account_numbers_for_client(1002))
+
+    def test_delete_account_updates_index(self):
+        """Removing an account removes it from the client index."""
+        del self.store[20002]
+        self.assertNotIn(20002, self.store)
+        self.assertEqual([], self.store.accounts_for_client(1002))
+
+    def test_mapping_behaviour(self):
+        """The store behaves like the dictionary load_data used to return."""
+        self.assertEqual(3, len(self.store))
+        self.assertEqual([20001, 20002, 20003], list(self.store))
+        self.assertEqual(200.00, self.store.pop(20002).balance)
+        self.assertEqual(2, len(self.store.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Description: Unit tests for the AccountTable class.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_account_table.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from bank_account.account_table import AccountTable
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+
+ACCOUNTS_CSV = (
+    "account_number,client_number,balance,date_created,account_type,"
+    "overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+    "20001,1001,15000,2023-01-10,ChequingAccount,-50,0.035,Null,Null\n"
+    "20002,1001,301.54,2023-01-15,SavingsAccount,Null,Null,50,Null\n"
+    "20004,1002,4500.87,2023-02-05,InvestmentAccount,Null,Null,Null,5\n"
+    "20005,1002,100,2023-02-30,ChequingAccount,-50,0.035,Null,Null\n"
+    "20006,1003,200,2023-02-01,CreditAccount,Null,Null,Null,Null\n"
+)
+
+
+class TestAccountTable(unittest.TestCase):
+    """Test cases for AccountTable."""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", newline="") as file:
+            file.write(ACCOUNTS_CSV)
+        self.table = AccountTable.from_csv(self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_from_csv_skips_invalid_rows(self):
+        """Rows with an invalid date or account type are not loaded."""
+        self.assertEqual([20001, 20002, 20004], self.table.account_number.tolist())
+
+    def test_from_csv_filters_clients(self):
+        """Only accounts of the given clients are loaded."""
+        table = AccountTable.from_csv(self.path, client_numbers={1002})
+        self.assertEqual([20004], table.account_number.tolist())
+
+    def test_aggregates(self):
+        """Totals, averages and per-type breakdowns match the balances."""
+        self.assertAlmostEqual(19802.41, self.table.total_balance())
+        self.assertAlmostEqual(19802.41 / 3, self.table.average_balance())
+        self.assertEqual({"ChequingAccount": 1, "SavingsAccount": 1, "InvestmentAccount": 1},
+                         self.table.counts_by_type())
+        self.assertAlmostEqual(301.54, self.table.totals_by_type()["SavingsAccount"])
+        self.assertAlmostEqual(15301.54, self.table.totals_by_client()[1001])
+
+    def test_to_account(self):
+        """A row is materialized as an account of the right type."""
+        chequing = self.table.to_account(20001)
+        savings = self.table.to_account(20002)
+        investment = self.table.to_account(20004)
+
+        self.assertIsInstance(chequing, ChequingAccount)
+        self.assertEqual(-50.0, chequing.overdraft_limit)
+        self.assertEqual(datetime(2023, 1, 10), chequing.date_created)
+        self.assertIsInstance(savings, SavingsAccount)
+        self.assertEqual(50.0, savings.minimum_balance)
+        self.assertIsInstance(investment, InvestmentAccount)
+        self.assertEqual(4500.87, investment.balance)
+
+    def test_unknown_account_raises(self):
+        """Materializing an account that is not in the table raises KeyError."""
+        with self.assertRaises(KeyError):
+            self.table.to_account(99999)
+
+    def test_round_trip_through_accounts(self):
+        """A table built from materialized accounts holds the same values."""
+        accounts = [self.table.to_account(number) for number in (20001, 20002, 20004)]
+        table = AccountTable.from_accounts(accounts)
+
+        self.assertEqual(self.table.balance.tolist(), table.balance.tolist())
+        self.assertEqual(self.table.account_type.tolist(), table.account_type.tolist())
+        self.assertEqual(self.table.date_created.tolist(), table.date_created.tolist())
+
+    def test_update_from_account(self):
+        """Changes to a materialized account can be written back to its row."""
+        account = self.table.to_account(20002)
+        account.deposit(100.00)
+        self.table.update_from_account(account)
+        self.assertAlmostEqual(401.54, self.table.balance[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Description: Unit tests for the AccountTableModel class.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_account_table_model.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import unittest
+from datetime import datetime
+from PySide6.QtCore import QCoreApplication, QPersistentModelIndex, Qt
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from user_interface.account_table_model import AccountTableModel
+
+app = QCoreApplication.instance() or QCoreApplication([])
+
+
+class TestAccountTableModel(unittest.TestCase):
+    """Test cases for AccountTableModel."""
+
+    def setUp(self):
+        self.accounts = [
+            ChequingAccount(20003, 1001, 50.0, datetime(2023, 3, 1)),
+            InvestmentAccount(20001, 1001, 900.0, datetime(2023, 1, 1), 2.55),
+            ChequingAccount(20002, 1001, 5.5, None),
+        ]
+        self.model = AccountTableModel()
+        self.model.set_accounts(self.accounts)
+
+    def column(self, column):
+        return [self.model.index(row, column).data() for row in range(self.model.rowCount())]
+
+    def test_cells_formatted_on_request(self):
+        """Cells show the account values as text and their raw values under UserRole."""
+        self.assertEqual((3, 4), (self.model.rowCount(), self.model.columnCount()))
+        self.assertEqual(["20003", "20001", "20002"], self.column(0))
+        self.assertEqual("InvestmentAccount", self.model.index(1, 3).data())
+        self.assertEqual(900.0, self.model.index(1, 1).data(Qt.UserRole))
+        self.assertEqual("Balance", self.model.headerData(1, Qt.Horizontal))
+
+    def test_refresh_account_changes_one_row(self):
+        """Refreshing an account emits dataChanged for its row only."""
+        changes = []
+        self.model.dataChanged.connect(lambda first, last: changes.append((first.row(), last.row())))
+
+        self.accounts[1].update_balance(100.0)
+        self.assertTrue(self.model.refresh_account(self.accounts[1]))
+        self.assertFalse(self.model.refresh_account(ChequingAccount(29999, 1001, 0.0)))
+
+        self.assertEqual([(1, 1)], changes)
+        self.assertEqual("1000.0", self.model.index(1, 1).data())
+
+    def test_sort_keeps_persistent_indexes(self):
+        """Sorting reorders the rows in place and selections follow their accounts."""
+        followed = QPersistentModelIndex(self.model.index(0, 1))
+
+        self.model.sort(AccountTableModel.BALANCE, Qt.DescendingOrder)
+        self.assertEqual(["900.0", "50.0", "5.5"], self.column(1))
+        self.assertEqual(1, followed.row())
+
+        self.model.sort(AccountTableModel.DATE_CREATED)
+        self.assertEqual(["20002", "20001", "20003"], self.column(0))
+        self.assertEqual(0, self.model.row_of(20002))
+
+    def test_filter_shows_matching_rows(self):
+        """A filter hides other accounts, survives sorting and is cleared by empty text."""
+        self.assertEqual(2, self.model.apply_filter(AccountTableModel.ACCOUNT_TYPE, "cheq"))
+        self.assertEqual(["20003", "20002"], self.column(0))
+        self.assertEqual(-1, self.model.row_of(20001))
+
+        self.model.sort(AccountTableModel.ACCOUNT_NUMBER)
+        self.assertEqual(["20002", "20003"], self.column(0))
+
+        with self.assertRaises(ValueError):
+            self.model.apply_filter(AccountTableModel.BALANCE, ">abc")
+        self.assertEqual(2, self.model.rowCount())
+
+        self.assertEqual(3, self.model.apply_filter(AccountTableModel.ACCOUNT_TYPE, ""))
+        self.assertFalse(self.model.is_filtered)
+
+    def test_refresh_account_applies_filter(self):
+        """A refreshed account is hidden or shown as its balance leaves or enters the filter."""
+        self.model.apply_filter(AccountTableModel.BALANCE, "<100")
+        self.assertEqual(["20003", "20002"], self.column(0))
+        removed, inserted = [], []
+        self.model.rowsRemoved.connect(lambda parent, first, last: removed.append(first))
+        self.model.rowsInserted.connect(lambda parent, first, last: inserted.append(first))
+
+        self.accounts[0].update_balance(100.0)
+        self.assertFalse(self.model.refresh_account(self.accounts[0]))
+        self.assertEqual(["20002"], self.column(0))
+
+        self.accounts[1].update_balance(-850.0)
+        self.assertTrue(self.model.refresh_account(self.accounts[1]))
+        self.assertEqual(["20001", "20002"], self.column(0))
+        self.assertEqual(([0], [0]), (removed, inserted))
+
+    def test_remove_rows(self):
+        """Rows can be removed, which clears the table."""
+        self.assertTrue(self.model.removeRows(0, self.model.rowCount()))
+        self.assertEqual(0, self.model.rowCount())
+        self.assertEqual(-1, self.model.row_of(20001))
+
+
+if __name__ == "__main__":
+    unittest.main()
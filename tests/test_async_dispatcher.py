@@ -0,0 +1,143 @@
+"""
+Description: Unit tests for the AsyncDispatcher class.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_async_dispatcher.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import threading
+import unittest
+from patterns.observer.async_dispatcher import AsyncDispatcher
+from patterns.observer.observer import Observer
+from patterns.observer.subject import Subject
+
+
+class RecordingObserver(Observer):
+    """Observer that records messages, optionally waiting on an event first."""
+
+    def __init__(self, gate=None):
+        self.messages = []
+        self.gate = gate
+
+    def update(self, message):
+        if self.gate is not None:
+            self.gate.wait()
+        self.messages.append(message)
+
+
+class AsyncSubject(Subject):
+    """Subject subclass used to install a dispatcher without affecting other tests."""
+
+
+class TestAsyncDispatcher(unittest.TestCase):
+    """Test cases for AsyncDispatcher."""
+
+    def tearDown(self):
+        AsyncSubject.dispatcher = None
+
+    def subject(self, dispatcher, observer):
+        AsyncSubject.dispatcher = dispatcher
+        subject = AsyncSubject()
+        subject.attach(observer)
+        return subject
+
+    def test_notify_returns_before_delivery(self):
+        """notify() returns while the observer is still blocked; flush() waits for delivery."""
+        gate = threading.Event()
+        observer = RecordingObserver(gate)
+        dispatcher = AsyncDispatcher()
+        subject = self.subject(dispatcher, observer)
+
+        subject.notify("first")
+        subject.notify("second")
+        self.assertEqual([], observer.messages)
+
+        gate.set()
+        self.assertTrue(dispatcher.flush(timeout=2))
+        self.assertEqual(["first", "second"], observer.messages)
+        dispatcher.drain()
+
+    def test_drop_oldest(self):
+        """When full, DROP_OLDEST discards the oldest queued notification."""
+        gate = threading.Event()
+        observer = RecordingObserver(gate)
+        dispatcher = AsyncDispatcher(maxsize=2, policy=AsyncDispatcher.DROP_OLDEST)
+        subject = self.subject(dispatcher, observer)
+
+        subject.notify("in flight")
+        while dispatcher._queue:
+            pass
+        for message in ("a", "b", "c"):
+            subject.notify(message)
+
+        gate.set()
+        dispatcher.drain(timeout=2)
+        self.assertEqual(["in flight", "b", "c"], observer.messages)
+        self.assertEqual(1, dispatcher.dropped)
+
+    def test_coalesce(self):
+        """COALESCE merges a notification identical to one still queued."""
+        gate = threading.Event()
+        observer = RecordingObserver(gate)
+        dispatcher = AsyncDispatcher(policy=AsyncDispatcher.COALESCE)
+        subject = self.subject(dispatcher, observer)
+
+        subject.notify("in flight")
+        while dispatcher._queue:
+            pass
+        for message in ("low", "low", "large", "low"):
+            subject.notify(message)
+
+        gate.set()
+        dispatcher.drain(timeout=2)
+        self.assertEqual(["in flight", "low", "large"], observer.messages)
+        self.assertEqual(2, dispatcher.dropped)
+
+    def test_block_waits_for_space(self):
+        """BLOCK makes the notifying thread wait until the worker frees space."""
+        gate = threading.Event()
+        observer = RecordingObserver(gate)
+        dispatcher = AsyncDispatcher(maxsize=1)
+        subject = self.subject(dispatcher, observer)
+
+        subject.notify("in flight")
+        while dispatcher._queue:
+            pass
+        subject.notify("queued")
+
+        sender = threading.Thread(target=subject.notify, args=("waiting",))
+        sender.start()
+        sender.join(0.1)
+        self.assertTrue(sender.is_alive())
+
+        gate.set()
+        sender.join(2)
+        dispatcher.drain(timeout=2)
+        self.assertEqual(["in flight", "queued", "waiting"], observer.messages)
+        self.assertEqual(0, dispatcher.dropped)
+
+    def test_drain_stops_worker_and_restarts(self):
+        """drain() stops the worker; a later notification starts a new one."""
+        observer = RecordingObserver()
+        dispatcher = AsyncDispatcher()
+        subject = self.subject(dispatcher, observer)
+
+        subject.notify("one")
+        self.assertTrue(dispatcher.drain(timeout=2))
+        self.assertIsNone(dispatcher._worker)
+
+        subject.notify("two")
+        dispatcher.drain(timeout=2)
+        self.assertEqual(["one", "two"], observer.messages)
+
+    def test_invalid_policy(self):
+        """An unknown policy raises ValueError."""
+        with self.assertRaises(ValueError):
+            AsyncDispatcher(policy="discard")
+
+
+if __name__ == "__main__":
+    unittest.main()
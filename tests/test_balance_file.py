@@ -0,0 +1,99 @@
+"""
+Description: Unit tests for the BalanceFile class.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_balance_file.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import csv
+import os
+import tempfile
+import unittest
+from user_interface.balance_file import BalanceFile
+
+ACCOUNTS_CSV = (
+    "account_number,client_number,balance,date_created,account_type\n"
+    "20001,1001,15000,2023-01-10,ChequingAccount\n"
+    "20002,1001,301.54,2023-01-15,SavingsAccount\n"
+    "20003,1002,abc,2023-02-01,ChequingAccount\n"
+)
+
+
+class TestBalanceFile(unittest.TestCase):
+    """Test cases for BalanceFile."""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", newline="") as file:
+            file.write(ACCOUNTS_CSV)
+        self.balance_file = BalanceFile(self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def read_balances(self):
+        with open(self.path, newline="") as file:
+            return {row["account_number"]: row["balance"] for row in csv.DictReader(file)}
+
+    def test_update_balance_in_place(self):
+        """Only the updated account's balance changes and the file stays the same size."""
+        self.balance_file.update_balance(20001, 100.25)
+        size = os.path.getsize(self.path)
+        self.balance_file.update_balance(20002, 99.5)
+
+        balances = self.read_balances()
+        self.assertEqual(100.25, float(balances["20001"]))
+        self.assertEqual(99.5, float(balances["20002"]))
+        self.assertEqual("abc", balances["20003"].strip())
+        self.assertEqual(size, os.path.getsize(self.path))
+
+    def test_unknown_account_returns_false(self):
+        """Updating an account that is not in the file does nothing."""
+        self.assertFalse(self.balance_file.update_balance(99999, 1.0))
+        self.assertEqual(301.54, float(self.read_balances()["20002"]))
+
+    def test_wide_balance_widens_column(self):
+        """A balance wider than the column widens it for every row."""
+        width = self.balance_file.width
+        self.balance_file.update_balance(20002, 1.2345678901234567e+300)
+
+        self.assertGreater(self.balance_file.width, width)
+        balances = self.read_balances()
+        self.assertEqual(1.2345678901234567e+300, float(balances["20002"]))
+        self.assertEqual(15000.0, float(balances["20001"]))
+
+    def test_external_rewrite_rebuilds_index(self):
+        """A file replaced by another writer is re-indexed before the next update."""
+        self.balance_file.update_balance(20001, 1.0)
+        with open(self.path, "w", newline="") as file:
+            file.write(ACCOUNTS_CSV.replace("20001,1001,15000", "20001,1001,15000.00000"))
+
+        self.balance_file.update_balance(20002, 2.0)
+        balances = self.read_balances()
+        self.assertEqual(15000.0, float(balances["20001"]))
+        self.assertEqual(2.0, float(balances["20002"]))
+
+    def test_rewrite_balances_counts_changed_rows(self):
+        """A batch rewrite updates every given account and counts real changes."""
+        changed = self.balance_file.rewrite_balances({20001: 15000.0, 20002: 50.0})
+
+        self.assertEqual(1, changed)
+        balances = self.read_balances()
+        self.assertEqual(15000.0, float(balances["20001"]))
+        self.assertEqual(50.0, float(balances["20002"]))
+
+    def test_in_place_update_after_rewrite(self):
+        """The index is valid again after a batch rewrite replaces the file."""
+        self.balance_file.rewrite_balances({20002: 50.0})
+        self.balance_file.update_balance(20001, 7.0)
+
+        balances = self.read_balances()
+        self.assertEqual(7.0, float(balances["20001"]))
+        self.assertEqual(50.0, float(balances["20002"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Description: Unit tests for the BalanceSnapshot class and journal compaction.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_balance_snapshot.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import os
+import tempfile
+import time
+import unittest
+from bank_account.transaction_journal import TransactionJournal
+from user_interface.balance_snapshot import BalanceSnapshot, SnapshotCompactor, compact, recover_balances
+
+
+class TestBalanceSnapshot(unittest.TestCase):
+    """Test cases for BalanceSnapshot and compaction."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.snapshot = BalanceSnapshot(os.path.join(self.directory.name, "accounts.snapshot"))
+        self.journal = TransactionJournal(os.path.join(self.directory.name, "accounts.journal"))
+
+    def tearDown(self):
+        self.journal.close()
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """Balances written to a snapshot are read back with their sequence number."""
+        self.assertEqual((0, {}), self.snapshot.read())
+        self.snapshot.write({20002: 10.5, 20001: -3.25}, 42)
+        self.assertEqual((42, {20001: -3.25, 20002: 10.5}), self.snapshot.read())
+
+    def test_damaged_snapshot(self):
+        """A snapshot whose records fail the checksum raises ValueError."""
+        self.snapshot.write({1: 1.0}, 1)
+        with open(self.snapshot.path, "r+b") as file:
+            file.seek(-1, os.SEEK_END)
+            file.write(b"\x01")
+        with self.assertRaises(ValueError):
+            self.snapshot.read()
+
+    def test_compact_folds_and_truncates(self):
+        """Compaction moves journaled balances into the snapshot and empties the journal."""
+        self.journal.append(TransactionJournal.DEPOSIT, 1, 50.0, 150.0)
+        self.journal.append(TransactionJournal.DEPOSIT, 2, 5.0, 5.0)
+        self.journal.append(TransactionJournal.WITHDRAW, 1, -25.0, 125.0)
+
+        self.assertEqual(3, compact(self.journal, self.snapshot))
+        self.assertEqual((3, {1: 125.0, 2: 5.0}), self.snapshot.read())
+        self.assertEqual([], list(self.journal.records()))
+        self.assertEqual(0, compact(self.journal, self.snapshot))
+
+        self.journal.append(TransactionJournal.UPDATE, 2, 1.0, 6.0)
+        self.assertEqual([4], [record.sequence for record in self.journal.records()])
+        self.assertEqual({1: 125.0, 2: 6.0}, recover_balances(self.snapshot, self.journal))
+
+    def test_records_already_in_snapshot_skipped(self):
+        """Records up to the snapshot's sequence number are ignored on recovery."""
+        self.journal.append(TransactionJournal.DEPOSIT, 1, 50.0, 150.0)
+        self.journal.append(TransactionJournal.DEPOSIT, 1, 50.0, 200.0)
+        self.snapshot.write({1: 200.0, 2: 7.0}, 2)
+        self.journal.append(TransactionJournal.DEPOSIT, 2, 3.0, 10.0)
+
+        self.assertEqual({1: 200.0, 2: 10.0}, recover_balances(self.snapshot, self.journal))
+
+    def test_sequence_continues_after_reopening(self):
+        """A journal reopened after compaction keeps numbering after the snapshot."""
+        self.journal.append(TransactionJournal.DEPOSIT, 1, 50.0, 150.0)
+        compact(self.journal, self.snapshot)
+        self.journal.close()
+
+        reopened = TransactionJournal(self.journal.path)
+        self.assertEqual(2, reopened.append(TransactionJournal.DEPOSIT, 1, 1.0, 151.0))
+        reopened.close()
+
+    def test_background_compactor(self):
+        """The compactor compacts once enough records have accumulated."""
+        self.journal.append(TransactionJournal.DEPOSIT, 1, 50.0, 150.0)
+        self.journal.append(TransactionJournal.DEPOSIT, 1, 50.0, 200.0)
+        compactor = SnapshotCompactor(self.journal, self.snapshot, interval=0.01, min_records=2)
+        compactor.start()
+
+        deadline = time.monotonic() + 2
+        while self.snapshot.read()[0] < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        compactor.stop()
+
+        self.assertEqual((2, {1: 200.0}), self.snapshot.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
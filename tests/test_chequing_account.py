@@ -37,5 +37,19 @@ class TestChequingAccount(unittest.TestCase):
         )
         self.assertEqual(str(account), expected)
 
+    def test_accounts_share_strategy(self):
+        """Accounts with the same parameters share one strategy instance."""
+        first = ChequingAccount(40079, 2828, 200.00, None, 100.00)
+        second = ChequingAccount(40080, 2829, 900.00, None, 100.00)
+        other = ChequingAccount(40081, 2829, 900.00, None, 50.00)
+        self.assertIs(first._service_charge_strategy, second._service_charge_strategy)
+        self.assertIsNot(first._service_charge_strategy, other._service_charge_strategy)
+
+    def test_slotted_without_observer_list(self):
+        """Accounts have no instance dictionary and no observer list until one is attached."""
+        account = ChequingAccount(40082, 2828, 200.00)
+        self.assertFalse(hasattr(account, "__dict__"))
+        self.assertIsNone(account._observers)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""
+Description: Unit tests for the email validation cache and deferred
+Client email validation.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_email_validation.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import unittest
+from unittest.mock import patch
+from client.client import Client
+from client.email_validation import EmailValidationCache, FALLBACK_EMAIL_ADDRESS, validate_in_background
+
+
+class TestEmailValidationCache(unittest.TestCase):
+    """Test cases for EmailValidationCache."""
+
+    def setUp(self):
+        self.cache = EmailValidationCache(max_size=2)
+        patcher = patch.object(EmailValidationCache, "_validate_domain", return_value=True)
+        self.validate_domain = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_valid_address_returned(self):
+        """A valid address is returned unchanged."""
+        self.assertEqual("johndoe@pixell.com", self.cache.validate("johndoe@pixell.com"))
+
+    def test_invalid_address_falls_back(self):
+        """An invalid address is replaced by the fallback address."""
+        self.assertEqual(FALLBACK_EMAIL_ADDRESS, self.cache.validate("not-an-email"))
+
+    def test_domain_checked_once(self):
+        """Addresses on the same domain share one deliverability check."""
+        self.cache.validate("johndoe@pixell.com")
+        self.cache.validate("janesmith@pixell.com")
+        self.cache.validate("johndoe@pixell.com")
+        self.validate_domain.assert_called_once()
+
+    def test_undeliverable_domain_falls_back(self):
+        """Addresses on an undeliverable domain are replaced by the fallback address."""
+        self.validate_domain.return_value = False
+        self.assertEqual(FALLBACK_EMAIL_ADDRESS, self.cache.validate("johndoe@pixell.com"))
+
+    def test_cache_size_is_bounded(self):
+        """The least recently used address is evicted when the cache is full."""
+        with patch.object(self.cache, "_validate_address", return_value=True) as validate_address:
+            for address in ["a@pixell.com", "b@pixell.com", "c@pixell.com", "a@pixell.com"]:
+                self.cache.validate(address)
+        self.assertEqual(4, validate_address.call_count)
+
+
+class TestDeferredValidation(unittest.TestCase):
+    """Test cases for Client objects created with deferred validation."""
+
+    @patch("client.client.validate_client_email", return_value=FALLBACK_EMAIL_ADDRESS)
+    def test_validation_deferred_until_read(self, validate):
+        """The address is validated once, when it is first read."""
+        client = Client(2025, "Komal", "Aulakh", "not-an-email", defer_validation=True)
+        validate.assert_not_called()
+
+        self.assertEqual(FALLBACK_EMAIL_ADDRESS, client.email_address)
+        self.assertEqual(FALLBACK_EMAIL_ADDRESS, client.email_address)
+        validate.assert_called_once_with("not-an-email")
+
+    @patch("client.client.validate_client_email", side_effect=lambda address: address)
+    def test_validate_in_background(self, validate):
+        """Deferred addresses are validated by the background thread."""
+        clients = [Client(number, "Komal", "Aulakh", f"k{number}@pixell.com", defer_validation=True)
+                   for number in range(1, 4)]
+        validate_in_background(clients).join()
+
+        self.assertEqual(3, validate.call_count)
+        self.assertEqual("k2@pixell.com", clients[1].email_address)
+        self.assertEqual(3, validate.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
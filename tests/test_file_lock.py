@@ -0,0 +1,63 @@
+"""
+Description: Unit tests for the FileLock class.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_file_lock.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import multiprocessing
+import os
+import tempfile
+import unittest
+from utility.file_lock import file_lock
+
+
+def increment_counter(path: str, times: int) -> None:
+    """Adds one to the number in a file, times times, under the file's lock."""
+    for _ in range(times):
+        with file_lock(path):
+            with open(path) as file:
+                value = int(file.read())
+            with open(path, "w") as file:
+                file.write(str(value + 1))
+
+
+class TestFileLock(unittest.TestCase):
+    """Test cases for FileLock."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "counter.txt")
+        with open(self.path, "w") as file:
+            file.write("0")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_shared_and_reentrant(self):
+        """One lock is shared per file and may be taken again by its holder."""
+        lock = file_lock(self.path)
+        self.assertIs(lock, file_lock(os.path.join(self.directory.name, ".", "counter.txt")))
+
+        with lock:
+            with lock:
+                self.assertTrue(os.path.exists(self.path + ".lock"))
+
+    def test_processes_excluded(self):
+        """Read-modify-write cycles in several processes never lose an update."""
+        processes = [multiprocessing.Process(target=increment_counter, args=(self.path, 100))
+                     for _ in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        with open(self.path) as file:
+            self.assertEqual(400, int(file.read()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Description: Unit tests for the EmailSink class.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_file_utils.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import gc
+import os
+import tempfile
+import time
+import unittest
+import weakref
+from utility.file_utils import EmailSink
+
+
+class TestEmailSink(unittest.TestCase):
+    """Test cases for EmailSink."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "emails.txt")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read(self):
+        if not os.path.exists(self.path):
+            return ""
+        with open(self.path, encoding="utf-8") as file:
+            return file.read()
+
+    def test_flushes_when_buffer_full(self):
+        """Messages are written in order once flush_size are buffered."""
+        sink = EmailSink(self.directory.name, "emails.txt", flush_size=3, flush_interval=60)
+        sink.send("a@pixell.com", "Subject 1", "Message 1")
+        sink.send("b@pixell.com", "Subject 2", "Message 2")
+        self.assertEqual("", self.read())
+
+        sink.send("c@pixell.com", "Subject 3", "Message 3")
+        content = self.read()
+        self.assertLess(content.index("Message 1"), content.index("Message 2"))
+        self.assertLess(content.index("Message 2"), content.index("Message 3"))
+        sink.close()
+
+    def test_message_format(self):
+        """Each message is written in the simulate_send_email format."""
+        sink = EmailSink(self.directory.name, "emails.txt", flush_size=10, flush_interval=60)
+        sink.send("a@pixell.com", "ALERT", "Low balance")
+        sink.close()
+        self.assertEqual("---\nTo: a@pixell.com\nSubject: ALERT\nMessage: Low balance\n---\n",
+                         self.read())
+
+    def test_flushes_after_interval(self):
+        """A buffered message is written by the background timer."""
+        sink = EmailSink(self.directory.name, "emails.txt", flush_size=10, flush_interval=0.05)
+        sink.send("a@pixell.com", "ALERT", "Large transaction")
+
+        deadline = time.monotonic() + 2
+        while "Large transaction" not in self.read() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertIn("Large transaction", self.read())
+        sink.close()
+
+    def test_close_stops_timer_and_releases_sink(self):
+        """Closing stops the timer thread, and a sink no longer used is collected."""
+        sink = EmailSink(self.directory.name, "emails.txt", flush_size=10, flush_interval=60)
+        sink.send("a@pixell.com", "ALERT", "Large transaction")
+        timer = sink._timer
+        self.assertTrue(timer.is_alive())
+
+        sink.close()
+        timer.join(timeout=2)
+        self.assertFalse(timer.is_alive())
+        self.assertIn("Large transaction", self.read())
+
+        reference = weakref.ref(sink)
+        del sink
+        gc.collect()
+        self.assertIsNone(reference())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Description: Unit tests for the InterestEngine class.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_interest.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import unittest
+from unittest.mock import Mock
+import numpy as np
+from bank_account.account_table import AccountTable
+from bank_account.chequing_account import ChequingAccount
+from bank_account.interest import InterestEngine
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+
+
+class TestInterestEngine(unittest.TestCase):
+    """Test cases for InterestEngine."""
+
+    def accounts(self):
+        return [
+            ChequingAccount(1, 1001, 500.0),
+            SavingsAccount(2, 1001, 1000.0, None, None, 100.0),
+            InvestmentAccount(3, 1002, 2000.0, None, 5.0, 0.02),
+            InvestmentAccount(4, 1002, 100.0, None, 5.0, 0.05),
+        ]
+
+    def test_matches_scalar_apply_interest(self):
+        """Posting interest gives the same balances as apply_interest() on each account."""
+        scalar = self.accounts()
+        for account in scalar:
+            account.apply_interest()
+
+        batch = self.accounts()
+        InterestEngine().post_interest(batch)
+
+        self.assertEqual([account.balance for account in scalar],
+                         [account.balance for account in batch])
+
+    def test_saves_changed_accounts_once(self):
+        """Only accounts that earned interest are saved, in one call."""
+        save = Mock()
+        posted = InterestEngine().post_interest(self.accounts(), save=save)
+
+        self.assertEqual({3: 40.0, 4: 5.0}, posted)
+        save.assert_called_once()
+        self.assertEqual([3, 4], [account.account_number for account in save.call_args.args[0]])
+
+    def test_rate_rules_override_defaults(self):
+        """A fixed rate rule applies to every account of that type."""
+        engine = InterestEngine({SavingsAccount: 0.01, InvestmentAccount: 0.0})
+        interest = engine.calculate_interest(self.accounts())
+        self.assertEqual([0.0, 10.0, 0.0, 0.0], interest.tolist())
+
+    def test_post_table_interest(self):
+        """A table earns the same interest as the account objects."""
+        accounts = self.accounts()
+        table = AccountTable.from_accounts(accounts)
+        rates = np.array([0.0, 0.0, 0.02, 0.05])
+
+        interest = InterestEngine().post_table_interest(table, rates)
+
+        self.assertEqual([0.0, 0.0, 40.0, 5.0], interest.tolist())
+        self.assertEqual([500.0, 1000.0, 2040.0, 105.0], table.balance.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,361 @@
+"""
+Description: Unit tests for the manage_data module.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_manage_data.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import csv
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from bank_account.chequing_account import ChequingAccount
+from user_interface import manage_data
+from user_interface.account_file import csv_to_binary
+
+CLIENTS_CSV = (
+    "client_number,first_name,last_name,email_address\n"
+    "1001,John,Doe,johndoe@pixell.com\n"
+    "1002,Jane,Smith,janesmith@pixell.com\n"
+    "1003,,Jones,emilyjones@pixell.com\n"
+)
+
+ACCOUNTS_CSV = (
+    "account_number,client_number,balance,date_created,account_type,"
+    "overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+    "20001,1001,15000,2023-01-10,ChequingAccount,-50,0.035,Null,Null\n"
+    "20002,1001,301.54,2023-01-15,ChequingAccount,-100,0.035,Null,Null\n"
+    "20003,1002,1200.87,2023-02-01,ChequingAccount,-100,0.035,Null,Null\n"
+    "20004,1003,50,2023-02-01,ChequingAccount,-100,0.035,Null,Null\n"
+    "20005,1002,12.5,2023-02-30,ChequingAccount,-100,0.035,Null,Null\n"
+)
+
+
+class TestManageData(unittest.TestCase):
+    """Test cases for loading and updating the CSV data files."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.clients_path = os.path.join(self.directory.name, "clients.csv")
+        self.accounts_path = os.path.join(self.directory.name, "accounts.csv")
+        self.journal_path = os.path.join(self.directory.name, "accounts.journal")
+        self.snapshot_path = os.path.join(self.directory.name, "accounts.snapshot")
+        self.binary_path = os.path.join(self.directory.name, "accounts.npy")
+
+        with open(self.clients_path, "w", newline="") as file:
+            file.write(CLIENTS_CSV)
+        with open(self.accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS_CSV)
+
+        patchers = [
+            patch.object(manage_data, "clients_csv_path", self.clients_path),
+            patch.object(manage_data, "accounts_csv_path", self.accounts_path),
+            patch.object(manage_data, "journal_path", self.journal_path),
+            patch.object(manage_data, "snapshot_path", self.snapshot_path),
+            patch.object(manage_data, "accounts_bin_path", self.binary_path),
+            patch.object(manage_data.BankAccount, "journal", None),
+            patch.dict(manage_data._journals, clear=True),
+            patch.object(manage_data.logging, "error"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read_balances(self):
+        with open(self.accounts_path, newline="") as file:
+            return {int(row["account_number"]): float(row["balance"])
+                    for row in csv.DictReader(file)}
+
+    def test_load_data_skips_invalid_rows(self):
+        """Clients without names and accounts with invalid data are skipped."""
+        clients, accounts = manage_data.load_data()
+
+        self.assertEqual([1001, 1002], sorted(clients))
+        self.assertEqual([20001, 20002, 20003], sorted(accounts))
+        self.assertEqual([20001, 20002],
+                         [acc.account_number for acc in accounts.accounts_for_client(1001)])
+
+    def test_load_data_into_reports_progress(self):
+        """load_data_into fills the given mappings and reports progress up to the total."""
+        clients, accounts = {}, manage_data.AccountStore()
+        reports = []
+
+        with patch.object(manage_data, "PROGRESS_INTERVAL", 2):
+            manage_data.load_data_into(clients, accounts, lambda done, total: reports.append((done, total)))
+
+        total = os.path.getsize(self.clients_path) + os.path.getsize(self.accounts_path)
+        self.assertEqual([1001, 1002], sorted(clients))
+        self.assertEqual([20001, 20002], accounts.account_numbers_for_client(1001))
+        self.assertEqual((total, total), reports[-1])
+        self.assertEqual(4, len(reports))
+        self.assertEqual(sorted(reports), reports)
+
+    def test_load_data_replays_journal(self):
+        """Transactions recorded in the journal are applied on top of accounts.csv."""
+        _, accounts = manage_data.load_data()
+        journal = manage_data.open_journal(compact_interval=None)
+        accounts[20002].deposit(100.00)
+        accounts[20003].withdraw(200.87)
+        journal.close()
+        manage_data.BankAccount.journal = None
+
+        _, accounts = manage_data.load_data()
+        self.assertAlmostEqual(401.54, accounts[20002].balance)
+        self.assertAlmostEqual(1000.00, accounts[20003].balance)
+        self.assertEqual(15000.00, accounts[20001].balance)
+
+    def test_csv_writes_outside_journal_survive_replay(self):
+        """A balance saved to accounts.csv without journaling is not replaced by an older journaled one."""
+        _, accounts = manage_data.load_data()
+        journal = manage_data.open_journal(compact_interval=None)
+        accounts[20002].deposit(5.00)
+        manage_data.update_data(accounts[20002])
+        journal.close()
+        manage_data.BankAccount.journal = None
+
+        accounts[20002].update_balance(-50.00)
+        manage_data.update_many([accounts[20002]])
+        self.assertAlmostEqual(256.54, self.read_balances()[20002])
+
+        _, accounts = manage_data.load_data()
+        self.assertAlmostEqual(256.54, accounts[20002].balance)
+
+    def test_load_data_after_compaction(self):
+        """Balances folded into the snapshot and the journal tail are both recovered."""
+        _, accounts = manage_data.load_data()
+        journal = manage_data.open_journal(compact_interval=None)
+        accounts[20002].deposit(100.00)
+        accounts[20003].withdraw(200.87)
+
+        self.assertEqual(2, manage_data.compact_data())
+        self.assertEqual(2, journal.base_sequence)
+        self.assertEqual([], list(journal.records()))
+
+        accounts[20002].withdraw(1.54)
+        journal.close()
+        manage_data.BankAccount.journal = None
+
+        _, accounts = manage_data.load_data()
+        self.assertAlmostEqual(400.00, accounts[20002].balance)
+        self.assertAlmostEqual(1000.00, accounts[20003].balance)
+        self.assertEqual([3], [record.sequence for record in
+                               manage_data.open_journal(compact_interval=None).records()])
+
+    def test_csv_writes_after_compaction_survive_replay(self):
+        """A snapshot balance does not replace a balance saved to accounts.csv after it."""
+        _, accounts = manage_data.load_data()
+        journal = manage_data.open_journal(compact_interval=None)
+        accounts[20002].deposit(5.00)
+        accounts[20003].deposit(5.00)
+        manage_data.update_many([accounts[20002], accounts[20003]])
+        self.assertEqual(4, manage_data.compact_data())
+        journal.close()
+        manage_data.BankAccount.journal = None
+
+        accounts[20002].update_balance(-50.00)
+        manage_data.update_data(accounts[20002])
+        manage_data.compact_data()
+
+        # Without a journal file, saving a balance starts one after the snapshot
+        os.remove(self.journal_path)
+        manage_data._journals.clear()
+        accounts[20003].update_balance(-50.00)
+        manage_data.update_data(accounts[20003])
+
+        _, accounts = manage_data.load_data()
+        self.assertAlmostEqual(256.54, accounts[20002].balance)
+        self.assertAlmostEqual(1155.87, accounts[20003].balance)
+
+    def test_load_data_from_binary_file(self):
+        """With a binary account file present, load_data builds the same accounts from it."""
+        _, from_csv = manage_data.load_data()
+        csv_to_binary(self.accounts_path, self.binary_path)
+        with open(self.accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS_CSV.splitlines()[0] + "\n")
+        binary_mtime = os.path.getmtime(self.binary_path)
+        os.utime(self.accounts_path, (binary_mtime - 1, binary_mtime - 1))
+
+        _, from_binary = manage_data.load_data()
+
+        self.assertEqual(list(from_csv), list(from_binary))
+        for account_number, account in from_csv.items():
+            loaded = from_binary[account_number]
+            self.assertIs(type(account), type(loaded))
+            self.assertEqual((account.client_number, account.balance, account.date_created),
+                             (loaded.client_number, loaded.balance, loaded.date_created))
+        self.assertEqual([20001, 20002],
+                         [acc.account_number for acc in from_binary.accounts_for_client(1001)])
+
+    def test_update_data_updates_binary_file(self):
+        """update_data and update_many write balances to the binary file too."""
+        csv_to_binary(self.accounts_path, self.binary_path)
+
+        manage_data.update_data(ChequingAccount(20002, 1001, 99.99))
+        manage_data.update_many([ChequingAccount(20003, 1002, 5.0)])
+        with patch.object(manage_data.logging, "warning") as warning:
+            _, accounts = manage_data.load_data()
+
+        warning.assert_not_called()
+        self.assertEqual(99.99, accounts[20002].balance)
+        self.assertEqual(5.0, accounts[20003].balance)
+        self.assertEqual(99.99, self.read_balances()[20002])
+
+    def test_newer_csv_preferred_to_binary_file(self):
+        """A CSV file modified after the binary file is read instead, with a warning."""
+        csv_to_binary(self.accounts_path, self.binary_path)
+        binary_mtime = os.path.getmtime(self.binary_path)
+        with open(self.accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS_CSV.replace("15000", "14000"))
+        os.utime(self.accounts_path, (binary_mtime + 1, binary_mtime + 1))
+
+        with patch.object(manage_data.logging, "warning") as warning:
+            _, accounts = manage_data.load_data(workers=2)
+
+        self.assertEqual(14000.0, accounts[20001].balance)
+        self.assertEqual(1, warning.call_count)
+
+        os.utime(self.accounts_path, (binary_mtime - 1, binary_mtime - 1))
+        with patch.object(manage_data.logging, "warning") as warning:
+            _, accounts = manage_data.load_data(workers=2)
+
+        self.assertEqual(15000.0, accounts[20001].balance)
+        self.assertIn("workers=2", warning.call_args[0][0])
+
+    def test_update_data_is_readable_by_load_data(self):
+        """A balance written by update_data is loaded back unchanged."""
+        manage_data.update_data(ChequingAccount(20002, 1001, 99.99))
+        _, accounts = manage_data.load_data()
+
+        self.assertEqual(99.99, accounts[20002].balance)
+        self.assertEqual(15000.0, accounts[20001].balance)
+
+    def test_update_many_reports_changed_rows(self):
+        """update_many writes every account and reports how many rows changed."""
+        changed = manage_data.update_many([
+            ChequingAccount(20001, 1001, 15000),
+            ChequingAccount(20003, 1002, 1.0),
+        ])
+
+        self.assertEqual(1, changed)
+        self.assertEqual(1.0, self.read_balances()[20003])
+
+    def test_transaction_commits_on_exit(self):
+        """Accounts added to a transaction are written when the block exits."""
+        with manage_data.AccountTransaction() as transaction:
+            transaction.add(ChequingAccount(20001, 1001, 10.0))
+            transaction.add(ChequingAccount(20002, 1001, 20.0))
+
+        self.assertEqual(2, transaction.rows_changed)
+        balances = self.read_balances()
+        self.assertEqual(10.0, balances[20001])
+        self.assertEqual(20.0, balances[20002])
+
+    def test_transaction_discarded_on_error(self):
+        """Nothing is written when the transaction block raises."""
+        with self.assertRaises(RuntimeError):
+            with manage_data.AccountTransaction() as transaction:
+                transaction.add(ChequingAccount(20001, 1001, 10.0))
+                raise RuntimeError("batch failed")
+
+        self.assertEqual(15000.0, self.read_balances()[20001])
+
+
+    def test_parallel_load_matches_eager_load(self):
+        """Parsing byte ranges in worker processes gives the same dictionaries."""
+        clients, accounts = manage_data.load_data()
+        parallel_clients, parallel_accounts = manage_data.load_data(workers=3)
+
+        self.assertEqual(list(clients), list(parallel_clients))
+        self.assertEqual(list(accounts), list(parallel_accounts))
+        self.assertEqual([acc.balance for acc in accounts.values()],
+                         [acc.balance for acc in parallel_accounts.values()])
+        self.assertEqual([20001, 20002], parallel_accounts.account_numbers_for_client(1001))
+
+    def test_split_byte_ranges_covers_every_row(self):
+        """Byte ranges start on line boundaries and together cover every row."""
+        fieldnames, ranges = manage_data._split_byte_ranges(self.accounts_path, 4)
+        rows = [row for start, end in ranges
+                for row in manage_data._read_byte_range(self.accounts_path, fieldnames, start, end)]
+
+        self.assertEqual(["20001", "20002", "20003", "20004", "20005"],
+                         [row["account_number"] for row in rows])
+
+    def test_lazy_load_matches_eager_load(self):
+        """The lazy mappings return the same clients and accounts as an eager load."""
+        clients, accounts = manage_data.load_data(lazy=True)
+
+        self.assertEqual("Jane", clients[1002].first_name)
+        self.assertNotIn(1003, clients)
+        self.assertEqual([20001, 20002],
+                         [acc.account_number for acc in accounts.accounts_for_client(1001)])
+        self.assertEqual(1200.87, accounts[20003].balance)
+        self.assertNotIn(20004, accounts)
+        self.assertNotIn(20005, accounts)
+        self.assertEqual([20001, 20002, 20003], sorted(accounts))
+
+    def test_lazy_cache_is_bounded(self):
+        """Evicted accounts are parsed again from disk, including in-place updates."""
+        _, accounts = manage_data.load_data(lazy=True, cache_size=1)
+        first = accounts[20001]
+        accounts[20002]
+        manage_data.update_data(ChequingAccount(20001, 1001, 5.0))
+
+        reloaded = accounts[20001]
+        self.assertIsNot(first, reloaded)
+        self.assertEqual(5.0, reloaded.balance)
+
+    def test_lazy_load_keeps_journaled_balances(self):
+        """Journaled balances are applied when a row is parsed and survive eviction."""
+        _, accounts = manage_data.load_data()
+        journal = manage_data.open_journal(compact_interval=None)
+        accounts[20002].deposit(100.00)
+        accounts[20003].withdraw(200.87)
+        journal.close()
+        manage_data.BankAccount.journal = None
+
+        with patch.object(manage_data, "_parse_account_row", wraps=manage_data._parse_account_row) as parse:
+            _, accounts = manage_data.load_data(lazy=True, cache_size=1)
+            self.assertEqual(0, parse.call_count)
+
+        self.assertAlmostEqual(401.54, accounts[20002].balance)
+        self.assertAlmostEqual(1000.00, accounts[20003].balance)
+        self.assertEqual(15000.00, accounts[20001].balance)
+        self.assertAlmostEqual(401.54, accounts[20002].balance)
+        self.assertAlmostEqual(1000.00, accounts[20003].balance)
+
+    def test_lazy_store_keeps_new_accounts(self):
+        """Accounts added to a lazy store are indexed by client until removed."""
+        _, accounts = manage_data.load_data(lazy=True)
+        account = ChequingAccount(30001, 1002, 10.0)
+        accounts[30001] = account
+
+        self.assertIs(account, accounts[30001])
+        self.assertEqual([20003, 30001],
+                         [acc.account_number for acc in accounts.accounts_for_client(1002)])
+        del accounts[30001]
+        del accounts[20003]
+        self.assertEqual([], accounts.accounts_for_client(1002))
+
+    def test_lazy_store_length_matches_iteration(self):
+        """len() counts an account that is not in the file once, and not after it is deleted."""
+        with open(self.accounts_path, "w", newline="") as file:
+            file.write("".join(ACCOUNTS_CSV.splitlines(keepends=True)[:3]))
+        _, accounts = manage_data.load_data(lazy=True)
+
+        accounts[30001] = ChequingAccount(30001, 1002, 10.0)
+        self.assertEqual([20001, 20002, 30001], list(accounts))
+        self.assertEqual(3, len(accounts))
+
+        del accounts[30001]
+        self.assertEqual([20001, 20002], list(accounts))
+        self.assertEqual(2, len(accounts))
+
+if __name__ == "__main__":
+    unittest.main()
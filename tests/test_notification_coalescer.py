@@ -0,0 +1,149 @@
+"""
+Description: Unit tests for the NotificationCoalescer class.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_notification_coalescer.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import threading
+import time
+import unittest
+from patterns.observer.async_dispatcher import AsyncDispatcher
+from patterns.observer.notification_coalescer import NotificationCoalescer
+from patterns.observer.observer import Observer
+from bank_account.chequing_account import ChequingAccount
+
+
+class RecordingObserver(Observer):
+    """Observer that records the messages it receives."""
+
+    def __init__(self):
+        self.messages = []
+
+    def update(self, message):
+        self.messages.append(str(message))
+
+
+class FakeClock:
+    """Clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestNotificationCoalescer(unittest.TestCase):
+    """Test cases for NotificationCoalescer."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.observer = RecordingObserver()
+
+    def tearDown(self):
+        ChequingAccount.dispatcher = None
+
+    def account(self, coalescer, account_number=1):
+        ChequingAccount.dispatcher = coalescer
+        account = ChequingAccount(account_number, 1001, 100.0)
+        account.attach(self.observer)
+        return account
+
+    def test_repeats_merged_into_digest(self):
+        """Repeated alerts within the window become one digest."""
+        coalescer = NotificationCoalescer(window=60, clock=self.clock)
+        account = self.account(coalescer)
+
+        for _ in range(5):
+            account.deposit(15000)
+        self.assertEqual(["Large transaction $15000.00: on account 1."], self.observer.messages)
+
+        coalescer.flush()
+        self.assertEqual(2, len(self.observer.messages))
+        self.assertEqual("Large transaction $15000.00: on account 1. (repeated 4 more times in 60s)",
+                         self.observer.messages[1])
+        self.assertEqual(4, coalescer.suppressed)
+
+    def test_kinds_and_accounts_kept_apart(self):
+        """Different kinds, and the same kind on different accounts, are not merged."""
+        coalescer = NotificationCoalescer(window=60, clock=self.clock)
+        first = self.account(coalescer, 1)
+        second = self.account(coalescer, 2)
+
+        first.withdraw(90)
+        first.deposit(15000)
+        second.withdraw(90)
+
+        self.assertEqual(["Low balance warning $10.00: on account 1.",
+                          "Large transaction $15000.00: on account 1.",
+                          "Low balance warning $10.00: on account 2."],
+                         self.observer.messages)
+        self.assertEqual(0, coalescer.suppressed)
+
+    def test_new_window_after_expiry(self):
+        """A notification after the window closes is delivered after the digest."""
+        coalescer = NotificationCoalescer(window=60, clock=self.clock)
+        account = self.account(coalescer)
+
+        account.deposit(15000)
+        account.deposit(20000)
+        self.clock.now += 61
+        account.deposit(30000)
+
+        self.assertEqual(["Large transaction $15000.00: on account 1.",
+                          "Large transaction $20000.00: on account 1. (repeated 1 more time in 60s)",
+                          "Large transaction $30000.00: on account 1."],
+                         self.observer.messages)
+
+    def test_timer_delivers_digest(self):
+        """The digest is delivered when the window expires without another notification."""
+        coalescer = NotificationCoalescer(window=0.05)
+        account = self.account(coalescer)
+
+        account.deposit(15000)
+        account.deposit(15000)
+
+        deadline = time.monotonic() + 2
+        while len(self.observer.messages) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(2, len(self.observer.messages))
+
+    def test_downstream_dispatcher(self):
+        """Delivered notifications are passed to the downstream dispatcher."""
+        dispatcher = AsyncDispatcher()
+        coalescer = NotificationCoalescer(window=60, downstream=dispatcher, clock=self.clock)
+        account = self.account(coalescer)
+
+        account.deposit(15000)
+        account.deposit(15000)
+        self.assertTrue(coalescer.drain(timeout=2))
+        self.assertEqual(2, len(self.observer.messages))
+
+    def test_observers_run_without_lock(self):
+        """An observer can wait on another thread that notifies through the same coalescer."""
+        coalescer = NotificationCoalescer(window=60, clock=self.clock)
+        other = self.account(coalescer, 2)
+        finished = []
+
+        class WaitingObserver(Observer):
+            def update(self, message):
+                thread = threading.Thread(target=other.deposit, args=(15000,))
+                thread.start()
+                thread.join(timeout=2)
+                finished.append(not thread.is_alive())
+
+        observer = WaitingObserver()
+        account = ChequingAccount(1, 1001, 100.0)
+        account.attach(observer)
+        account.deposit(15000)
+
+        self.assertEqual([True], finished)
+        self.assertEqual(["Large transaction $15000.00: on account 2."], self.observer.messages)
+
+
+if __name__ == "__main__":
+    unittest.main()
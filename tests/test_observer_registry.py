@@ -0,0 +1,137 @@
+"""
+Description: Unit tests for the ObserverRegistry class and observer
+subscription on Subject.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_observer_registry.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import gc
+import unittest
+from patterns.observer.observer import Observer
+from patterns.observer.observer_registry import ObserverRegistry
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.savings_account import SavingsAccount
+from client.client import Client
+
+
+class RecordingObserver(Observer):
+    """Observer that records messages; instances compare equal to each other."""
+
+    def __init__(self):
+        self.messages = []
+
+    def update(self, message):
+        self.messages.append(str(message))
+
+    def __eq__(self, other):
+        return isinstance(other, RecordingObserver)
+
+    __hash__ = object.__hash__
+
+
+class TestObserverRegistry(unittest.TestCase):
+    """Test cases for ObserverRegistry."""
+
+    def test_insertion_order_and_identity(self):
+        """Observers are kept in attach order and distinguished by identity, not equality."""
+        registry = ObserverRegistry()
+        first, second = RecordingObserver(), RecordingObserver()
+
+        self.assertTrue(registry.add(first))
+        self.assertTrue(registry.add(second))
+        self.assertFalse(registry.add(first))
+        self.assertEqual([first, second], list(registry))
+
+        self.assertTrue(registry.discard(first))
+        self.assertFalse(registry.discard(first))
+        self.assertEqual([second], list(registry))
+
+    def test_snapshot_reused_until_change(self):
+        """The snapshot is only rebuilt after the registry changes."""
+        registry = ObserverRegistry()
+        registry.add(RecordingObserver())
+        snapshot = registry.snapshot()
+        self.assertIs(snapshot, registry.snapshot())
+
+        registry.add(RecordingObserver())
+        self.assertIsNot(snapshot, registry.snapshot())
+        self.assertEqual(1, len(snapshot))
+
+    def test_weak_reference_released(self):
+        """A weakly held observer is dropped once nothing else refers to it."""
+        registry = ObserverRegistry()
+        observer = RecordingObserver()
+        registry.add(observer, weak=True)
+        self.assertEqual(1, len(registry))
+
+        del observer
+        gc.collect()
+        self.assertFalse(registry)
+        self.assertEqual([], list(registry))
+
+    def test_client_weakly_attached(self):
+        """A Client attached weakly is not kept alive by the account."""
+        account = ChequingAccount(1, 1001, 100.0)
+        client = Client(1001, "Jane", "Doe", "jane@pixell.com", defer_validation=True)
+        account.attach(client, weak=True)
+        self.assertIn(client, account._observers)
+
+        del client
+        gc.collect()
+        self.assertFalse(account.has_observers())
+        self.assertEqual(0, len(account._observers))
+        account.deposit(15000)
+
+
+class TestSubscribeAll(unittest.TestCase):
+    """Test cases for class-level subscription on Subject."""
+
+    def setUp(self):
+        self.observer = RecordingObserver()
+
+    def tearDown(self):
+        ChequingAccount.unsubscribe_all(self.observer)
+        BankAccount.unsubscribe_all(self.observer)
+
+    def test_subscribe_to_one_type(self):
+        """A class subscriber hears every account of that type only."""
+        ChequingAccount.subscribe_all(self.observer)
+        chequing = ChequingAccount(1, 1001, 100.0)
+        savings = SavingsAccount(2, 1001, 100.0, None, None, 50.0)
+
+        self.assertTrue(chequing.has_observers())
+        self.assertFalse(savings.has_observers())
+
+        chequing.deposit(15000)
+        savings.deposit(15000)
+        self.assertEqual(["Large transaction $15000.00: on account 1."], self.observer.messages)
+
+    def test_subscribe_to_base_class(self):
+        """Subscribing to BankAccount covers every subclass, after attached observers."""
+        BankAccount.subscribe_all(self.observer)
+        attached = RecordingObserver()
+        account = SavingsAccount(2, 1001, 100.0, None, None, 50.0)
+        account.attach(attached)
+
+        account.deposit(15000)
+        self.assertEqual(1, len(self.observer.messages))
+        self.assertEqual(self.observer.messages, attached.messages)
+
+    def test_unsubscribe(self):
+        """An unsubscribed observer no longer hears the accounts."""
+        ChequingAccount.subscribe_all(self.observer)
+        ChequingAccount.unsubscribe_all(self.observer)
+        account = ChequingAccount(1, 1001, 100.0)
+
+        self.assertFalse(account.has_observers())
+        account.deposit(15000)
+        self.assertEqual([], self.observer.messages)
+
+
+if __name__ == "__main__":
+    unittest.main()
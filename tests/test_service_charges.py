@@ -0,0 +1,92 @@
+"""
+Description: Unit tests for the batch service charge calculations.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_service_charges.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import unittest
+from datetime import datetime
+import numpy as np
+from bank_account.account_table import AccountTable
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.service_charges import apply_service_charges, apply_table_service_charges
+from patterns.strategy.management_fee_strategy import ManagementFeeStrategy
+from patterns.strategy.minimum_balance_strategy import MinimumBalanceStrategy
+from patterns.strategy.overdraft_strategy import OverdraftStrategy
+
+BALANCES = np.array([-500.0, -50.0, 0.0, 49.99, 50.0, 100.0, 1.115, 615.0, 12345.67])
+
+
+class TestBatchServiceCharges(unittest.TestCase):
+    """Test cases for calculate_service_charges_batch and the batch drivers."""
+
+    def accounts(self):
+        return [
+            ChequingAccount(1, 1001, 20.0, None, 50.0, -100.0),
+            ChequingAccount(2, 1001, -200.0, None, 50.0, -100.0),
+            SavingsAccount(3, 1002, 10.0, None, None, 100.0),
+            InvestmentAccount(4, 1002, 615.0, None, 5.0),
+        ]
+
+    def test_overdraft_batch_matches_scalar(self):
+        """OverdraftStrategy batch results equal the scalar results."""
+        strategy = OverdraftStrategy(100.0, 0.50, -100.0)
+        expected = [strategy.calculate_service_charges(balance) for balance in BALANCES]
+        self.assertEqual(expected, strategy.calculate_service_charges_batch(BALANCES).tolist())
+
+    def test_minimum_balance_batch_matches_scalar(self):
+        """MinimumBalanceStrategy batch results equal the scalar results."""
+        strategy = MinimumBalanceStrategy(50.0, 0.50)
+        expected = [strategy.calculate_service_charges(ChequingAccount(1, 1, balance))
+                    for balance in BALANCES]
+        self.assertEqual(expected, strategy.calculate_service_charges_batch(BALANCES).tolist())
+
+    def test_management_fee_batch_matches_scalar(self):
+        """ManagementFeeStrategy batch results equal the scalar results, including rounding."""
+        strategy = ManagementFeeStrategy(annual_fee_percent=0.001)
+        balances = np.concatenate([BALANCES, np.arange(0.005, 5000.0, 0.37)])
+        expected = [strategy.calculate_service_charges(ChequingAccount(1, 1, balance))
+                    for balance in balances]
+        self.assertEqual(expected, strategy.calculate_service_charges_batch(balances).tolist())
+
+    def test_batch_params_override_per_account(self):
+        """Per-account parameter arrays override the strategy's own settings."""
+        strategy = OverdraftStrategy(100.0, 0.50, -100.0)
+        charges = strategy.calculate_service_charges_batch(
+            np.array([-60.0, -60.0]), {"overdraft_limit": np.array([-50.0, -100.0])})
+        self.assertEqual([1.5, 1.0], charges.tolist())
+
+    def test_apply_service_charges_to_accounts(self):
+        """Each account is charged exactly what get_service_charges() returns."""
+        accounts = self.accounts()
+        expected = {account.account_number: account.get_service_charges() for account in accounts}
+        balances = [account.balance for account in accounts]
+
+        self.assertEqual(expected, apply_service_charges(accounts))
+        for account, balance in zip(accounts, balances):
+            self.assertAlmostEqual(balance - expected[account.account_number], account.balance)
+
+    def test_apply_table_service_charges(self):
+        """A table is charged the same as the equivalent account objects."""
+        accounts = self.accounts()
+        table = AccountTable.from_accounts(accounts)
+        expected = [account.get_service_charges() for account in accounts]
+
+        self.assertEqual(expected, apply_table_service_charges(table).tolist())
+        self.assertAlmostEqual(20.0 - expected[0], table.balance[0])
+
+    def test_investment_accounts_share_strategy(self):
+        """Investment accounts opened on different dates share one strategy instance."""
+        first = InvestmentAccount(5, 1002, 100.0, datetime(2020, 5, 10), 5.0)
+        second = InvestmentAccount(6, 1002, 200.0, datetime(2000, 8, 15), 5.0)
+        self.assertIs(first.service_charge_strategy, second.service_charge_strategy)
+
+
+if __name__ == "__main__":
+    unittest.main()
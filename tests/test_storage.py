@@ -0,0 +1,136 @@
+"""
+Description: Unit tests for the storage backends.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_storage.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from user_interface.storage import SqliteBackend
+
+CLIENTS_CSV = (
+    "client_number,first_name,last_name,email_address\n"
+    "1001,Ann,Lee,ann@example.com\n"
+    "1002,Bo,Chan,bo@example.com\n"
+    "1003,,Missing,missing@example.com\n"
+)
+
+ACCOUNTS_CSV = (
+    "account_number,client_number,balance,date_created,account_type,"
+    "overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+    "20001,1001,150.0,2023-01-10,ChequingAccount,-50.0,0.035,Null,Null\n"
+    "20003,1002,1200.87,2023-02-01,InvestmentAccount,Null,Null,Null,2.55\n"
+    "20004,1002,12.5,2023-02-30,ChequingAccount,-100.0,0.035,Null,Null\n"
+    "20005,1002,40.0,2023-02-01,ChequingAccount,-100.0,0.035,Null,Null\n"
+    "20006,9999,12.5,2023-02-01,InvestmentAccount,Null,Null,Null,1.0\n"
+)
+
+
+class TestSqliteBackend(unittest.TestCase):
+    """Test cases for SqliteBackend."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        clients_path = os.path.join(self.directory.name, "clients.csv")
+        accounts_path = os.path.join(self.directory.name, "accounts.csv")
+        with open(clients_path, "w", newline="") as file:
+            file.write(CLIENTS_CSV)
+        with open(accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS_CSV)
+
+        patcher = patch("user_interface.manage_data.logging.error")
+        self.log_error = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.path = os.path.join(self.directory.name, "bank.db")
+        self.backend = SqliteBackend(self.path)
+        self.imported = self.backend.import_csv(clients_path, accounts_path)
+
+    def tearDown(self):
+        self.backend.close()
+        self.directory.cleanup()
+
+    def test_import_skips_invalid_rows(self):
+        """Rows load_data would reject for their own values are not imported."""
+        self.assertEqual((2, 4), self.imported)
+        self.assertEqual(2, self.log_error.call_count)
+        self.assertEqual("wal", self.backend.query("PRAGMA journal_mode")[0][0])
+
+    def test_accounts_for_client(self):
+        """A client's accounts are built from an indexed query."""
+        clients, accounts = self.backend.load()
+
+        self.assertIn(1002, clients)
+        self.assertNotIn(1003, clients)
+        self.assertEqual("Bo", clients[1002].first_name)
+
+        client_accounts = accounts.accounts_for_client(1002)
+        self.assertEqual([20003, 20005], [account.account_number for account in client_accounts])
+        self.assertIsInstance(client_accounts[0], InvestmentAccount)
+        self.assertIs(client_accounts[1], accounts[20005])
+
+        plan = " ".join(row[3] for row in self.backend.query(
+            "EXPLAIN QUERY PLAN SELECT * FROM accounts WHERE client_number = ?", (1002,)))
+        self.assertIn("accounts_client_number", plan)
+
+    def test_account_without_client_rejected(self):
+        """Accounts whose client does not exist are not returned."""
+        _, accounts = self.backend.load()
+        self.assertNotIn(20006, accounts)
+        self.assertEqual([], accounts.accounts_for_client(9999))
+
+    def test_balance_updates_persist(self):
+        """Saved balances are read back by a new connection."""
+        _, accounts = self.backend.load()
+        account = accounts[20001]
+        account.update_balance(25.0)
+        self.backend.update_balance(account)
+
+        second = accounts[20005]
+        second.update_balance(-10.0)
+        self.assertEqual(1, self.backend.update_balances([second]))
+
+        reopened = SqliteBackend(self.path)
+        _, reloaded = reopened.load()
+        self.assertEqual(175.0, reloaded[20001].balance)
+        self.assertEqual(30.0, reloaded[20005].balance)
+        reopened.close()
+
+    def test_store_new_account(self):
+        """Storing an account that is not in the database inserts it."""
+        _, accounts = self.backend.load()
+        account = ChequingAccount(20010, 1001, 5.0, None, -25.0, 0.05)
+
+        accounts[20010] = account
+        self.assertEqual([20001, 20010], accounts.account_numbers_for_client(1001))
+
+        del accounts[20010]
+        self.assertNotIn(20010, accounts)
+
+    def test_stored_accounts_reload_unchanged(self):
+        """Inserted accounts are rebuilt with the same fields, and replacing one saves its client."""
+        _, accounts = self.backend.load()
+        accounts[20010] = ChequingAccount(20010, 1001, 5.0, None, -25.0, 0.05)
+        accounts[20011] = InvestmentAccount(20011, 1001, 7.5, None, 1.25)
+        accounts[20005] = ChequingAccount(20005, 1001, 40.0, None, -100.0, 0.035)
+
+        reopened = SqliteBackend(self.path)
+        _, reloaded = reopened.load()
+        chequing = reloaded[20010]
+        self.assertIsInstance(chequing, ChequingAccount)
+        self.assertEqual((5.0, -25.0, 0.05), (chequing.balance, chequing.minimum_balance, chequing.overdraft_limit))
+        self.assertEqual(1.25, reloaded[20011].management_fee)
+        self.assertEqual([20001, 20005, 20010, 20011], reloaded.account_numbers_for_client(1001))
+        reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+Description: Unit tests for the TransactionJournal class.
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_transaction_journal.py
+"""
+
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+
+import copy
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.transaction_journal import TransactionJournal
+
+
+class TestTransactionJournal(unittest.TestCase):
+    """Test cases for TransactionJournal."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "accounts.journal")
+        self.journal = TransactionJournal(self.path)
+
+    def tearDown(self):
+        BankAccount.journal = None
+        self.journal.close()
+        self.directory.cleanup()
+
+    def test_account_operations_recorded(self):
+        """deposit, withdraw, debit and update_balance each append one record."""
+        BankAccount.journal = self.journal
+        account = SavingsAccount(30001, 1001, 1000.0, None, None, 50.0)
+
+        account.deposit(200.0)
+        account.withdraw(100.0)
+        account.debit(50.0)
+        account.update_balance(-5.0)
+
+        records = list(self.journal.records())
+        self.assertEqual([1, 2, 3, 4], [record.sequence for record in records])
+        self.assertEqual([TransactionJournal.DEPOSIT, TransactionJournal.WITHDRAW,
+                          TransactionJournal.DEBIT, TransactionJournal.UPDATE],
+                         [record.operation for record in records])
+        self.assertEqual([200.0, -100.0, -50.0, -5.0], [record.amount for record in records])
+        self.assertEqual([1200.0, 1100.0, 1050.0, 1045.0], [record.balance for record in records])
+
+    def test_copies_not_recorded(self):
+        """Changes to a copy of an account are not journaled under its account number."""
+        BankAccount.journal = self.journal
+        account = ChequingAccount(20001, 1001, 100.0)
+
+        for duplicate in (copy.copy(account), copy.deepcopy(account)):
+            duplicate.deposit(50.0)
+            self.assertEqual(150.0, duplicate.balance)
+        account.deposit(1.0)
+
+        self.assertEqual(101.0, account.balance)
+        self.assertEqual([101.0], [record.balance for record in self.journal.records()])
+
+    def test_replay_restores_last_balance(self):
+        """Replay sets each account to its last journaled balance."""
+        self.journal.append(TransactionJournal.DEPOSIT, 1, 50.0, 150.0)
+        self.journal.append(TransactionJournal.WITHDRAW, 1, -20.0, 130.0)
+        self.journal.append(TransactionJournal.DEPOSIT, 99, 10.0, 10.0)
+        accounts = {1: ChequingAccount(1, 1001, 100.0), 2: ChequingAccount(2, 1001, 5.0)}
+
+        self.assertEqual(1, self.journal.replay(accounts))
+        self.assertEqual(130.0, accounts[1].balance)
+        self.assertEqual(5.0, accounts[2].balance)
+
+    def test_torn_tail_cut_off(self):
+        """A partly written record is ignored and removed on reopening."""
+        self.journal.append(TransactionJournal.DEPOSIT, 1, 50.0, 150.0)
+        self.journal.append(TransactionJournal.DEPOSIT, 1, 50.0, 200.0)
+        self.journal.close()
+        with open(self.path, "ab") as file:
+            file.write(b"\x03\x00\x00")
+
+        journal = TransactionJournal(self.path)
+        self.assertEqual(2, journal.last_sequence)
+        self.assertEqual(TransactionJournal.HEADER_SIZE + 2 * TransactionJournal.RECORD_SIZE,
+                         os.path.getsize(self.path))
+
+        journal.append(TransactionJournal.DEPOSIT, 1, 50.0, 250.0)
+        self.assertEqual([1, 2, 3], [record.sequence for record in journal.records()])
+        journal.close()
+
+    def test_corrupt_record_stops_reading(self):
+        """Records after one that fails its checksum are not read."""
+        for balance in (1.0, 2.0, 3.0):
+            self.journal.append(TransactionJournal.UPDATE, 1, 1.0, balance)
+        self.journal.close()
+
+        with open(self.path, "r+b") as file:
+            file.seek(TransactionJournal.HEADER_SIZE + TransactionJournal.RECORD_SIZE + 10)
+            file.write(b"\xff")
+
+        self.assertEqual([1.0], [record.balance for record in self.journal.records()])
+
+    def test_not_a_journal(self):
+        """Opening a file that is not a journal raises ValueError."""
+        with open(self.path, "wb") as file:
+            file.write(b"account_number,balance\n")
+        with self.assertRaises(ValueError):
+            TransactionJournal(self.path)
+
+    def test_group_commit(self):
+        """Concurrent appends share fsyncs and every record is written once."""
+        journal = TransactionJournal(self.path, commit_delay=0.01)
+        threads = [threading.Thread(target=journal.append, args=(TransactionJournal.DEPOSIT, n, 1.0, 1.0))
+                   for n in range(20)]
+
+        with patch("bank_account.transaction_journal.os.fsync") as fsync:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertLess(fsync.call_count, 20)
+        self.assertEqual(list(range(1, 21)), sorted(record.sequence for record in journal.records()))
+        journal.close()
+
+    def test_append_many_writes_one_batch(self):
+        """append_many writes its records in order with a single fsync."""
+        records = [(TransactionJournal.CHECKPOINT, n, 0.0, float(n)) for n in (5, 3, 4)]
+
+        with patch("bank_account.transaction_journal.os.fsync") as fsync:
+            self.assertEqual(3, self.journal.append_many(records))
+
+        self.assertEqual(1, fsync.call_count)
+        self.assertEqual({5: 5.0, 3: 3.0, 4: 4.0}, self.journal.balances())
+        self.assertEqual(3, self.journal.append_many([]))
+
+    def test_shared_by_two_writers(self):
+        """Two journals appending to one file continue each other's numbering."""
+        other = TransactionJournal(self.path)
+        threads = [threading.Thread(target=journal.append, args=(TransactionJournal.DEPOSIT, n, 1.0, 1.0))
+                   for n in range(10) for journal in (self.journal, other)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(list(range(1, 21)), [record.sequence for record in self.journal.records()])
+        self.assertEqual(21, other.append(TransactionJournal.DEPOSIT, 1, 1.0, 2.0))
+        self.assertEqual(22, self.journal.append(TransactionJournal.DEPOSIT, 1, 1.0, 3.0))
+        other.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,7 @@
 __author__ = "Komalpreet Kaur"
 __version__ = "1.0.0"
 
-from PySide6.QtWidgets import QMainWindow, QWidget, QGridLayout, QLabel, QLineEdit, QPushButton, QTableWidget, QComboBox
+from PySide6.QtWidgets import QMainWindow, QWidget, QGridLayout, QLabel, QLineEdit, QPushButton, QTableView, QComboBox
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
@@ -41,7 +41,7 @@ class LookupWindow(QMainWindow):
         self.lookup_button.setDefault(True)
 
         self.client_info_label = QLabel()
-        self.account_table = QTableWidget()
+        self.account_table = QTableView()
         self.prompt_label.setAlignment(Qt.AlignCenter)
         self.client_number_edit.setAlignment(Qt.AlignCenter)
         self.client_info_label.setAlignment(Qt.AlignCenter)
@@ -74,8 +74,7 @@ class LookupWindow(QMainWindow):
         layout.addWidget(self.filter_edit, 6, 1)
         layout.addWidget(self.filter_button, 6, 2)
 
-        self.account_table.setColumnCount(4)
-        self.account_table.setHorizontalHeaderLabels(COLUMN_HEADERS)                
+        # Column headers are supplied by the model the subclass sets on account_table
         self.account_table.horizontalHeader().setFont(bold_font)
         self.account_table.resizeColumnsToContents()
         self.account_table.resizeRowsToContents()
@@ -93,7 +92,9 @@ class LookupWindow(QMainWindow):
 
         Note that the function does not return anything.
         """
-        self.account_table.setRowCount(0)
+        model = self.account_table.model()
+        if model is not None:
+            model.removeRows(0, model.rowCount())
         self.client_number_edit.clear()
         self.client_info_label.setText("")
         self.client_info_label.setFocus()
@@ -11,11 +11,15 @@ from ui_superclasses.details_window import DetailsWindow
 from PySide6.QtWidgets import QMessageBox
 from PySide6.QtCore import Signal
 from bank_account.bank_account import BankAccount
-import copy
+from bank_account.account_edit_session import AccountEditSession
 
 class AccountDetailsWindow(DetailsWindow):
     """
     A class used to display account details and perform bank account transactions.
+
+    Transactions are recorded in an AccountEditSession and applied to the
+    account together when the user exits; closing the window any other way
+    discards them.
     """
 
     # Custom signal emitted when the user exits the window
@@ -31,13 +35,13 @@ class AccountDetailsWindow(DetailsWindow):
         """
         super().__init__()
 
-        # Store original + working copy
-        self.original_account = account
-        self.account = copy.deepcopy(account)
+        # Record transactions against the account without changing it yet
+        self.account = account
+        self.session = AccountEditSession(account)
 
         # Display account number and current balance
         self.account_number_label.setText(str(self.account.account_number))
-        self.balance_label.setText(str(self.account.balance))
+        self.balance_label.setText(str(self.session.balance))
 
         # Connect UI buttons to event handlers
         self.deposit_button.clicked.connect(self.on_deposit)
@@ -66,8 +70,8 @@ class AccountDetailsWindow(DetailsWindow):
                                 "Deposit amount must be positive.")
             return
 
-        self.account.deposit(amount)
-        self.balance_label.setText(str(self.account.balance))
+        self.session.deposit(amount)
+        self.balance_label.setText(str(self.session.balance))
 
     # ============================================================
     # EVENT HANDLER: WITHDRAW
@@ -87,23 +91,57 @@ class AccountDetailsWindow(DetailsWindow):
                                 "Transaction amount must be numeric.")
             return
         
-        if not self.account.withdraw(amount):
-            QMessageBox.warning(self, "Withdrawal Denied",
-                                "This withdrawal violates account rules.")
+        try:
+            self.session.withdraw(amount)
+        except ValueError as e:
+            QMessageBox.warning(self, "Withdrawal Denied", str(e))
             return
 
-        self.balance_label.setText(str(self.account.balance))
+        self.balance_label.setText(str(self.session.balance))
 
     # ============================================================
     # EVENT HANDLER: EXIT BUTTON CLICKED
     # ============================================================
     def on_exit(self):
         """
-        Emits the balance_updated signal so that the Lookup Window
+        Applies the recorded transactions to the account and, if any were
+        applied, emits the balance_updated signal so that the Lookup Window
         can update both the CSV file and the displayed table.
 
         Returns:
             None
         """
-        self.balance_updated.emit(self.account)
+        try:
+            applied = self.session.commit()
+        except ValueError as e:
+            QMessageBox.warning(self, "Transactions Not Applied",
+                                f"The account changed while it was open, so no transaction was applied: {e}")
+            self.session.rollback()
+            applied = 0
+
+        if applied:
+            self.balance_updated.emit(self.account)
         self.close()
+
+    # ============================================================
+    # EVENT HANDLERS: WINDOW CLOSED WITHOUT EXIT
+    # ============================================================
+    def reject(self):
+        """
+        Discards the recorded transactions when the window is cancelled (Esc).
+
+        Returns:
+            None
+        """
+        self.session.rollback()
+        super().reject()
+
+    def closeEvent(self, event):
+        """
+        Discards any recorded transactions not applied by Exit.
+
+        Args:
+            event (QCloseEvent): The close event.
+        """
+        self.session.rollback()
+        super().closeEvent(event)
@@ -0,0 +1,273 @@
+"""
+Description: Provides the AccountFile class, a fixed-record binary copy of
+accounts.csv stored as a NumPy structured array (.npy). The file is memory-mapped,
+so it is read without parsing any text and single balances are updated in place.
+Run this module to convert between the two formats:
+
+    python -m user_interface.account_file to-binary data/accounts.csv data/accounts.npy
+    python -m user_interface.account_file to-csv data/accounts.npy data/accounts.csv
+"""
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+__credits__ = ""
+
+import argparse
+import csv
+import logging
+import math
+import os
+from datetime import datetime
+
+import numpy as np
+
+from utility.file_lock import file_lock
+
+# Account type names, indexed by the account_type code stored in each record
+ACCOUNT_TYPES = ("ChequingAccount", "SavingsAccount", "InvestmentAccount")
+
+# Columns each account type must have a number in, as load_data requires
+REQUIRED_FIELDS = {
+    "ChequingAccount": ("overdraft_limit", "overdraft_rate"),
+    "SavingsAccount": ("minimum_balance",),
+    "InvestmentAccount": ("management_fee",),
+}
+
+OPTIONAL_FIELDS = ("overdraft_limit", "overdraft_rate", "minimum_balance", "management_fee")
+
+class AccountFile:
+    """
+    A binary accounts file with one fixed-size record per account.
+
+    Missing values (the "Null" placeholders of accounts.csv) are stored as
+    NaN. Records keep the order of the CSV file; a sorted index of account
+    numbers is built on the first balance update. Writes hold the file's
+    advisory lock (see utility.file_lock).
+
+    Attributes:
+        DTYPE (numpy.dtype): The record layout.
+    """
+
+    DTYPE = np.dtype([
+        ("account_number", "<i8"),
+        ("client_number", "<i8"),
+        ("balance", "<f8"),
+        ("date_created", "<M8[D]"),
+        ("account_type", "i1"),
+        ("overdraft_limit", "<f8"),
+        ("overdraft_rate", "<f8"),
+        ("minimum_balance", "<f8"),
+        ("management_fee", "<f8"),
+    ])
+
+    def __init__(self, path: str):
+        """
+        Initializes an AccountFile for the given path.
+
+        Args:
+            path (str): Path of the .npy file.
+        """
+        self.path = path
+        self._records = None
+        self._file_key = None
+        self._sorted_rows = None
+        self._sorted_numbers = None
+
+    def exists(self) -> bool:
+        """Return True if the file exists."""
+        return os.path.exists(self.path)
+
+    def records(self) -> np.ndarray:
+        """
+        Returns the records, memory-mapped for reading and writing.
+
+        Returns:
+            numpy.memmap: One record per account, with DTYPE fields.
+
+        Raises:
+            ValueError: If the file does not hold account records.
+        """
+        stat = os.stat(self.path)
+        key = (stat.st_ino, stat.st_size)
+
+        if self._records is None or key != self._file_key:
+            records = np.load(self.path, mmap_mode="r+")
+            if records.dtype != self.DTYPE:
+                raise ValueError(f"{self.path} is not an account file.")
+            self._records = records
+            self._file_key = key
+            self._sorted_rows = None
+            self._sorted_numbers = None
+
+        return self._records
+
+    def write(self, records: np.ndarray) -> None:
+        """
+        Replaces the file with the given records, writing a temporary file
+        which atomically replaces the old one.
+
+        Args:
+            records (numpy.ndarray): Records with DTYPE fields.
+        """
+        with file_lock(self.path):
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "wb") as file:
+                np.save(file, np.asarray(records, dtype=self.DTYPE))
+                file.flush()
+                os.fsync(file.fileno())
+
+            self._records = None
+            os.replace(temp_path, self.path)
+
+    def update_balance(self, account_number: int, balance: float) -> bool:
+        """
+        Writes one balance in place.
+
+        Args:
+            account_number (int): The account to update.
+            balance (float): The new balance.
+
+        Returns:
+            bool: True if the account was found and updated.
+        """
+        return self.update_balances({account_number: balance}) == 1
+
+    def update_balances(self, balances: dict) -> int:
+        """
+        Writes many balances in place and flushes them to disk.
+
+        Args:
+            balances (dict[int, float]): New balances keyed by account number.
+
+        Returns:
+            int: The number of accounts found and updated.
+        """
+        if not balances:
+            return 0
+
+        numbers = np.fromiter(balances.keys(), dtype=np.int64, count=len(balances))
+        values = np.fromiter(balances.values(), dtype=np.float64, count=len(balances))
+
+        with file_lock(self.path):
+            records = self.records()
+            if not len(records):
+                return 0
+
+            if self._sorted_rows is None:
+                self._sorted_rows = np.argsort(records["account_number"], kind="stable")
+                self._sorted_numbers = np.asarray(records["account_number"])[self._sorted_rows]
+
+            positions = np.minimum(np.searchsorted(self._sorted_numbers, numbers), len(records) - 1)
+            found = self._sorted_numbers[positions] == numbers
+
+            records["balance"][self._sorted_rows[positions[found]]] = values[found]
+            records.flush()
+
+            # Writes through the memory map need not change the modification time,
+            # which load_data compares with accounts.csv
+            os.utime(self.path)
+            return int(found.sum())
+
+def record_from_row(row: dict) -> tuple:
+    """
+    Converts one accounts.csv row to a record, applying the checks load_data
+    applies to the row's own values.
+
+    Args:
+        row (dict[str, str]): The row, keyed by column name.
+
+    Returns:
+        tuple: The record values, in AccountFile.DTYPE order.
+
+    Raises:
+        ValueError: If a number, the date or the account type is invalid.
+    """
+    account_type = row["account_type"]
+    if account_type not in REQUIRED_FIELDS:
+        raise ValueError(f"Invalid account type: {account_type}")
+
+    optional = {}
+    for name in OPTIONAL_FIELDS:
+        try:
+            optional[name] = float(row[name])
+        except (TypeError, ValueError):
+            if name in REQUIRED_FIELDS[account_type]:
+                raise
+            optional[name] = math.nan
+
+    return (
+        int(row["account_number"]),
+        int(row["client_number"]),
+        float(row["balance"]),
+        np.datetime64(datetime.strptime(row["date_created"], "%Y-%m-%d").date(), "D"),
+        ACCOUNT_TYPES.index(account_type),
+        *(optional[name] for name in OPTIONAL_FIELDS),
+    )
+
+def csv_to_binary(csv_path: str, path: str) -> int:
+    """
+    Converts accounts.csv to an account file. Rows load_data would reject
+    for their own values are logged and left out; rows are not checked
+    against clients.csv, which load_data still does.
+
+    Args:
+        csv_path (str): Path of the CSV file to read.
+        path (str): Path of the account file to write.
+
+    Returns:
+        int: The number of records written.
+    """
+    records = []
+
+    with open(csv_path, newline="") as csvfile:
+        for row in csv.DictReader(csvfile):
+            try:
+                records.append(record_from_row(row))
+            except (KeyError, TypeError, ValueError) as e:
+                logging.error(f"Account row not converted {row}: {e}")
+
+    AccountFile(path).write(np.array(records, dtype=AccountFile.DTYPE))
+    return len(records)
+
+def binary_to_csv(path: str, csv_path: str) -> int:
+    """
+    Converts an account file back to the accounts.csv layout, writing
+    "Null" for missing values.
+
+    Args:
+        path (str): Path of the account file to read.
+        csv_path (str): Path of the CSV file to write.
+
+    Returns:
+        int: The number of rows written.
+    """
+    records = AccountFile(path).records()
+    fieldnames = [name for name in AccountFile.DTYPE.names]
+
+    def text(value):
+        return "Null" if isinstance(value, float) and math.isnan(value) else value
+
+    with open(csv_path, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+
+        for record in records.tolist():
+            values = dict(zip(fieldnames, record))
+            values["date_created"] = values["date_created"].isoformat()
+            values["account_type"] = ACCOUNT_TYPES[values["account_type"]]
+            writer.writerow([text(values[name]) for name in fieldnames])
+
+    return len(records)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert between accounts.csv and the binary account file.")
+    parser.add_argument("direction", choices=("to-binary", "to-csv"))
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    arguments = parser.parse_args()
+
+    if arguments.direction == "to-binary":
+        count = csv_to_binary(arguments.source, arguments.destination)
+    else:
+        count = binary_to_csv(arguments.source, arguments.destination)
+
+    print(f"{count} accounts written to {arguments.destination}")
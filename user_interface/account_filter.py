@@ -0,0 +1,221 @@
+"""
+Description: Provides the filter engine behind the lookup window's filter
+controls: parse_filter turns the text typed for a column into a FilterQuery,
+and AccountFilterIndex answers queries from per-column sorted indexes, so a
+query costs a binary search plus the matching rows instead of a scan.
+"""
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+__credits__ = ""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import NamedTuple
+
+# Columns, in AccountTableModel order
+ACCOUNT_NUMBER, BALANCE, DATE_CREATED, ACCOUNT_TYPE = range(4)
+
+# Sorts after every character a prefix can be followed by
+_PREFIX_END = "\U0010ffff"
+
+class FilterQuery(NamedTuple):
+    """
+    A parsed filter for one column.
+
+    A prefix query matches accounts whose displayed text starts with low
+    (case-insensitively). A range query matches accounts whose value lies
+    between low and high, either of which may be None for an open end;
+    an equality query is a range whose ends are equal and included.
+
+    Attributes:
+        column (int): The column filtered.
+        prefix (bool): True for a prefix query, False for a range query.
+        low: The prefix, or the lower bound of the range.
+        high: The upper bound of the range (None for prefix queries).
+        include_low (bool): Whether a value equal to low matches.
+        include_high (bool): Whether a value equal to high matches.
+    """
+
+    column: int
+    prefix: bool
+    low: object
+    high: object = None
+    include_low: bool = True
+    include_high: bool = True
+
+def _parse_value(column: int, text: str):
+    """
+    Converts query text to a value of a column.
+
+    Raises:
+        ValueError: If the text is not a value of the column.
+    """
+    text = text.strip()
+    if column == ACCOUNT_NUMBER:
+        return int(text)
+    if column == BALANCE:
+        return float(text)
+    if column == DATE_CREATED:
+        return datetime.strptime(text, "%Y-%m-%d")
+    return text.lower()
+
+def parse_filter(column: int, text: str) -> FilterQuery:
+    """
+    Parses the filter text typed for a column:
+
+        =value        equal to value
+        low..high     between low and high, inclusive; either end may be left out
+        >value, >=value, <value, <=value
+        anything else the displayed text starts with (case-insensitive)
+
+    Dates are written YYYY-MM-DD.
+
+    Args:
+        column (int): The column filtered.
+        text (str): The filter text.
+
+    Returns:
+        FilterQuery: The query.
+
+    Raises:
+        ValueError: If a value is not valid for the column.
+    """
+    text = text.strip()
+
+    if text.startswith("="):
+        value = _parse_value(column, text[1:])
+        return FilterQuery(column, False, value, value)
+
+    for operator in (">=", "<=", ">", "<"):
+        if text.startswith(operator):
+            value = _parse_value(column, text[len(operator):])
+            inclusive = operator.endswith("=")
+            if operator.startswith(">"):
+                return FilterQuery(column, False, value, None, include_low=inclusive)
+            return FilterQuery(column, False, None, value, include_high=inclusive)
+
+    if ".." in text:
+        low, high = text.split("..", 1)
+        return FilterQuery(column, False,
+                           _parse_value(column, low) if low.strip() else None,
+                           _parse_value(column, high) if high.strip() else None)
+
+    return FilterQuery(column, True, text.lower())
+
+def _narrows(query: FilterQuery, previous: FilterQuery) -> bool:
+    """Return True if every account matching query also matches previous."""
+    if query.column != previous.column or query.prefix != previous.prefix:
+        return False
+
+    if query.prefix:
+        return query.low.startswith(previous.low)
+
+    low_inside = previous.low is None or (query.low is not None and (
+        query.low > previous.low or (query.low == previous.low and (previous.include_low or not query.include_low))))
+    high_inside = previous.high is None or (query.high is not None and (
+        query.high < previous.high or (query.high == previous.high and (previous.include_high or not query.include_high))))
+    return low_inside and high_inside
+
+class AccountFilterIndex:
+    """
+    Sorted indexes over a list of accounts, built per column on first use.
+
+    Each column has a text index (displayed text, lower case) for prefix
+    queries and a value index for range queries. A query matches one
+    contiguous slice of an index, found by binary search. When a query
+    narrows the previous one (e.g. the user typed one more character), the
+    search is confined to the previous slice.
+    """
+
+    def __init__(self, accounts: list):
+        """
+        Initializes the index.
+
+        Args:
+            accounts (list[BankAccount]): The accounts; matches are positions in this list.
+        """
+        self._accounts = accounts
+        self._indexes = {}
+        self._last = None
+
+    def invalidate(self, column: int = None) -> None:
+        """
+        Discards the indexes of one column, or of every column, after the
+        accounts changed.
+
+        Args:
+            column (int): The column whose values changed, or None for all.
+        """
+        if column is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop((column, True), None)
+            self._indexes.pop((column, False), None)
+        self._last = None
+
+    def matching(self, query: FilterQuery) -> list[int]:
+        """
+        Returns the positions of the accounts matching a query.
+
+        Args:
+            query (FilterQuery): The query.
+
+        Returns:
+            list[int]: Positions in the account list, in ascending order.
+        """
+        keys, positions = self._index(query.column, query.prefix)
+        lo, hi = 0, len(keys)
+
+        if self._last is not None and _narrows(query, self._last[0]):
+            _, lo, hi = self._last
+
+        if query.prefix:
+            start = bisect_left(keys, query.low, lo, hi)
+            end = bisect_left(keys, query.low + _PREFIX_END, start, hi)
+        else:
+            if query.low is None:
+                start = lo
+            elif query.include_low:
+                start = bisect_left(keys, query.low, lo, hi)
+            else:
+                start = bisect_right(keys, query.low, lo, hi)
+
+            if query.high is None:
+                end = hi
+            elif query.include_high:
+                end = bisect_right(keys, query.high, start, hi)
+            else:
+                end = bisect_left(keys, query.high, start, hi)
+
+        self._last = (query, start, end)
+        return sorted(positions[start:end])
+
+    def _index(self, column: int, textual: bool) -> tuple[list, list[int]]:
+        """Return the sorted keys of a column and the account position of each key."""
+        index = self._indexes.get((column, textual))
+        if index is None:
+            entries = []
+            for position, account in enumerate(self._accounts):
+                key = self._key(account, column, textual)
+                if key is not None:
+                    entries.append((key, position))
+            entries.sort()
+            index = self._indexes[(column, textual)] = ([key for key, _ in entries],
+                                                        [position for _, position in entries])
+        return index
+
+    @staticmethod
+    def _key(account, column: int, textual: bool):
+        """Return an account's index key for a column, or None if it has no value."""
+        if column == ACCOUNT_NUMBER:
+            value = account.account_number
+        elif column == BALANCE:
+            value = account.balance
+        elif column == DATE_CREATED:
+            value = account.date_created
+        else:
+            value = account.__class__.__name__.lower()
+
+        if textual:
+            return str(value).lower()
+        return value
@@ -0,0 +1,106 @@
+"""
+Description: Provides the AccountStore class, a dictionary-like container of
+BankAccount objects keyed by account_number that also maintains a secondary
+index from client_number to the client's account numbers.
+"""
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+__credits__ = ""
+
+from collections.abc import MutableMapping
+
+from bank_account.bank_account import BankAccount
+
+class AccountStore(MutableMapping):
+    """
+    A mapping of account_number -> BankAccount with a maintained
+    client_number -> [account_number] index.
+
+    The index is kept in step with every add, replace and remove, so
+    looking up a client's accounts costs only as much as the number of
+    accounts that client owns instead of a scan over every account.
+    """
+
+    def __init__(self, accounts=None):
+        """
+        Initializes the store, optionally from an existing mapping of accounts.
+
+        Args:
+            accounts (dict[int, BankAccount]): Initial accounts (optional).
+        """
+        self._accounts = {}
+        self._client_index = {}
+
+        if accounts is not None:
+            self.update(accounts)
+
+    def __getitem__(self, account_number: int) -> BankAccount:
+        return self._accounts[account_number]
+
+    def __setitem__(self, account_number: int, account: BankAccount) -> None:
+        previous = self._accounts.get(account_number)
+
+        if previous is not None and previous.client_number != account.client_number:
+            self._unindex(previous.client_number, account_number)
+
+        self._accounts[account_number] = account
+
+        if previous is None or previous.client_number != account.client_number:
+            self._client_index.setdefault(account.client_number, []).append(account_number)
+
+    def __delitem__(self, account_number: int) -> None:
+        account = self._accounts.pop(account_number)
+        self._unindex(account.client_number, account_number)
+
+    def __iter__(self):
+        return iter(self._accounts)
+
+    def __len__(self) -> int:
+        return len(self._accounts)
+
+    def __contains__(self, account_number) -> bool:
+        return account_number in self._accounts
+
+    def account_numbers_for_client(self, client_number: int) -> list[int]:
+        """
+        Returns the account numbers owned by a client.
+
+        Args:
+            client_number (int): The client to look up.
+
+        Returns:
+            list[int]: Account numbers in the order they were added.
+        """
+        return list(self._client_index.get(client_number, ()))
+
+    def accounts_for_client(self, client_number: int) -> list[BankAccount]:
+        """
+        Returns the BankAccount objects owned by a client.
+
+        Args:
+            client_number (int): The client to look up.
+
+        Returns:
+            list[BankAccount]: The client's accounts in the order they were added.
+        """
+        return [self._accounts[account_number]
+                for account_number in self._client_index.get(client_number, ())]
+
+    def _unindex(self, client_number: int, account_number: int) -> None:
+        """
+        Removes an account number from a client's index entry.
+
+        Args:
+            client_number (int): The client the account was indexed under.
+            account_number (int): The account to remove.
+        """
+        account_numbers = self._client_index.get(client_number)
+        if account_numbers is None:
+            return
+
+        account_numbers.remove(account_number)
+        if not account_numbers:
+            del self._client_index[client_number]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._accounts!r})"
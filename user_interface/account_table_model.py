@@ -0,0 +1,272 @@
+"""
+Description: Provides the AccountTableModel class, a Qt table model over a
+list of BankAccount objects. A QTableView asks it only for the cells it
+draws, so no per-cell items are created and large account lists scroll
+smoothly.
+"""
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+__credits__ = ""
+
+from bisect import bisect_left
+from datetime import datetime
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from bank_account.bank_account import BankAccount
+from user_interface.account_filter import AccountFilterIndex, parse_filter
+
+class AccountTableModel(QAbstractTableModel):
+    """
+    A table of accounts with one row per account and the columns
+    Account Number, Balance, Date Created and Account Type.
+
+    The model holds the account objects themselves and formats a cell only
+    when a view asks for it, so a changed balance is shown by refreshing one
+    row with refresh_account(). Qt.UserRole gives a cell's raw value.
+
+    apply_filter() shows only the accounts matching a filter (see
+    account_filter.parse_filter); rows then number the matching accounts.
+    refresh_account() applies the filter again, so an account whose balance
+    no longer matches it is hidden and one that now matches is shown.
+    """
+
+    COLUMN_HEADERS = ("Account Number", "Balance", "Date Created", "Account Type")
+
+    ACCOUNT_NUMBER, BALANCE, DATE_CREATED, ACCOUNT_TYPE = range(4)
+
+    def __init__(self, parent=None):
+        """
+        Initializes an empty model.
+
+        Args:
+            parent (QObject): The Qt parent of the model.
+        """
+        super().__init__(parent)
+        self._accounts = []
+        self._rows = {}
+        self._filter_index = AccountFilterIndex(self._accounts)
+        self._query = None
+        self._visible = None
+
+    @staticmethod
+    def value(account: BankAccount, column: int):
+        """
+        Returns the raw value of one column of an account.
+
+        Args:
+            account (BankAccount): The account.
+            column (int): The column.
+
+        Returns:
+            The account number, balance, creation date or class name.
+        """
+        if column == AccountTableModel.ACCOUNT_NUMBER:
+            return account.account_number
+        if column == AccountTableModel.BALANCE:
+            return account.balance
+        if column == AccountTableModel.DATE_CREATED:
+            return account.date_created
+        return account.__class__.__name__
+
+    def set_accounts(self, accounts) -> None:
+        """
+        Replaces the accounts shown.
+
+        Args:
+            accounts (Iterable[BankAccount]): The accounts, in display order.
+        """
+        self.beginResetModel()
+        self._accounts[:] = accounts
+        self._index_rows()
+        self._filter_index.invalidate()
+        self._query = None
+        self._visible = None
+        self.endResetModel()
+
+    @property
+    def account_count(self) -> int:
+        """Return the number of accounts, shown or not."""
+        return len(self._accounts)
+
+    @property
+    def is_filtered(self) -> bool:
+        """Return True if a filter is hiding accounts that do not match it."""
+        return self._visible is not None
+
+    def apply_filter(self, column: int, text: str) -> int:
+        """
+        Shows only the accounts matching a filter; empty text shows every account.
+
+        Args:
+            column (int): The column filtered.
+            text (str): The filter text, as accepted by parse_filter.
+
+        Returns:
+            int: The number of accounts shown.
+
+        Raises:
+            ValueError: If the text is not a valid filter for the column; the
+                rows shown are unchanged.
+        """
+        if not text.strip():
+            self.clear_filter()
+            return len(self._accounts)
+
+        query = parse_filter(column, text)
+
+        self.beginResetModel()
+        self._query = query
+        self._visible = self._filter_index.matching(query)
+        self.endResetModel()
+        return len(self._visible)
+
+    def clear_filter(self) -> None:
+        """Shows every account."""
+        if self._visible is not None:
+            self.beginResetModel()
+            self._query = None
+            self._visible = None
+            self.endResetModel()
+
+    def account_at(self, row: int) -> BankAccount:
+        """Return the account shown in a row."""
+        return self._accounts[row if self._visible is None else self._visible[row]]
+
+    def row_of(self, account_number: int) -> int:
+        """Return the row showing an account, or -1 if it is not shown."""
+        position = self._rows.get(account_number, -1)
+        if position < 0 or self._visible is None:
+            return position
+
+        row = bisect_left(self._visible, position)
+        return row if row < len(self._visible) and self._visible[row] == position else -1
+
+    def refresh_account(self, account: BankAccount) -> bool:
+        """
+        Shows the current values of one account, replacing the object in its
+        row if a different object with the same account number is given.
+        With a filter applied, the account's row is inserted or removed if it
+        now matches the filter or no longer does.
+
+        Args:
+            account (BankAccount): The changed account.
+
+        Returns:
+            bool: True if the account is shown and its row was refreshed.
+        """
+        position = self._rows.get(account.account_number, -1)
+        if position < 0:
+            return False
+
+        self._accounts[position] = account
+        self._filter_index.invalidate(self.BALANCE)
+        if self._query is not None:
+            self._refilter(account.account_number, position)
+
+        row = self.row_of(account.account_number)
+        if row < 0:
+            return False
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMN_HEADERS) - 1))
+        return True
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._accounts) if self._visible is None else len(self._visible)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMN_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return str(self.value(self.account_at(index.row()), column))
+        if role == Qt.UserRole:
+            return self.value(self.account_at(index.row()), column)
+        if role == Qt.TextAlignmentRole and column == self.BALANCE:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMN_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def removeRows(self, row, count, parent=QModelIndex()) -> bool:
+        if parent.isValid() or row < 0 or count < 1 or row + count > self.rowCount():
+            return False
+
+        self.beginRemoveRows(parent, row, row + count - 1)
+        removed = {self.account_at(shown).account_number for shown in range(row, row + count)}
+        visible = None if self._visible is None else \
+            [self._accounts[position].account_number for position in self._visible]
+        self._accounts[:] = [account for account in self._accounts if account.account_number not in removed]
+        self._index_rows()
+        self._filter_index.invalidate()
+        if visible is not None:
+            self._visible = [self._rows[number] for number in visible if number not in removed]
+        self.endRemoveRows()
+        return True
+
+    def sort(self, column, order=Qt.AscendingOrder) -> None:
+        """
+        Sorts the account list in place by one column, keeping selections
+        and other persistent indexes on the same accounts.
+
+        Args:
+            column (int): The column to sort by.
+            order (Qt.SortOrder): Ascending or descending.
+        """
+        if not 0 <= column < len(self.COLUMN_HEADERS):
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        followed = [(self.account_at(index.row()).account_number, index.column()) for index in persistent]
+        visible = None if self._visible is None else {self._accounts[position].account_number
+                                                      for position in self._visible}
+
+        if column == self.DATE_CREATED:
+            # Accounts without a creation date sort first
+            key = lambda account: account.date_created or datetime.min
+        else:
+            key = lambda account: self.value(account, column)
+        self._accounts.sort(key=key, reverse=order == Qt.DescendingOrder)
+        self._index_rows()
+
+        # Positions changed: rebuild the filter indexes on next use and
+        # renumber the shown accounts
+        self._filter_index.invalidate()
+        if visible is not None:
+            self._visible = [position for position, account in enumerate(self._accounts)
+                             if account.account_number in visible]
+
+        self.changePersistentIndexList(
+            persistent, [self.index(self.row_of(number), index_column) for number, index_column in followed])
+        self.layoutChanged.emit()
+
+    def _refilter(self, account_number: int, position: int) -> None:
+        """Apply the filter again after the account at position changed, inserting or removing its row."""
+        visible = self._filter_index.matching(self._query)
+        shown = self.row_of(account_number)
+        row = bisect_left(visible, position)
+        matches = row < len(visible) and visible[row] == position
+
+        if shown >= 0 and not matches:
+            self.beginRemoveRows(QModelIndex(), shown, shown)
+            self._visible = visible
+            self.endRemoveRows()
+        elif shown < 0 and matches:
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._visible = visible
+            self.endInsertRows()
+        else:
+            self._visible = visible
+
+    def _index_rows(self) -> None:
+        """Rebuild the map from account number to row."""
+        self._rows = {account.account_number: row for row, account in enumerate(self._accounts)}
@@ -0,0 +1,247 @@
+"""
+Description: Provides the BalanceFile class, which updates the balance column of
+accounts.csv in place. The balance column is kept at a fixed width (values are
+right-aligned and padded with spaces, which float() ignores), so a byte-offset
+index of every account's balance field lets one balance be rewritten without
+reading or writing the rest of the file.
+"""
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+__credits__ = ""
+
+import os
+import shutil
+import tempfile
+
+from utility.file_lock import file_lock
+
+class BalanceFile:
+    """
+    In-place balance updates for an accounts CSV file.
+
+    The byte-offset index is built on first use and rebuilt whenever the
+    file has been changed by something other than this object (detected
+    by its inode, size and modification time). Every update holds the
+    file's advisory lock (see utility.file_lock), so writers in other
+    threads and processes never interleave with it.
+
+    Attributes:
+        DEFAULT_WIDTH (int): Minimum width of the fixed-width balance column.
+    """
+
+    DEFAULT_WIDTH = 16
+
+    def __init__(self, path: str, account_field: str = "account_number", balance_field: str = "balance"):
+        """
+        Initializes a BalanceFile for the given CSV file.
+
+        Args:
+            path (str): Path to the accounts CSV file.
+            account_field (str): Name of the account number column.
+            balance_field (str): Name of the balance column.
+        """
+        self.path = path
+        self._account_field = account_field
+        self._balance_field = balance_field
+        self._offsets = {}
+        self._width = 0
+        self._file_key = None
+
+    @property
+    def width(self) -> int:
+        """Return the current width of the balance column."""
+        with file_lock(self.path):
+            self._ensure_index()
+            return self._width
+
+    def update_balance(self, account_number: int, balance: float) -> bool:
+        """
+        Overwrites the balance of one account in place.
+
+        Args:
+            account_number (int): The account to update.
+            balance (float): The new balance.
+
+        Returns:
+            bool: True if the account was found and updated, otherwise False.
+        """
+        with file_lock(self.path):
+            self._ensure_index()
+
+            if account_number not in self._offsets:
+                return False
+
+            text = str(float(balance))
+
+            # Widen the column for the whole file if the new value does not fit
+            if len(text) > self._width:
+                self._normalize(len(text))
+
+            with open(self.path, "r+b") as file:
+                file.seek(self._offsets[account_number])
+                file.write(text.rjust(self._width).encode("ascii"))
+
+            self._file_key = self._current_file_key()
+            return True
+
+    def invalidate(self) -> None:
+        """Forces the index to be rebuilt on next use."""
+        self._file_key = None
+
+    def _current_file_key(self) -> tuple:
+        """Return a tuple identifying the current version of the file."""
+        stat = os.stat(self.path)
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _ensure_index(self) -> None:
+        """Builds the byte-offset index if the file has changed since it was last built."""
+        if self._file_key == self._current_file_key():
+            return
+
+        widths = self._build_index()
+
+        # Pad the balance column once if the file is not already fixed width
+        if len(widths) != 1:
+            self._normalize(max(widths, default=0))
+
+        self._file_key = self._current_file_key()
+
+    def _column_positions(self, header: bytes) -> tuple[int, int]:
+        """
+        Returns the positions of the account number and balance columns.
+
+        Args:
+            header (bytes): The header line of the file.
+
+        Raises:
+            ValueError: If either column is missing from the header.
+        """
+        columns = header.rstrip(b"\r\n").decode("utf-8-sig").split(",")
+        return columns.index(self._account_field), columns.index(self._balance_field)
+
+    def _build_index(self) -> set[int]:
+        """
+        Scans the file and records the byte offset of every balance field.
+
+        Returns:
+            set[int]: The distinct balance field widths found in the file.
+
+        Raises:
+            ValueError: If a row contains quoted fields, whose byte layout
+                cannot be updated in place.
+        """
+        self._offsets = {}
+        widths = set()
+
+        with open(self.path, "rb") as file:
+            header = file.readline()
+            account_position, balance_position = self._column_positions(header)
+            offset = len(header)
+
+            for line in file:
+                fields = line.rstrip(b"\r\n").split(b",")
+
+                if b'"' in line:
+                    raise ValueError(f"Quoted fields are not supported for in-place updates: {line!r}")
+
+                try:
+                    account_number = int(fields[account_position])
+                    float(fields[balance_position])
+                except (ValueError, IndexError):
+                    # Invalid rows are reported by load_data and are never updated
+                    offset += len(line)
+                    continue
+
+                self._offsets[account_number] = offset + sum(
+                    len(field) + 1 for field in fields[:balance_position]
+                )
+                widths.add(len(fields[balance_position]))
+                offset += len(line)
+
+        if widths:
+            self._width = max(widths)
+
+        return widths
+
+    def rewrite_balances(self, balances: dict[int, float]) -> int:
+        """
+        Writes many balances in a single pass over the file.
+
+        The new contents are written to a temporary file in the same
+        directory which then atomically replaces the original, so readers
+        see either every new balance or none of them.
+
+        Args:
+            balances (dict[int, float]): New balances keyed by account number.
+
+        Returns:
+            int: The number of rows whose balance changed.
+        """
+        texts = {account_number: str(float(balance))
+                 for account_number, balance in balances.items()}
+
+        with file_lock(self.path):
+            width = max([self._width, *(len(text) for text in texts.values())])
+            return self._rewrite(width, texts)
+
+    def _normalize(self, width: int) -> None:
+        """
+        Rewrites the file once with every balance right-aligned to a fixed width.
+
+        Args:
+            width (int): The smallest width the balance column must have.
+        """
+        self._rewrite(width, {})
+
+    def _rewrite(self, width: int, texts: dict[int, str]) -> int:
+        """
+        Rewrites the file with a fixed-width balance column, replacing the
+        balances of the given accounts, and rebuilds the index.
+
+        Args:
+            width (int): The smallest width the balance column must have.
+            texts (dict[int, str]): Formatted new balances keyed by account number.
+
+        Returns:
+            int: The number of rows whose balance changed.
+        """
+        width = max(width, self.DEFAULT_WIDTH)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        changed = 0
+
+        with open(self.path, "rb") as source, \
+             tempfile.NamedTemporaryFile("wb", dir=directory, delete=False) as target:
+            header = source.readline()
+            account_position, balance_position = self._column_positions(header)
+            target.write(header)
+
+            for line in source:
+                content = line.rstrip(b"\r\n")
+                fields = content.split(b",")
+
+                if len(fields) > balance_position:
+                    balance = fields[balance_position].strip()
+
+                    try:
+                        text = texts.get(int(fields[account_position]))
+                    except ValueError:
+                        text = None
+
+                    if text is not None:
+                        try:
+                            if float(balance) != float(text):
+                                changed += 1
+                        except ValueError:
+                            changed += 1
+                        balance = text.encode("ascii")
+
+                    fields[balance_position] = balance.rjust(width)
+
+                target.write(b",".join(fields) + line[len(content):])
+
+        shutil.copymode(self.path, target.name)
+        os.replace(target.name, self.path)
+        self._build_index()
+        self._file_key = self._current_file_key()
+
+        return changed
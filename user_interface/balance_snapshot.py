@@ -0,0 +1,197 @@
+"""
+Description: Provides the BalanceSnapshot class, a compact binary file of account
+balances, and the compaction that folds the transaction journal into it so that
+recovery only replays the journal written since the last snapshot.
+"""
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+__credits__ = ""
+
+import os
+import struct
+import threading
+import zlib
+
+import numpy as np
+
+from bank_account.transaction_journal import TransactionJournal
+
+class BalanceSnapshot:
+    """
+    A binary snapshot of account balances as of one journal sequence number.
+
+    The file holds a header (magic number, sequence number, record count and
+    a CRC-32 of the records) followed by (account_number, balance) records
+    sorted by account number, stored as a NumPy structured array. Only
+    accounts changed through the journal appear; every other balance is the
+    one in accounts.csv. A balance written to accounts.csv after the snapshot
+    is checkpointed in the journal (see manage_data.update_data), so the
+    journal records replayed over the snapshot supersede it.
+
+    The snapshot does not record which accounts.csv it was taken against.
+    If accounts.csv is replaced or regenerated other than through
+    manage_data (for example restored from a backup), the snapshot and
+    journal balances still override the new file on load, so delete
+    accounts.snapshot and accounts.journal along with it.
+    """
+
+    MAGIC = b"PXS1"
+    _HEADER = struct.Struct("<4sQQI")
+    DTYPE = np.dtype([("account_number", "<i8"), ("balance", "<f8")])
+
+    def __init__(self, path: str):
+        """
+        Initializes a snapshot stored at path. The file is created by the first write.
+
+        Args:
+            path (str): Path of the snapshot file.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+
+    def read(self) -> tuple[int, dict[int, float]]:
+        """
+        Reads the snapshot.
+
+        Returns:
+            tuple:
+                - last_sequence (int): The last journal sequence number included, or 0 without a snapshot.
+                - balances (dict[int, float]): Balances keyed by account number.
+
+        Raises:
+            ValueError: If the file is not a snapshot or is damaged.
+        """
+        if not os.path.exists(self.path):
+            return 0, {}
+
+        with open(self.path, "rb") as file:
+            data = file.read()
+
+        if len(data) < self._HEADER.size:
+            raise ValueError(f"{self.path} is not a balance snapshot.")
+
+        magic, last_sequence, count, crc = self._HEADER.unpack_from(data)
+        payload = data[self._HEADER.size:]
+
+        if magic != self.MAGIC or len(payload) != count * self.DTYPE.itemsize or zlib.crc32(payload) != crc:
+            raise ValueError(f"{self.path} is not a valid balance snapshot.")
+
+        records = np.frombuffer(payload, dtype=self.DTYPE)
+        return last_sequence, dict(zip(records["account_number"].tolist(), records["balance"].tolist()))
+
+    def write(self, balances: dict, last_sequence: int) -> None:
+        """
+        Replaces the snapshot. The new file is written and flushed to disk
+        under a temporary name and then atomically renamed over the old one.
+
+        Args:
+            balances (dict[int, float]): Balances keyed by account number.
+            last_sequence (int): The last journal sequence number the balances include.
+        """
+        records = np.empty(len(balances), dtype=self.DTYPE)
+        records["account_number"] = np.fromiter(balances.keys(), dtype=np.int64, count=len(balances))
+        records["balance"] = np.fromiter(balances.values(), dtype=np.float64, count=len(balances))
+        records.sort(order="account_number")
+        payload = records.tobytes()
+
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "wb") as file:
+            file.write(self._HEADER.pack(self.MAGIC, last_sequence, len(records), zlib.crc32(payload)))
+            file.write(payload)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, self.path)
+
+def compact(journal: TransactionJournal, snapshot: BalanceSnapshot) -> int:
+    """
+    Folds every durable journal record into the snapshot, then removes those
+    records from the journal. A crash between the two steps is harmless:
+    records already in the snapshot are skipped when the journal is replayed.
+
+    Args:
+        journal (TransactionJournal): The journal to compact.
+        snapshot (BalanceSnapshot): The snapshot to fold it into.
+
+    Returns:
+        int: The number of journal records removed.
+    """
+    with snapshot.lock:
+        last_sequence, balances = snapshot.read()
+        through = journal.durable_sequence
+
+        if through <= last_sequence:
+            return 0
+
+        for record in journal.records(last_sequence):
+            if record.sequence > through:
+                break
+            balances[record.account_number] = record.balance
+
+        snapshot.write(balances, through)
+        return journal.truncate_through(through)
+
+def recover_balances(snapshot: BalanceSnapshot, journal: TransactionJournal) -> dict[int, float]:
+    """
+    Returns the balances to apply over accounts.csv: the snapshot, updated
+    by the journal records that follow it, including the checkpoints of
+    balances since written to accounts.csv.
+
+    Args:
+        snapshot (BalanceSnapshot): The snapshot.
+        journal (TransactionJournal): The journal, or None if there is none.
+
+    Returns:
+        dict[int, float]: Balances keyed by account number.
+    """
+    last_sequence, balances = snapshot.read()
+    if journal is not None:
+        balances.update(journal.balances(last_sequence))
+    return balances
+
+class SnapshotCompactor:
+    """
+    Compacts a journal into a snapshot from a background thread, every
+    interval seconds once at least min_records records have accumulated.
+    """
+
+    DEFAULT_INTERVAL = 300.0
+    DEFAULT_MIN_RECORDS = 1000
+
+    def __init__(self, journal: TransactionJournal, snapshot: BalanceSnapshot,
+                 interval: float = DEFAULT_INTERVAL, min_records: int = DEFAULT_MIN_RECORDS):
+        """
+        Initializes the compactor. Call start() to begin compacting.
+
+        Args:
+            journal (TransactionJournal): The journal to compact.
+            snapshot (BalanceSnapshot): The snapshot to fold it into.
+            interval (float): Seconds between checks.
+            min_records (int): Fewest journal records worth compacting.
+        """
+        self.journal = journal
+        self.snapshot = snapshot
+        self.interval = interval
+        self.min_records = min_records
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        """Starts the background thread if it is not running."""
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="snapshot-compactor", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background thread and waits for it to finish."""
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        """Compact whenever enough records have accumulated, until stopped."""
+        while not self._stopped.wait(self.interval):
+            if self.journal.durable_sequence - self.journal.base_sequence >= self.min_records:
+                compact(self.journal, self.snapshot)
@@ -7,13 +7,16 @@ __author__ = "Komalpreet Kaur"
 __version__ = "1.0.0"
 __credits__ = ""
 
-from PySide6.QtWidgets import QTableWidgetItem, QMessageBox
-from PySide6.QtCore import Qt
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtWidgets import QMessageBox, QProgressBar, QHeaderView, QTableView
+from PySide6.QtCore import Qt, Signal
 
 from ui_superclasses.lookup_window import LookupWindow
 from user_interface.account_details_window import AccountDetailsWindow
-from user_interface.manage_data import load_data
-from user_interface.manage_data import update_data
+from user_interface.account_table_model import AccountTableModel
+from user_interface.data_loader import DataLoader
+from user_interface.storage import StorageBackend, CsvBackend
 from bank_account.bank_account import BankAccount
 
 class ClientLookupWindow(LookupWindow):
@@ -25,33 +28,137 @@ class ClientLookupWindow(LookupWindow):
     ClientLookupWindow adds:
         - Event handling logic
         - Retrieving Client data
-        - Populating the account table
+        - Populating the account table (an AccountTableModel shown in the
+          superclass's QTableView, sortable by clicking a column header)
         - Opening the AccountDetailsWindow on selection
         - Receiving updated balances via signals
+
+    Data is loaded on a DataLoader thread, so the window appears at once.
+    Until loading finishes the Lookup button is disabled (pressing Enter
+    still looks up clients loaded so far) and accounts cannot be opened.
+    Changed balances are saved in order on a single writer thread.
+
+    Signals:
+        save_failed (int, str): Saving an account's balance failed, with the error message.
     """
 
-    def __init__(self):
+    save_failed = Signal("qint64", str)
+
+    def __init__(self, backend: StorageBackend = None):
         """
         Initializes the Client Lookup window.
 
-        Loads client/account data and connects UI widgets
-        to event handler functions (lookup button, table selection,
-        and text-changed event).
+        Starts loading client/account data in the background and connects
+        UI widgets to event handler functions (lookup button, Enter key,
+        table selection, and text-changed event).
+
+        Args:
+            backend (StorageBackend): Where clients and accounts are stored;
+                the CSV files when omitted. A SqliteBackend reads only the
+                client and accounts being looked up.
         """
         super().__init__()
 
-        # Load dictionaries from manage_data.py
-        self.clients, self.accounts = load_data()
+        self.backend = backend if backend is not None else CsvBackend()
+        self.data_loaded = False
+
+        # Show loading progress in the status bar
+        self.load_progress = QProgressBar()
+        self.load_progress.setMaximumWidth(200)
+        self.statusBar().showMessage("Loading clients and accounts...")
+        self.statusBar().addPermanentWidget(self.load_progress)
+
+        # Load client and account mappings on a worker thread; the mappings
+        # are filled in place, so clients already loaded can be looked up
+        self.loader = DataLoader(self.backend, self)
+        self.clients, self.accounts = self.loader.client_listing, self.loader.accounts
+        self.loader.progress.connect(self.on_load_progress)
+        self.loader.loaded.connect(self.on_data_loaded)
+        self.loader.failed.connect(self.on_load_failed)
+        self.lookup_button.setEnabled(False)
+        self.loader.start()
 
-        # Connect Lookup button to event handler
+        # Save balances off the UI thread, one at a time and in order
+        self.save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="account-writer")
+        self.save_failed.connect(self.on_save_failed)
+
+        # Connect Lookup button and Enter key to event handler
         self.lookup_button.clicked.connect(self.on_lookup_client)
+        self.client_number_edit.returnPressed.connect(self.on_lookup_client)
+
+        # Show the client's accounts through a model; fixed row heights let the
+        # view lay out thousands of rows without measuring each one
+        self.account_model = AccountTableModel(self)
+        self.account_table.setModel(self.account_model)
+        self.account_table.setSortingEnabled(True)
+        self.account_table.sortByColumn(AccountTableModel.ACCOUNT_NUMBER, Qt.AscendingOrder)
+        self.account_table.setSelectionBehavior(QTableView.SelectRows)
+        self.account_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
 
         # Connect double-click on account table to account selection handler
-        self.account_table.cellDoubleClicked.connect(self.on_select_account)
+        self.account_table.doubleClicked.connect(self.on_select_account)
 
         # Clear table whenever text changes
         self.client_number_edit.textChanged.connect(self.on_text_changed)
 
+        # Filter the accounts as the user types, and when the column or button is used
+        self.filter_edit.textChanged.connect(self.on_filter_changed)
+        self.filter_combo_box.currentIndexChanged.connect(self.on_filter_changed)
+        self.filter_button.clicked.connect(self.on_filter_changed)
+
+    # ============================================================
+    # EVENT HANDLERS: BACKGROUND LOADING
+    # ============================================================
+    def on_load_progress(self, done: int, total: int):
+        """
+        Shows how much of the data has been loaded.
+
+        Args:
+            done (int): Work done so far.
+            total (int): Total work.
+        """
+        self.load_progress.setValue(int(done * 100 / total) if total else 100)
+
+    def on_data_loaded(self):
+        """
+        Enables the Lookup button once every client and account is loaded,
+        and refreshes the client on display, whose accounts and balances
+        may have been incomplete.
+        """
+        self.data_loaded = True
+        self.lookup_button.setEnabled(True)
+        self.statusBar().removeWidget(self.load_progress)
+        self.statusBar().showMessage(
+            f"Loaded {len(self.clients)} clients and {len(self.accounts)} accounts.", 5000)
+
+        if self.client_info_label.text():
+            self.on_lookup_client()
+
+    def on_load_failed(self, message: str):
+        """
+        Reports a load that stopped with an error.
+
+        Args:
+            message (str): The error message.
+        """
+        self.statusBar().removeWidget(self.load_progress)
+        self.statusBar().showMessage("Loading failed.")
+        QMessageBox.critical(self, "Loading Failed",
+                             f"Client and account data could not be loaded: {message}")
+
+    def closeEvent(self, event):
+        """
+        Stops a load still in progress and finishes saving balances before
+        the window closes.
+
+        Args:
+            event (QCloseEvent): The close event.
+        """
+        if self.loader.isRunning():
+            self.loader.cancel()
+        self.save_executor.shutdown(wait=True)
+        super().closeEvent(event)
+
     # ============================================================
     # EVENT HANDLER: TEXT CHANGED
     # ============================================================
@@ -61,10 +168,11 @@ class ClientLookupWindow(LookupWindow):
         account table whenever the user edits the client number.
         """
         self.client_info_label.setText("")
-        self.account_table.setRowCount(0)
+        self.account_model.set_accounts([])
 
         # Disable filter controls
         self.filter_label.setEnabled(False)
+        self.filter_combo_box.setEnabled(False)
         self.filter_edit.setEnabled(False)
         self.filter_button.setEnabled(False)
 
@@ -89,8 +197,12 @@ class ClientLookupWindow(LookupWindow):
         
         # Ensure client exists
         if client_number not in self.clients:
-            QMessageBox.information(self, "Not Found",
-                                    "Client number does not exist.")
+            if self.data_loaded:
+                QMessageBox.information(self, "Not Found",
+                                        "Client number does not exist.")
+            else:
+                QMessageBox.information(self, "Still Loading",
+                                        "Client number has not been loaded yet. Try again when loading finishes.")
             return
 
         # Display client info
@@ -100,46 +212,66 @@ class ClientLookupWindow(LookupWindow):
         )
 
         # Gather accounts for the selected client
-        client_accounts = [
-            acc for acc in self.accounts.values()
-            if acc.client_number == client_number
-        ]
-
-        # Populate the account table
-        self.account_table.setRowCount(len(client_accounts))
-
-        for row_index, account in enumerate(client_accounts):
-            self.account_table.setItem(row_index, 0,
-                                       QTableWidgetItem(str(account.account_number)))
-            self.account_table.setItem(row_index, 1,
-                                       QTableWidgetItem(str(account.balance)))
-            self.account_table.setItem(row_index, 2,
-                                       QTableWidgetItem(str(account.date_created)))
-            self.account_table.setItem(row_index, 3,
-                                       QTableWidgetItem(account.__class__.__name__))
-            
-        # Enable filter controls
+        client_accounts = self.accounts.accounts_for_client(client_number)
+
+        # Show the accounts, keeping the sort order the user chose
+        self.account_model.set_accounts(client_accounts)
+        header = self.account_table.horizontalHeader()
+        if header.sortIndicatorSection() >= 0:
+            self.account_model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
+
+        # Enable filter controls, keeping any filter already typed
         self.filter_label.setEnabled(True)
+        self.filter_combo_box.setEnabled(True)
         self.filter_edit.setEnabled(True)
         self.filter_button.setEnabled(True)
+        self.on_filter_changed()
+
+    # ============================================================
+    # EVENT HANDLER: FILTER CHANGED
+    # ============================================================
+    def on_filter_changed(self):
+        """
+        Shows only the client's accounts matching the filter typed for the
+        chosen column: a prefix of the displayed text, =value, >value,
+        >=value, <value, <=value, or low..high (dates as YYYY-MM-DD).
+        Each keystroke narrows the previous result through the model's
+        sorted indexes instead of rescanning every account.
+        """
+        try:
+            shown = self.account_model.apply_filter(self.filter_combo_box.currentIndex(),
+                                                    self.filter_edit.text())
+        except ValueError:
+            self.filter_label.setText(f"Invalid Filter for {self.filter_combo_box.currentText()}")
+            return
+
+        if self.account_model.is_filtered:
+            self.filter_label.setText(
+                f"Data is Currently Filtered ({shown} of {self.account_model.account_count} accounts)")
+        else:
+            self.filter_label.setText("Data is Not Currently Filtered")
 
     # ============================================================
     # EVENT HANDLER: USER DOUBLE-CLICKS A ROW
     # ============================================================
-    def on_select_account(self, row, col):
+    def on_select_account(self, index):
         """
         Opens the AccountDetailsWindow for the selected BankAccount
         when the user double-clicks on a table row.
 
         Args:
-            row: The table row the user clicked.
-            col: The table column (unused).
+            index (QModelIndex): The cell the user double-clicked.
 
         Returns:
             None
         """
-        account_number = int(self.account_table.item(row, 0).text())
-        account = self.accounts[account_number]
+        # Balances are final only once the journal has been replayed
+        if not self.data_loaded:
+            QMessageBox.information(self, "Still Loading",
+                                    "Accounts can be opened when loading finishes.")
+            return
+
+        account = self.account_model.account_at(index.row())
 
         # Create and display the AccountDetailsWindow
         self.details_window = AccountDetailsWindow(account)
@@ -156,7 +288,8 @@ class ClientLookupWindow(LookupWindow):
     def on_account_updated(self, updated_account: BankAccount):
         """
         Triggered when AccountDetailsWindow emits the balance_updated signal.
-        Updates accounts.csv THEN refreshes the account table.
+        Refreshes the account's row of the table and queues the balance to
+        be saved through the storage backend on the writer thread.
 
         Args:
             updated_account (BankAccount): The modified account object.
@@ -164,12 +297,41 @@ class ClientLookupWindow(LookupWindow):
         Returns:
             None
         """
-        # Update CSV file
-        update_data(updated_account)
+        account_number = updated_account.account_number
 
-        # Update in-memory dictionary
-        self.accounts[updated_account.account_number] = updated_account
+        # Update in-memory dictionary (and its client index) if the object changed
+        if self.accounts.get(account_number) is not updated_account:
+            self.accounts[account_number] = updated_account
 
-        # Refresh the table display
-        self.on_lookup_client()
+        # Refresh only the changed row
+        self.account_model.refresh_account(updated_account)
+
+        # Save the new balance without blocking the UI
+        self.save_executor.submit(self._save_balance, updated_account)
+
+    def _save_balance(self, account: BankAccount):
+        """
+        Saves one balance; runs on the writer thread.
+
+        Args:
+            account (BankAccount): The account to save.
+        """
+        try:
+            self.backend.update_balance(account)
+        except Exception as e:
+            self.save_failed.emit(account.account_number, str(e))
+
+    # ============================================================
+    # EVENT HANDLER: SIGNAL — SAVE FAILED
+    # ============================================================
+    def on_save_failed(self, account_number: int, message: str):
+        """
+        Reports a balance that could not be saved.
+
+        Args:
+            account_number (int): The account whose balance was not saved.
+            message (str): The error message.
+        """
+        QMessageBox.critical(self, "Save Failed",
+                             f"The balance of account {account_number} could not be saved: {message}")
         
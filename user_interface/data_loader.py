@@ -0,0 +1,67 @@
+"""
+Description: Provides the DataLoader class, a QThread which fills a storage
+backend's client and account mappings in the background and reports its
+progress through Qt signals, so the window using the data stays responsive.
+"""
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+__credits__ = ""
+
+from PySide6.QtCore import QThread, Signal
+
+from user_interface.storage import StorageBackend
+
+class LoadCancelled(Exception):
+    """Raised inside the loader thread to stop a load whose cancellation was requested."""
+
+class DataLoader(QThread):
+    """
+    Loads clients and accounts on a worker thread.
+
+    The mappings are created up front and filled in place, so clients and
+    accounts can be looked up while the load is still running.
+
+    Signals:
+        progress (int, int): Work done so far and the total (bytes read, for CSV files).
+        loaded (): The mappings are complete.
+        failed (str): Loading stopped with the given error message.
+    """
+
+    progress = Signal("qint64", "qint64")
+    loaded = Signal()
+    failed = Signal(str)
+
+    def __init__(self, backend: StorageBackend, parent=None):
+        """
+        Creates the loader and the (still empty) mappings it fills.
+
+        Args:
+            backend (StorageBackend): The backend to load from.
+            parent (QObject): The Qt parent of the thread.
+        """
+        super().__init__(parent)
+        self.backend = backend
+        self.client_listing, self.accounts = backend.new_mappings()
+
+    def run(self):
+        """Fills the mappings, emitting progress, then loaded or failed."""
+        try:
+            self.backend.load_into(self.client_listing, self.accounts, self._report_progress)
+        except LoadCancelled:
+            return
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+
+        self.loaded.emit()
+
+    def cancel(self):
+        """Stops the load at its next progress report and waits for the thread to finish."""
+        self.requestInterruption()
+        self.wait()
+
+    def _report_progress(self, done: int, total: int):
+        """Emit progress, or stop the load if cancellation was requested."""
+        if self.isInterruptionRequested():
+            raise LoadCancelled()
+        self.progress.emit(done, total)
@@ -0,0 +1,409 @@
+"""
+Description: Provides lazily loaded client and account mappings for load_data.
+Rows of clients.csv and accounts.csv are located through a byte-offset index
+and parsed only when a client or account is first used; at most a bounded
+number of parsed objects are held in a least-recently-used cache.
+"""
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+__credits__ = ""
+
+import csv
+import os
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
+
+from user_interface.account_store import AccountStore
+
+class CsvIndex:
+    """
+    A byte-offset index of a CSV file keyed by an integer column, with an
+    optional secondary grouping by a second integer column.
+
+    The index is built on first use and rebuilt when the file is replaced
+    or changes size. Balance updates written in place by update_data keep
+    both, so they do not force a rebuild.
+    """
+
+    def __init__(self, path: str, key_field: str, group_field: str = None):
+        """
+        Initializes the index for a CSV file.
+
+        Args:
+            path (str): Path to the CSV file.
+            key_field (str): Column holding the unique integer key.
+            group_field (str): Column holding an integer to group keys by (optional).
+        """
+        self.path = path
+        self._key_field = key_field
+        self._group_field = group_field
+        self._fieldnames = []
+        self._offsets = {}
+        self._group_of = {}
+        self._groups = {}
+        self._file_key = None
+
+    def refresh(self) -> bool:
+        """
+        Rebuilds the index if the file has been replaced or resized.
+
+        Returns:
+            bool: True if the index was rebuilt.
+        """
+        stat = os.stat(self.path)
+        file_key = (stat.st_ino, stat.st_size)
+
+        if file_key == self._file_key:
+            return False
+
+        self._build()
+        self._file_key = file_key
+        return True
+
+    def _build(self) -> None:
+        """Scans the file and records the offset of every row by key."""
+        self._offsets = {}
+        self._group_of = {}
+        self._groups = {}
+
+        with open(self.path, "rb") as file:
+            header = file.readline()
+            self._fieldnames = next(csv.reader([header.decode("utf-8-sig")]), [])
+            key_position = self._fieldnames.index(self._key_field)
+            group_position = (self._fieldnames.index(self._group_field)
+                              if self._group_field else None)
+            offset = len(header)
+
+            for line in file:
+                row_offset = offset
+                offset += len(line)
+
+                if b'"' in line:
+                    fields = next(csv.reader([line.decode("utf-8")]), [])
+                else:
+                    fields = line.rstrip(b"\r\n").split(b",")
+
+                # Rows without a usable key can never be looked up
+                try:
+                    key = int(fields[key_position])
+                except (ValueError, IndexError):
+                    continue
+
+                self._offsets[key] = row_offset
+
+                if group_position is None:
+                    continue
+
+                try:
+                    group = int(fields[group_position])
+                except (ValueError, IndexError):
+                    continue
+
+                previous = self._group_of.get(key)
+                if previous is not None:
+                    self._groups[previous].remove(key)
+
+                self._group_of[key] = group
+                self._groups.setdefault(group, []).append(key)
+
+    def __contains__(self, key) -> bool:
+        self.refresh()
+        return key in self._offsets
+
+    def __iter__(self):
+        self.refresh()
+        return iter(list(self._offsets))
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._offsets)
+
+    def group_of(self, key: int) -> int | None:
+        """Return the group value recorded for a key, or None."""
+        self.refresh()
+        return self._group_of.get(key)
+
+    def keys_in_group(self, group: int) -> list[int]:
+        """Return the keys recorded under a group value, in file order."""
+        self.refresh()
+        return list(self._groups.get(group, ()))
+
+    def read_row(self, key: int) -> dict | None:
+        """
+        Reads the row for a key straight from its byte offset.
+
+        Args:
+            key (int): The key to look up.
+
+        Returns:
+            dict[str, str]: The row keyed by column name, or None if the key is not indexed.
+        """
+        self.refresh()
+        offset = self._offsets.get(key)
+        if offset is None:
+            return None
+
+        with open(self.path, "rb") as file:
+            file.seek(offset)
+            line = file.readline().decode("utf-8")
+
+        return next(csv.DictReader([line], fieldnames=self._fieldnames), None)
+
+class _LazyCsvMapping(Mapping):
+    """
+    Base class for mappings whose values are parsed on demand from CSV rows.
+
+    Attributes:
+        DEFAULT_CACHE_SIZE (int): Default maximum number of parsed objects kept in memory.
+    """
+
+    DEFAULT_CACHE_SIZE = 10000
+
+    def __init__(self, index: CsvIndex, parse_row, cache_size: int):
+        """
+        Initializes the mapping.
+
+        Args:
+            index (CsvIndex): Index of the underlying CSV file.
+            parse_row (Callable[[dict], object]): Builds an object from a row,
+                returning None (and logging) for invalid rows.
+            cache_size (int): Maximum number of parsed objects kept in memory.
+        """
+        self._index = index
+        self._parse_row = parse_row
+        self._cache_size = max(int(cache_size), 1)
+        self._cache = OrderedDict()
+        self._invalid = set()
+
+    def _load(self, key):
+        """
+        Returns the parsed object for a key, reading it from disk on a cache miss.
+
+        Raises:
+            KeyError: If the key is not in the file or its row is invalid.
+        """
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        if self._index.refresh():
+            self._invalid.clear()
+
+        if key in self._invalid:
+            raise KeyError(key)
+
+        row = self._index.read_row(key)
+        value = self._parse_row(row) if row is not None else None
+
+        if value is None:
+            if row is not None:
+                self._invalid.add(key)
+            raise KeyError(key)
+
+        self._remember(key, value)
+        return value
+
+    def _remember(self, key, value) -> None:
+        """Adds an object to the cache, evicting the least recently used one if full."""
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def __getitem__(self, key):
+        return self._load(key)
+
+    def __contains__(self, key) -> bool:
+        try:
+            self._load(key)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        for key in self._index:
+            if key in self:
+                yield key
+
+    def __len__(self) -> int:
+        """Return the number of indexed rows (including rows that later fail to parse)."""
+        return len(self._index)
+
+class LazyClientListing(_LazyCsvMapping):
+    """
+    A read-only mapping of client_number -> Client that parses clients.csv
+    rows on first use.
+    """
+
+    def __init__(self, path: str, parse_row, cache_size: int = _LazyCsvMapping.DEFAULT_CACHE_SIZE):
+        """
+        Initializes the listing.
+
+        Args:
+            path (str): Path to clients.csv.
+            parse_row (Callable[[dict], Client]): Builds a Client from a row.
+            cache_size (int): Maximum number of Client objects kept in memory.
+        """
+        super().__init__(CsvIndex(path, "client_number"), parse_row, cache_size)
+
+class LazyAccountStore(_LazyCsvMapping, MutableMapping):
+    """
+    A mapping of account_number -> BankAccount that parses accounts.csv rows
+    on first use, with the same client lookups as AccountStore.
+
+    Accounts assigned to the store are cached like parsed ones, so a balance
+    change must be written with update_data before the account is evicted.
+    Accounts that are not in the file, or that moved to a different client,
+    are kept in memory until they are deleted.
+
+    Balances recovered from the journal (see restore_balances) are set on
+    each account when its row is parsed. An account whose balance differs
+    from the file's is then kept in memory instead of the cache, so evicting
+    it never brings back the older balance.
+    """
+
+    def __init__(self, path: str, parse_row, cache_size: int = _LazyCsvMapping.DEFAULT_CACHE_SIZE):
+        """
+        Initializes the store.
+
+        Args:
+            path (str): Path to accounts.csv.
+            parse_row (Callable[[dict], BankAccount]): Builds a BankAccount from a row.
+            cache_size (int): Maximum number of BankAccount objects kept in memory.
+        """
+        super().__init__(CsvIndex(path, "account_number", "client_number"), parse_row, cache_size)
+        self._overrides = AccountStore()
+        self._hidden = set()
+        self._recovered = {}
+        self._pinned = {}
+
+    def restore_balances(self, balances: dict) -> int:
+        """
+        Records recovered balances without parsing any rows. Accounts already
+        in memory are restored at once; the others when they are first parsed.
+
+        Args:
+            balances (dict[int, float]): Recovered balances keyed by account number.
+
+        Returns:
+            int: The number of accounts restored at once.
+        """
+        restored = 0
+        for account_number, balance in balances.items():
+            account = self._overrides.get(account_number)
+            if account is None:
+                account = self._pinned.get(account_number)
+            if account is None:
+                account = self._cache.get(account_number)
+            if account is None:
+                self._recovered[account_number] = balance
+                continue
+
+            account._restore_balance(balance)
+            if account_number not in self._overrides:
+                self._cache.pop(account_number, None)
+                self._pinned[account_number] = account
+            restored += 1
+        return restored
+
+    def _load(self, account_number: int):
+        """Returns a pinned account, or parses one and applies its recovered balance."""
+        account = self._pinned.get(account_number)
+        if account is not None:
+            return account
+
+        account = super()._load(account_number)
+
+        balance = self._recovered.pop(account_number, None)
+        if balance is not None and balance != account.balance:
+            account._restore_balance(balance)
+            self._cache.pop(account_number, None)
+            self._pinned[account_number] = account
+        return account
+
+    def __getitem__(self, account_number: int):
+        if account_number in self._overrides:
+            return self._overrides[account_number]
+        if account_number in self._hidden:
+            raise KeyError(account_number)
+        return self._load(account_number)
+
+    def __setitem__(self, account_number: int, account) -> None:
+        if self._index.group_of(account_number) == account.client_number:
+            self._overrides.pop(account_number, None)
+            self._hidden.discard(account_number)
+            # The assigned account replaces any recovered balance, and stays in memory in its place
+            if self._recovered.pop(account_number, None) is not None or account_number in self._pinned:
+                self._pinned[account_number] = account
+            else:
+                self._remember(account_number, account)
+        else:
+            self._cache.pop(account_number, None)
+            self._pinned.pop(account_number, None)
+            self._recovered.pop(account_number, None)
+            if account_number in self._index:
+                self._hidden.add(account_number)
+            self._overrides[account_number] = account
+
+    def __delitem__(self, account_number: int) -> None:
+        if account_number not in self:
+            raise KeyError(account_number)
+
+        self._overrides.pop(account_number, None)
+        self._cache.pop(account_number, None)
+        self._pinned.pop(account_number, None)
+        self._recovered.pop(account_number, None)
+
+        if account_number in self._index:
+            self._hidden.add(account_number)
+
+    def __contains__(self, account_number) -> bool:
+        try:
+            self[account_number]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        for account_number in self._index:
+            if account_number not in self._hidden and account_number in self:
+                yield account_number
+        yield from self._overrides
+
+    def __len__(self) -> int:
+        """Return the number of indexed rows plus in-memory accounts, less removed ones."""
+        return len(self._index) - len(self._hidden) + len(self._overrides)
+
+    def account_numbers_for_client(self, client_number: int) -> list[int]:
+        """
+        Returns the account numbers owned by a client without parsing any rows.
+
+        Args:
+            client_number (int): The client to look up.
+
+        Returns:
+            list[int]: Account numbers in file order, followed by in-memory accounts.
+        """
+        account_numbers = [account_number
+                           for account_number in self._index.keys_in_group(client_number)
+                           if account_number not in self._hidden]
+        return account_numbers + self._overrides.account_numbers_for_client(client_number)
+
+    def accounts_for_client(self, client_number: int) -> list:
+        """
+        Returns the BankAccount objects owned by a client, parsing only their rows.
+
+        Args:
+            client_number (int): The client to look up.
+
+        Returns:
+            list[BankAccount]: The client's valid accounts.
+        """
+        accounts = []
+        for account_number in self.account_numbers_for_client(client_number):
+            try:
+                accounts.append(self[account_number])
+            except KeyError:
+                continue
+        return accounts
@@ -13,13 +13,23 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 import csv
 from datetime import datetime
+import io
 import logging
+from concurrent.futures import ProcessPoolExecutor
 
 from bank_account.chequing_account import ChequingAccount
 from bank_account.savings_account import SavingsAccount
 from bank_account.investment_account import InvestmentAccount
 from client.client import Client
 from bank_account.bank_account import BankAccount
+from bank_account.account_locks import account_locks
+from bank_account.transaction_journal import TransactionJournal, restore_balances
+from user_interface.account_store import AccountStore
+from user_interface.account_file import ACCOUNT_TYPES, OPTIONAL_FIELDS, AccountFile
+from user_interface.balance_file import BalanceFile
+from user_interface.balance_snapshot import BalanceSnapshot, SnapshotCompactor, compact, recover_balances
+from user_interface.lazy_data import LazyClientListing, LazyAccountStore
+from utility.file_lock import file_lock
 
 # *******************************************************************************
 # GIVEN LOGGING AND FILE ACCESS CODE
@@ -53,121 +63,624 @@ accounts_csv_path = os.path.join(data_dir, 'accounts.csv')
 # END GIVEN LOGGING AND FILE ACCESS CODE
 # *******************************************************************************
 
-def load_data()->tuple[dict,dict]:
+# Journal of balance changes made since accounts.csv was last written, and the
+# snapshot the journal is compacted into
+journal_path = os.path.join(data_dir, 'accounts.journal')
+snapshot_path = os.path.join(data_dir, 'accounts.snapshot')
+
+# Binary copy of accounts.csv, used by load_data when present (see account_file.py)
+accounts_bin_path = os.path.join(data_dir, 'accounts.npy')
+
+def _parse_client_row(row: dict, trusted_source: bool = False) -> Client | None:
+    """
+    Builds a Client from one row of clients.csv.
+
+    Args:
+        row (dict[str, str]): The row, keyed by column name.
+        trusted_source (bool): Defer email validation until the address is first read.
+
+    Returns:
+        Client: The client, or None if the row is invalid (the row is logged).
+    """
+    try:
+        client_number = int(row["client_number"])
+        first_name = row["first_name"]
+        last_name = row["last_name"]
+        email = row["email_address"]
+
+        # Handle missing names (like client 1011)
+        if not first_name or not last_name:
+            logging.error(f"Missing name in clients.csv row: {row}")
+            return None
+
+        return Client(
+            client_number,
+            first_name,
+            last_name,
+            email,
+            defer_validation=trusted_source
+        )
+
+    except ValueError:
+        logging.error(f"Invalid client_number in row: {row}")
+        return None
+
+def _build_account(account_type: str, account_number: int, client_number: int, balance: float,
+                   date_created: datetime, fields) -> BankAccount | None:
+    """
+    Creates the account object for one account of accounts.csv or the binary account file.
+
+    Args:
+        account_type (str): The account class name.
+        account_number (int): The account number.
+        client_number (int): The client number.
+        balance (float): The balance.
+        date_created (datetime): The creation date.
+        fields (Mapping[str, str | float]): The type-specific columns, e.g. overdraft_limit.
+
+    Returns:
+        BankAccount: The account, or None if the account type is invalid.
+
+    Raises:
+        ValueError: If a type-specific column is not a number.
+    """
+    if account_type == "ChequingAccount":
+        return ChequingAccount(
+            account_number,
+            client_number,
+            balance,
+            date_created,
+            float(fields["overdraft_limit"]),
+            float(fields["overdraft_rate"])
+        )
+
+    elif account_type == "SavingsAccount":
+        return SavingsAccount(
+            account_number,
+            client_number,
+            balance,
+            date_created,
+            float(fields["minimum_balance"])
+        )
+
+    elif account_type == "InvestmentAccount":
+        return InvestmentAccount(
+            account_number,
+            client_number,
+            balance,
+            date_created,
+            float(fields["management_fee"])
+        )
+
+    return None
+
+def _account_fields(account: BankAccount) -> dict:
+    """
+    Returns the type-specific columns of an account, the inverse of
+    _build_account. Columns the account type does not use are None.
+
+    Args:
+        account (BankAccount): The account.
+
+    Returns:
+        dict[str, float | None]: The columns named in OPTIONAL_FIELDS.
+    """
+    fields = dict.fromkeys(OPTIONAL_FIELDS)
+
+    # _build_account passes these two columns as ChequingAccount's minimum_balance and overdraft_limit
+    if isinstance(account, ChequingAccount):
+        fields["overdraft_limit"] = account.minimum_balance
+        fields["overdraft_rate"] = account.overdraft_limit
+
+    elif isinstance(account, SavingsAccount):
+        fields["minimum_balance"] = account.minimum_balance
+
+    elif isinstance(account, InvestmentAccount):
+        fields["management_fee"] = float(account.management_fee)
+
+    return fields
+
+def _parse_account_row(row: dict, client_listing) -> BankAccount | None:
+    """
+    Builds a ChequingAccount, SavingsAccount or InvestmentAccount from one
+    row of accounts.csv.
+
+    Args:
+        row (dict[str, str]): The row, keyed by column name.
+        client_listing (Mapping[int, Client]): The loaded clients; accounts
+            whose client_number is not in it are rejected.
+
+    Returns:
+        BankAccount: The account, or None if the row is invalid (the row is logged).
+    """
+    try:
+        account_number = int(row["account_number"])
+        client_number = int(row["client_number"])
+
+        # Skip rows where client does not exist
+        if client_number not in client_listing:
+            logging.error(f"Account with client_number not found: {row}")
+            return None
+
+        # Validate balance
+        try:
+            balance = float(row["balance"])
+        except ValueError:
+            logging.error(f"Invalid balance: {row}")
+            return None
+
+        # Validate date
+        try:
+            date_created = datetime.strptime(row["date_created"], "%Y-%m-%d")
+        except ValueError:
+            logging.error(f"Invalid date format: {row}")
+            return None
+
+        account_type = row["account_type"]
+
+        # Create account object
+        account = _build_account(account_type, account_number, client_number, balance, date_created, row)
+
+        if account is None:
+            logging.error(f"Invalid account type: {row}")
+        return account
+
+    except Exception as e:
+        logging.error(f"Error parsing account row {row}: {e}")
+        return None
+
+def _load_accounts_binary(client_listing, accounts) -> None:
+    """
+    Builds the accounts from the binary account file, reading whole columns
+    of the memory-mapped records instead of parsing text.
+
+    Args:
+        client_listing (Mapping[int, Client]): The loaded clients; accounts
+            whose client_number is not in it are rejected.
+        accounts (MutableMapping[int, BankAccount]): The mapping the accounts are added to.
+    """
+    records = _get_account_file(accounts_bin_path).records()
+
+    account_numbers = records["account_number"].tolist()
+    client_numbers = records["client_number"].tolist()
+    balances = records["balance"].tolist()
+    dates = records["date_created"].astype("datetime64[us]").astype(object).tolist()
+    account_types = records["account_type"].tolist()
+    fields = [records[name].tolist() for name in OPTIONAL_FIELDS]
+
+    for index, account_number in enumerate(account_numbers):
+        if client_numbers[index] not in client_listing:
+            logging.error(f"Account with client_number not found: {records[index]}")
+            continue
+
+        values = dict(zip(OPTIONAL_FIELDS, (column[index] for column in fields)))
+        try:
+            account = _build_account(ACCOUNT_TYPES[account_types[index]], account_number,
+                                     client_numbers[index], balances[index], dates[index], values)
+        except Exception as e:
+            logging.error(f"Error building account {records[index]}: {e}")
+            continue
+
+        accounts[account_number] = account
+
+# Client numbers known to a parallel account-parsing worker process
+_worker_client_numbers = frozenset()
+
+def _init_account_worker(client_numbers: frozenset) -> None:
+    """
+    Stores the valid client numbers in a worker process, once per process
+    rather than once per byte range.
+
+    Args:
+        client_numbers (frozenset[int]): Client numbers loaded from clients.csv.
+    """
+    global _worker_client_numbers
+    _worker_client_numbers = client_numbers
+
+def _split_byte_ranges(path: str, parts: int) -> tuple[list[str], list[tuple[int, int]]]:
+    """
+    Splits the rows of a CSV file into byte ranges that start and end on line boundaries.
+
+    Args:
+        path (str): Path to the CSV file.
+        parts (int): The number of ranges wanted.
+
+    Returns:
+        tuple:
+            - fieldnames (list[str]): The column names from the header row.
+            - ranges (list[tuple[int, int]]): Start and end byte offsets, in file order.
+    """
+    with open(path, "rb") as file:
+        header = file.readline()
+        fieldnames = next(csv.reader([header.decode("utf-8-sig")]), [])
+        start = len(header)
+        size = os.fstat(file.fileno()).st_size
+        bounds = [start]
+
+        for part in range(1, parts):
+            file.seek(start + (size - start) * part // parts)
+            file.readline()
+            position = file.tell()
+
+            if bounds[-1] < position < size:
+                bounds.append(position)
+
+        bounds.append(size)
+
+    return fieldnames, list(zip(bounds, bounds[1:]))
+
+def _read_byte_range(path: str, fieldnames: list[str], start: int, end: int) -> csv.DictReader:
+    """
+    Returns a reader over the rows between two byte offsets of a CSV file.
+    """
+    with open(path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+
+    return csv.DictReader(io.StringIO(data.decode("utf-8"), newline=""), fieldnames=fieldnames)
+
+def _parse_client_range(path: str, fieldnames: list[str], start: int, end: int,
+                        trusted_source: bool) -> list[Client]:
+    """
+    Parses the clients in one byte range of clients.csv (runs in a worker process).
+    """
+    clients = []
+    for row in _read_byte_range(path, fieldnames, start, end):
+        client = _parse_client_row(row, trusted_source)
+        if client is not None:
+            clients.append(client)
+    return clients
+
+def _parse_account_range(path: str, fieldnames: list[str], start: int, end: int) -> list[BankAccount]:
+    """
+    Parses the accounts in one byte range of accounts.csv (runs in a worker process).
+    """
+    accounts = []
+    for row in _read_byte_range(path, fieldnames, start, end):
+        account = _parse_account_row(row, _worker_client_numbers)
+        if account is not None:
+            accounts.append(account)
+    return accounts
+
+def _load_data_parallel(workers: int, trusted_source: bool) -> tuple[dict, AccountStore]:
+    """
+    Loads clients.csv and then accounts.csv by parsing byte ranges of each
+    file in a pool of worker processes.
+
+    Results are merged in file order, so the dictionaries match those built
+    by a single-threaded load. Invalid rows are logged by the workers.
+
+    Args:
+        workers (int): The number of worker processes.
+        trusted_source (bool): Defer client email validation.
+
+    Returns:
+        tuple: The client listing and the account store.
+    """
+    client_listing = {}
+    accounts = AccountStore()
+
+    # READ CLIENT DATA
+    fieldnames, ranges = _split_byte_ranges(clients_csv_path, workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_parse_client_range, clients_csv_path, fieldnames, start, end,
+                                   trusted_source)
+                   for start, end in ranges]
+
+        for future in futures:
+            for client in future.result():
+                client_listing[client.client_number] = client
+
+    # READ ACCOUNT DATA
+    fieldnames, ranges = _split_byte_ranges(accounts_csv_path, workers)
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_account_worker,
+                             initargs=(frozenset(client_listing),)) as executor:
+        futures = [executor.submit(_parse_account_range, accounts_csv_path, fieldnames, start, end)
+                   for start, end in ranges]
+
+        for future in futures:
+            for account in future.result():
+                accounts[account.account_number] = account
+
+    return client_listing, accounts
+
+# Background compactor started by open_journal
+_compactor = None
+
+def open_journal(commit_delay: float = 0.0,
+                 compact_interval: float = SnapshotCompactor.DEFAULT_INTERVAL,
+                 compact_min_records: int = SnapshotCompactor.DEFAULT_MIN_RECORDS) -> TransactionJournal:
+    """
+    Starts recording every BankAccount balance change in the journal file,
+    so changes survive a crash before they are written to accounts.csv.
+    The journal is compacted into the snapshot file in the background.
+
+    Args:
+        commit_delay (float): Seconds a commit waits for concurrent changes to
+            share its fsync (see TransactionJournal).
+        compact_interval (float): Seconds between compaction checks, or None
+            to compact only when compact_data is called.
+        compact_min_records (int): Fewest journal records worth compacting.
+
+    Returns:
+        TransactionJournal: The journal, also set as BankAccount.journal.
+    """
+    global _compactor
+
+    journal = BankAccount.journal
+    if journal is None or journal.path != journal_path:
+        snapshot_sequence, _ = BalanceSnapshot(snapshot_path).read()
+        journal = TransactionJournal(journal_path, commit_delay, base_sequence=snapshot_sequence)
+        BankAccount.journal = journal
+
+        if _compactor is not None:
+            _compactor.stop()
+            _compactor = None
+
+        if compact_interval is not None:
+            _compactor = SnapshotCompactor(journal, BalanceSnapshot(snapshot_path),
+                                           compact_interval, compact_min_records)
+            _compactor.start()
+
+    return journal
+
+# Journals opened on an existing journal file when open_journal has not been called, keyed by path
+_journals = {}
+
+def _existing_journal() -> TransactionJournal | None:
+    """
+    Returns the journal at journal_path: the one set by open_journal or,
+    without it, one opened on the journal file.
+
+    Returns:
+        TransactionJournal: The journal, or None if there is no journal file.
+    """
+    journal = BankAccount.journal
+    if journal is not None and journal.path == journal_path:
+        return journal
+
+    journal = _journals.get(journal_path)
+    if journal is None:
+        if not os.path.exists(journal_path):
+            return None
+        journal = _journals[journal_path] = TransactionJournal(journal_path)
+    return journal
+
+def _checkpoint_balances(balances: dict) -> None:
+    """
+    Records balances about to be written to accounts.csv as CHECKPOINT
+    records in the journal, with a single fsync. Replaying the snapshot and
+    journal then ends at the balance written, not at an older snapshot or
+    journaled one, even if the change written was never journaled. Nothing
+    is recorded if there is neither a journal nor a snapshot. The caller
+    holds the accounts.csv lock until the file is written.
+
+    Args:
+        balances (dict[int, float]): The balances, keyed by account number.
+    """
+    journal = _existing_journal()
+    if journal is None and os.path.exists(snapshot_path):
+        # Start a journal after the snapshot so its checkpoints are replayed over it
+        snapshot_sequence, _ = BalanceSnapshot(snapshot_path).read()
+        journal = _journals[journal_path] = TransactionJournal(journal_path, base_sequence=snapshot_sequence)
+
+    if journal is not None:
+        journal.append_many((TransactionJournal.CHECKPOINT, account_number, 0.0, balance)
+                            for account_number, balance in balances.items())
+
+def compact_data() -> int:
+    """
+    Folds the journal into the snapshot file and truncates the journal.
+
+    Returns:
+        int: The number of journal records removed.
+    """
+    journal = _existing_journal()
+    if journal is None:
+        return 0
+
+    return compact(journal, BalanceSnapshot(snapshot_path))
+
+def _replay_journal(accounts) -> None:
+    """
+    Applies the snapshot and the journal records that follow it, if there
+    are any, on top of the loaded accounts.
+
+    Args:
+        accounts (MutableMapping[int, BankAccount]): The loaded accounts.
+    """
+    balances = recover_balances(BalanceSnapshot(snapshot_path), _existing_journal())
+
+    # A lazy store applies each balance when the account is parsed, so evicting it is safe
+    if isinstance(accounts, LazyAccountStore):
+        accounts.restore_balances(balances)
+    else:
+        restore_balances(accounts, balances)
+
+def load_data(lazy: bool = False, cache_size: int = LazyAccountStore.DEFAULT_CACHE_SIZE,
+              workers: int = 1, trusted_source: bool = False) -> tuple:
     """
     Loads client and bank account data from CSV files and returns two dictionaries.
 
+    Args:
+        lazy (bool): If True, return immediately with mappings that parse rows
+            only when a client or account is first used (see Notes).
+        cache_size (int): In lazy mode, the most parsed objects each mapping keeps.
+        workers (int): If greater than 1, parse byte ranges of each file in this
+            many worker processes and merge the results.
+        trusted_source (bool): If True, the client file is trusted and each
+            email address is validated when it is first read instead of on load.
+
     Returns:
         tuple:
             - client_listing (dict[int, Client]): Keys are client_number, values are Client objects.
-            - accounts (dict[int, BankAccount]): Keys are account_number, values are BankAccount subclass objects.
+            - accounts (AccountStore[int, BankAccount]): Keys are account_number, values are BankAccount
+              subclass objects. The store also indexes account numbers by client_number.
 
     Notes:
         - Invalid rows are logged in manage_data.log.
         - Clients with missing names or accounts with invalid data are skipped.
+        - Balance changes recorded in the snapshot and journal (see open_journal)
+          are applied on top of the balances read from accounts.csv.
+        - If the binary account file exists (see account_file.py) accounts are
+          read from it instead of accounts.csv, except in lazy mode or when
+          accounts.csv was modified after it, e.g. edited by hand; a warning is
+          logged then. Regenerate it after editing accounts.csv. workers is
+          ignored, with a warning, while the binary file is read.
+        - In lazy mode a LazyClientListing and a LazyAccountStore are returned
+          instead. They keep a byte-offset index of each file, built on first
+          use, and hold at most cache_size parsed objects, so an evicted object
+          is re-read from disk the next time it is used. Snapshot and journal
+          balances are applied as rows are parsed, and the accounts they change
+          are never evicted.
     """
+    if lazy:
+        client_listing = LazyClientListing(
+            clients_csv_path,
+            lambda row: _parse_client_row(row, trusted_source),
+            cache_size
+        )
+        accounts = LazyAccountStore(
+            accounts_csv_path,
+            lambda row: _parse_account_row(row, client_listing),
+            cache_size
+        )
+        _replay_journal(accounts)
+        return client_listing, accounts
+
+    use_binary = _use_binary_accounts()
+
+    if workers > 1 and use_binary:
+        logging.warning(f"Ignoring workers={workers}: accounts are read from {accounts_bin_path}.")
+
+    if workers > 1 and not use_binary:
+        client_listing, accounts = _load_data_parallel(workers, trusted_source)
+        _replay_journal(accounts)
+        return client_listing, accounts
 
     client_listing = {}
-    accounts = {}
+    accounts = AccountStore()
+    load_data_into(client_listing, accounts, trusted_source=trusted_source)
+
+    return client_listing, accounts
+
+def _use_binary_accounts() -> bool:
+    """
+    Returns True if accounts should be read from the binary account file:
+    it exists and accounts.csv has not been modified since it was written.
+    A newer accounts.csv is logged as a warning.
+    """
+    if not os.path.exists(accounts_bin_path):
+        return False
+
+    if os.path.getmtime(accounts_csv_path) > os.path.getmtime(accounts_bin_path):
+        logging.warning(f"{accounts_csv_path} is newer than {accounts_bin_path}; reading accounts "
+                        f"from the CSV file. Regenerate the binary file with csv_to_binary.")
+        return False
+    return True
+
+# Rows read between two progress reports of load_data_into
+PROGRESS_INTERVAL = 1000
+
+def _count_characters(lines, counter: list):
+    """Yield each line of a text file, adding its length to counter[0]."""
+    for line in lines:
+        counter[0] += len(line)
+        yield line
+
+def load_data_into(client_listing, accounts, progress=None, trusted_source: bool = False) -> None:
+    """
+    Loads clients and accounts into the given mappings, one row at a time,
+    so another thread can look up what has been loaded so far. Balances from
+    the snapshot and journal are applied at the end.
+
+    Args:
+        client_listing (MutableMapping[int, Client]): Receives the clients.
+        accounts (MutableMapping[int, BankAccount]): Receives the accounts.
+        progress (Callable[[int, int], None]): Called every PROGRESS_INTERVAL rows
+            and at the end with the bytes read so far and the total bytes to read.
+        trusted_source (bool): If True, each email address is validated when it
+            is first read instead of on load.
+
+    Notes:
+        - The binary account file is used when it exists, as in load_data.
+        - An exception raised by progress stops the load.
+    """
+    use_binary = _use_binary_accounts()
+    accounts_path = accounts_bin_path if use_binary else accounts_csv_path
+    total = os.path.getsize(clients_csv_path) + os.path.getsize(accounts_path)
+    read = [0]
+
+    def report(rows: int) -> None:
+        if progress is not None and rows % PROGRESS_INTERVAL == 0:
+            progress(min(read[0], total), total)
 
-    # READ CLIENT DATA 
+    # READ CLIENT DATA
     with open(clients_csv_path, newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-
-        for row in reader:
-            try:
-                client_number = int(row["client_number"])
-                first_name = row["first_name"]
-                last_name = row["last_name"]
-                email = row["email_address"]
-
-                # Handle missing names (like client 1011)
-                if not first_name or not last_name:
-                    logging.error(f"Missing name in clients.csv row: {row}")
-                    continue
-
-                client_listing[client_number] = Client(
-                    client_number,
-                    first_name,
-                    last_name,
-                    email
-                )
-
-            except ValueError:
-                logging.error(f"Invalid client_number in row: {row}")
-                continue
+        reader = csv.DictReader(_count_characters(csvfile, read))
 
-    # READ ACCOUNT DATA
-    with open(accounts_csv_path, newline='') as csvfile:
-        reader = csv.DictReader(csvfile)  
-
-        for row in reader:
-            try:
-                account_number = int(row["account_number"])
-                client_number = int(row["client_number"])
-
-                # Skip rows where client does not exist
-                if client_number not in client_listing:
-                    logging.error(f"Account with client_number not found: {row}")
-                    continue
-
-                # Validate balance
-                try:
-                    balance = float(row["balance"])
-                except ValueError:
-                    logging.error(f"Invalid balance: {row}")
-                    continue
-
-                # Validate date
-                try:
-                    date_created = datetime.strptime(row["date_created"], "%Y-%m-%d")
-                except ValueError:
-                    logging.error(f"Invalid date format: {row}")
-                    continue
-
-                account_type = row["account_type"]
-
-                # Create account object
-                if account_type == "ChequingAccount":
-                    account = ChequingAccount(
-                        account_number,
-                        client_number,
-                        balance,
-                        date_created,
-                        float(row["overdraft_limit"]),
-                        float(row["overdraft_rate"])
-                    )
-
-                elif account_type == "SavingsAccount":
-                    account = SavingsAccount(
-                        account_number,
-                        client_number,
-                        balance,
-                        date_created,
-                        float(row["minimum_balance"])
-                    )
-
-                elif account_type == "InvestmentAccount":
-                    account = InvestmentAccount(
-                        account_number,
-                        client_number,
-                        balance,
-                        date_created,
-                        float(row["management_fee"])
-                    )
-                
-                else:
-                    logging.error(f"Invalid account type: {row}")
-                    continue
-
-                accounts[account_number] = account
-
-            except Exception as e:
-                logging.error(f"Error parsing account row {row}: {e}")
-                continue
+        for rows, row in enumerate(reader, 1):
+            client = _parse_client_row(row, trusted_source)
+            if client is not None:
+                client_listing[client.client_number] = client
+            report(rows)
 
-    return client_listing, accounts
+    # READ ACCOUNT DATA
+    if use_binary:
+        _load_accounts_binary(client_listing, accounts)
+        read[0] = total
+    else:
+        with open(accounts_csv_path, newline='') as csvfile:
+            reader = csv.DictReader(_count_characters(csvfile, read))
+
+            for rows, row in enumerate(reader, 1):
+                account = _parse_account_row(row, client_listing)
+                if account is not None:
+                    accounts[account.account_number] = account
+                report(rows)
+
+    _replay_journal(accounts)
+
+    if progress is not None:
+        progress(total, total)
     
+# In-place balance writers, keyed by accounts file path
+_balance_files = {}
+
+def _get_balance_file(path: str) -> BalanceFile:
+    """
+    Returns the BalanceFile for a path, creating it on first use so its
+    byte-offset index is shared by every update to that file.
+
+    Args:
+        path (str): Path to an accounts CSV file.
+
+    Returns:
+        BalanceFile: The in-place balance writer for the file.
+    """
+    if path not in _balance_files:
+        _balance_files[path] = BalanceFile(path)
+    return _balance_files[path]
+
+# Memory-mapped binary account files, keyed by path
+_account_files = {}
+
+def _get_account_file(path: str) -> AccountFile:
+    """
+    Returns the AccountFile for a path, creating it on first use so its
+    memory map and account-number index are shared.
+
+    Args:
+        path (str): Path to a binary account file.
+
+    Returns:
+        AccountFile: The account file.
+    """
+    if path not in _account_files:
+        _account_files[path] = AccountFile(path)
+    return _account_files[path]
+
 def update_data(updated_account: BankAccount) -> None:
     """
     Updates the balance of a given BankAccount in accounts.csv.
@@ -176,29 +689,128 @@ def update_data(updated_account: BankAccount) -> None:
         updated_account (BankAccount): A BankAccount object containing the updated balance.
 
     Notes:
-        - Reads the accounts.csv file, modifies the balance for the given account_number,
-          and writes the updated data back to the file.
+        - Only the balance field of the given account_number is rewritten, in place.
+          The balance column is padded to a fixed width the first time the file is
+          updated, which load_data reads unchanged.
         - Other fields remain unchanged.
+        - The binary account file, if present, is updated in place as well.
+        - The balance is first checkpointed in the journal, if there is one, so
+          load_data does not replace it with an older journaled balance.
+        - The account's lock is held while its balance is read and written, so
+          concurrent updates from other threads of this process are not lost.
+          The accounts.csv lock is held while both files are written, so writes
+          from other processes never interleave with it and the files stay
+          whole. The balance written is this process's in-memory balance: if
+          another process changed the same account, the last write wins.
+    """
+    with updated_account.lock, file_lock(accounts_csv_path):
+        _checkpoint_balances({updated_account.account_number: updated_account.balance})
+        _get_balance_file(accounts_csv_path).update_balance(
+            updated_account.account_number,
+            updated_account.balance
+        )
+
+        if os.path.exists(accounts_bin_path):
+            _get_account_file(accounts_bin_path).update_balance(
+                updated_account.account_number,
+                updated_account.balance
+            )
+
+
+def update_many(updated_accounts) -> int:
     """
-    updated_rows = []
+    Updates the balances of many BankAccounts in accounts.csv in one pass.
 
-    with open(accounts_csv_path, mode='r', newline='') as file:
-        reader = csv.DictReader(file)
-        fields = reader.fieldnames
-        
-        for row in reader:
-            account_number = int(row['account_number'])
-            # Check if the account number is in the dictionary
-            if account_number == updated_account.account_number:
-                # Update the balance column with the new balance from the dictionary
-                row['balance'] = updated_account.balance
-            updated_rows.append(row)
+    Args:
+        updated_accounts (Iterable[BankAccount]): Accounts containing updated balances.
+            If an account number appears more than once, the last account wins.
+
+    Returns:
+        int: The number of rows in accounts.csv whose balance changed.
+
+    Notes:
+        - The file is rewritten once into a temporary file which atomically
+          replaces accounts.csv, so a failure never leaves it half written.
+        - The binary account file, if present, is updated in place as well.
+        - The balances are first checkpointed in the journal, as in update_data.
+        - Every account's lock is held while the balances are read and written,
+          and the accounts.csv lock while both files are written. As in
+          update_data, the last process to write an account's balance wins.
+    """
+    updated_accounts = {account.account_number: account for account in updated_accounts}
+
+    if not updated_accounts:
+        return 0
+
+    with account_locks.locked(*updated_accounts), file_lock(accounts_csv_path):
+        balances = {number: account.balance for number, account in updated_accounts.items()}
+        _checkpoint_balances(balances)
+        rows_changed = _get_balance_file(accounts_csv_path).rewrite_balances(balances)
+
+        if os.path.exists(accounts_bin_path):
+            _get_account_file(accounts_bin_path).update_balances(balances)
+
+    return rows_changed
+
+class AccountTransaction:
+    """
+    A context manager which collects changed BankAccount objects and
+    commits all of their balances with a single update_many call when the
+    block exits without an exception.
+
+        with AccountTransaction() as transaction:
+            for account in accounts.values():
+                account.update_balance(-account.get_service_charges())
+                transaction.add(account)
+
+        print(transaction.rows_changed)
+
+    Attributes:
+        rows_changed (int): Rows changed by the commit, or 0 before it runs.
+    """
 
-    # Write the updated data back to the CSV
-    with open(accounts_csv_path, mode='w', newline='') as file:
-        writer = csv.DictWriter(file, fieldnames=fields)
-        writer.writeheader()
-        writer.writerows(updated_rows)
+    def __init__(self):
+        """
+        Initializes an empty transaction.
+        """
+        self._dirty_accounts = {}
+        self.rows_changed = 0
+
+    def add(self, account: BankAccount) -> None:
+        """
+        Marks an account as changed so its balance is written on commit.
+
+        Args:
+            account (BankAccount): The changed account.
+        """
+        self._dirty_accounts[account.account_number] = account
+
+    def commit(self) -> int:
+        """
+        Writes the balances of every changed account and clears the transaction.
+
+        Returns:
+            int: The number of rows whose balance changed.
+        """
+        self.rows_changed = update_many(self._dirty_accounts.values())
+        self._dirty_accounts.clear()
+        return self.rows_changed
+
+    def rollback(self) -> None:
+        """
+        Discards the changed accounts without writing them.
+        """
+        self._dirty_accounts.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
 
 
 # GIVEN TESTING SECTION:
@@ -209,7 +821,6 @@ if __name__ == "__main__":
     for client in clients.values():
         print(client)
         print(f"{client.client_number} Accounts\n=============")
-        for account in accounts.values():
-            if account.client_number == client.client_number:
-                print(f"{account}\n")
+        for account in accounts.accounts_for_client(client.client_number):
+            print(f"{account}\n")
         print("=========================================")
\ No newline at end of file
@@ -0,0 +1,434 @@
+"""
+Description: Provides the StorageBackend interface through which the user
+interface loads clients and accounts and saves balances, with a CSV
+implementation (the manage_data functions) and a SQLite implementation that
+reads single clients and accounts on demand instead of loading every row.
+"""
+__author__ = "Komalpreet Kaur"
+__version__ = "1.0.0"
+__credits__ = ""
+
+import csv
+import math
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, MutableMapping
+from datetime import datetime
+
+from bank_account.bank_account import BankAccount
+from user_interface import manage_data
+from user_interface.account_store import AccountStore
+from user_interface.account_file import OPTIONAL_FIELDS, record_from_row, ACCOUNT_TYPES
+
+class StorageBackend(ABC):
+    """
+    Where clients and accounts are stored.
+
+    load() returns a client mapping and an account mapping with the
+    interface of load_data's results: clients keyed by client_number and
+    accounts keyed by account_number, with accounts_for_client(). To use
+    the mappings while they are being filled (e.g. from a loader thread),
+    get them from new_mappings() and fill them with load_into().
+    """
+
+    def load(self) -> tuple:
+        """
+        Returns the clients and accounts.
+
+        Returns:
+            tuple:
+                - client_listing (Mapping[int, Client]): Clients keyed by client_number.
+                - accounts (MutableMapping[int, BankAccount]): Accounts keyed by account_number.
+        """
+        client_listing, accounts = self.new_mappings()
+        self.load_into(client_listing, accounts)
+        return client_listing, accounts
+
+    @abstractmethod
+    def new_mappings(self) -> tuple:
+        """
+        Returns the client and account mappings load_into() fills.
+
+        Returns:
+            tuple: The client listing and the accounts, as returned by load().
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def load_into(self, client_listing, accounts, progress=None) -> None:
+        """
+        Fills the mappings returned by new_mappings().
+
+        Args:
+            client_listing (Mapping[int, Client]): The client listing.
+            accounts (MutableMapping[int, BankAccount]): The accounts.
+            progress (Callable[[int, int], None]): Called now and then with the
+                amount of work done and the total; an exception it raises stops the load.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_balance(self, account: BankAccount) -> None:
+        """
+        Saves the balance of one account.
+
+        Args:
+            account (BankAccount): The account holding the new balance.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_balances(self, accounts) -> int:
+        """
+        Saves the balances of many accounts together.
+
+        Args:
+            accounts (Iterable[BankAccount]): The accounts holding the new balances.
+
+        Returns:
+            int: The number of stored balances changed.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Releases any resources held by the backend."""
+
+class CsvBackend(StorageBackend):
+    """
+    The data/clients.csv and data/accounts.csv files, through load_data,
+    update_data and update_many. Loading also starts the transaction journal.
+    """
+
+    def __init__(self, **load_options):
+        """
+        Initializes the backend.
+
+        Args:
+            **load_options: Keyword arguments passed to load_data, e.g. lazy=True.
+                load_into() uses only trusted_source.
+        """
+        self.load_options = load_options
+
+    def load(self) -> tuple:
+        client_listing, accounts = manage_data.load_data(**self.load_options)
+        manage_data.open_journal()
+        return client_listing, accounts
+
+    def new_mappings(self) -> tuple:
+        return {}, AccountStore()
+
+    def load_into(self, client_listing, accounts, progress=None) -> None:
+        manage_data.load_data_into(client_listing, accounts, progress,
+                                   self.load_options.get("trusted_source", False))
+        manage_data.open_journal()
+
+    def update_balance(self, account: BankAccount) -> None:
+        manage_data.update_data(account)
+
+    def update_balances(self, accounts) -> int:
+        return manage_data.update_many(accounts)
+
+class SqliteBackend(StorageBackend):
+    """
+    A SQLite database holding a clients table and an accounts table, the
+    latter indexed by client_number.
+
+    The database runs in WAL mode, so readers never wait for a writer, and
+    every balance update is a single-row UPDATE committed immediately (the
+    statement is prepared once and reused from the connection's cache).
+    Rows are turned into Client and BankAccount objects only when they are
+    looked up.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS clients (
+            client_number INTEGER PRIMARY KEY,
+            first_name TEXT NOT NULL,
+            last_name TEXT NOT NULL,
+            email_address TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS accounts (
+            account_number INTEGER PRIMARY KEY,
+            client_number INTEGER NOT NULL,
+            balance REAL NOT NULL,
+            date_created TEXT NOT NULL,
+            account_type TEXT NOT NULL,
+            overdraft_limit REAL,
+            overdraft_rate REAL,
+            minimum_balance REAL,
+            management_fee REAL
+        );
+        CREATE INDEX IF NOT EXISTS accounts_client_number ON accounts (client_number);
+    """
+
+    ACCOUNT_COLUMNS = ("account_number", "client_number", "balance", "date_created",
+                       "account_type") + OPTIONAL_FIELDS
+
+    _UPDATE_BALANCE = "UPDATE accounts SET balance = ? WHERE account_number = ?"
+
+    def __init__(self, path: str, trusted_source: bool = False):
+        """
+        Opens (creating if needed) the database.
+
+        Args:
+            path (str): Path of the database file.
+            trusted_source (bool): Validate client email addresses when first
+                read instead of when the client is looked up.
+        """
+        self.path = path
+        self.trusted_source = trusted_source
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(self.SCHEMA)
+
+    def import_csv(self, clients_csv_path: str, accounts_csv_path: str) -> tuple[int, int]:
+        """
+        Replaces the database contents with the rows of clients.csv and
+        accounts.csv, in one transaction. Rows load_data would reject for
+        their own values are left out (and logged); accounts are kept even
+        if their client is missing, as load_data checks that on lookup.
+
+        Args:
+            clients_csv_path (str): Path of clients.csv.
+            accounts_csv_path (str): Path of accounts.csv.
+
+        Returns:
+            tuple[int, int]: The numbers of clients and accounts imported.
+        """
+        clients = []
+        with open(clients_csv_path, newline="") as csvfile:
+            for row in csv.DictReader(csvfile):
+                try:
+                    client_number = int(row["client_number"])
+                except (TypeError, ValueError):
+                    manage_data.logging.error(f"Invalid client_number in row: {row}")
+                    continue
+                if not row["first_name"] or not row["last_name"]:
+                    manage_data.logging.error(f"Missing name in clients.csv row: {row}")
+                    continue
+                clients.append((client_number, row["first_name"], row["last_name"], row["email_address"]))
+
+        accounts = []
+        with open(accounts_csv_path, newline="") as csvfile:
+            for row in csv.DictReader(csvfile):
+                try:
+                    record = record_from_row(row)
+                except (KeyError, TypeError, ValueError) as e:
+                    manage_data.logging.error(f"Error parsing account row {row}: {e}")
+                    continue
+                values = list(record)
+                values[3] = str(values[3])
+                values[4] = ACCOUNT_TYPES[values[4]]
+                accounts.append(tuple(None if isinstance(value, float) and math.isnan(value) else value
+                                      for value in values))
+
+        placeholders = ", ".join("?" for _ in self.ACCOUNT_COLUMNS)
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM accounts")
+            self._connection.execute("DELETE FROM clients")
+            self._connection.executemany("INSERT INTO clients VALUES (?, ?, ?, ?)", clients)
+            self._connection.executemany(
+                f"INSERT INTO accounts ({', '.join(self.ACCOUNT_COLUMNS)}) VALUES ({placeholders})", accounts)
+
+        return len(clients), len(accounts)
+
+    def new_mappings(self) -> tuple:
+        clients = SqliteClientListing(self)
+        return clients, SqliteAccountStore(self, clients)
+
+    def load_into(self, client_listing, accounts, progress=None) -> None:
+        # Rows are read on demand, so there is nothing to load up front
+        if progress is not None:
+            progress(1, 1)
+
+    def update_balance(self, account: BankAccount) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(self._UPDATE_BALANCE, (account.balance, account.account_number))
+
+    def update_balances(self, accounts) -> int:
+        balances = {account.account_number: account.balance for account in accounts}
+        with self._lock, self._connection:
+            cursor = self._connection.executemany(
+                self._UPDATE_BALANCE, [(balance, number) for number, balance in balances.items()])
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def query(self, sql: str, parameters=()) -> list:
+        """
+        Runs a read-only query.
+
+        Args:
+            sql (str): The statement.
+            parameters (tuple): Its parameters.
+
+        Returns:
+            list[sqlite3.Row]: The result rows.
+        """
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def execute(self, sql: str, parameters=()) -> int:
+        """
+        Runs one statement in its own transaction.
+
+        Args:
+            sql (str): The statement.
+            parameters (tuple): Its parameters.
+
+        Returns:
+            int: The number of rows changed.
+        """
+        with self._lock, self._connection:
+            return self._connection.execute(sql, parameters).rowcount
+
+    def build_account(self, row) -> BankAccount | None:
+        """
+        Creates the account object for one accounts row.
+
+        Args:
+            row (sqlite3.Row): The row.
+
+        Returns:
+            BankAccount: The account, or None if its values are rejected (they are logged).
+        """
+        fields = {name: math.nan if row[name] is None else row[name] for name in OPTIONAL_FIELDS}
+        try:
+            return manage_data._build_account(row["account_type"], row["account_number"], row["client_number"],
+                                              row["balance"], datetime.strptime(row["date_created"], "%Y-%m-%d"),
+                                              fields)
+        except Exception as e:
+            manage_data.logging.error(f"Error building account {dict(row)}: {e}")
+            return None
+
+class SqliteClientListing(Mapping):
+    """
+    Clients read from a SqliteBackend by client_number. A client is built
+    the first time it is looked up and the same object is returned afterwards.
+    """
+
+    def __init__(self, backend: SqliteBackend):
+        self._backend = backend
+        self._clients = {}
+
+    def __getitem__(self, client_number):
+        if client_number in self._clients:
+            return self._clients[client_number]
+
+        rows = self._backend.query("SELECT * FROM clients WHERE client_number = ?", (client_number,))
+        client = manage_data._parse_client_row(dict(rows[0]), self._backend.trusted_source) if rows else None
+        if client is None:
+            raise KeyError(client_number)
+
+        self._clients[client_number] = client
+        return client
+
+    def __contains__(self, client_number) -> bool:
+        if client_number in self._clients:
+            return True
+        return bool(self._backend.query("SELECT 1 FROM clients WHERE client_number = ?", (client_number,)))
+
+    def __iter__(self):
+        rows = self._backend.query("SELECT client_number FROM clients ORDER BY client_number")
+        return iter([row[0] for row in rows])
+
+    def __len__(self) -> int:
+        return self._backend.query("SELECT COUNT(*) FROM clients")[0][0]
+
+class SqliteAccountStore(MutableMapping):
+    """
+    Accounts read from a SqliteBackend by account_number or client_number.
+    An account is built the first time it is looked up and the same object
+    is returned afterwards; storing an account saves its client number and
+    balance, or inserts it if it is not in the database.
+    """
+
+    def __init__(self, backend: SqliteBackend, client_listing: Mapping):
+        self._backend = backend
+        self._client_listing = client_listing
+        self._accounts = {}
+
+    def _account_from_row(self, row) -> BankAccount | None:
+        """Return the cached or newly built account for a row, or None if it is rejected."""
+        account_number = row["account_number"]
+        if account_number in self._accounts:
+            return self._accounts[account_number]
+
+        if row["client_number"] not in self._client_listing:
+            manage_data.logging.error(f"Account with client_number not found: {dict(row)}")
+            return None
+
+        account = self._backend.build_account(row)
+        if account is not None:
+            self._accounts[account_number] = account
+        return account
+
+    def __getitem__(self, account_number):
+        if account_number in self._accounts:
+            return self._accounts[account_number]
+
+        rows = self._backend.query("SELECT * FROM accounts WHERE account_number = ?", (account_number,))
+        account = self._account_from_row(rows[0]) if rows else None
+        if account is None:
+            raise KeyError(account_number)
+        return account
+
+    def __setitem__(self, account_number, account):
+        self._accounts[account_number] = account
+        if not self._backend.execute("UPDATE accounts SET client_number = ?, balance = ? WHERE account_number = ?",
+                                     (account.client_number, account.balance, account_number)):
+            fields = manage_data._account_fields(account)
+            self._backend.execute(
+                f"INSERT INTO accounts ({', '.join(SqliteBackend.ACCOUNT_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in SqliteBackend.ACCOUNT_COLUMNS)})",
+                (account_number, account.client_number, account.balance,
+                 f"{account.date_created or datetime.now():%Y-%m-%d}", type(account).__name__,
+                 *(fields[name] for name in OPTIONAL_FIELDS)))
+
+    def __delitem__(self, account_number):
+        self._accounts.pop(account_number, None)
+        if not self._backend.execute("DELETE FROM accounts WHERE account_number = ?", (account_number,)):
+            raise KeyError(account_number)
+
+    def __iter__(self):
+        rows = self._backend.query("SELECT account_number FROM accounts ORDER BY account_number")
+        return iter([row[0] for row in rows])
+
+    def __len__(self) -> int:
+        return self._backend.query("SELECT COUNT(*) FROM accounts")[0][0]
+
+    def account_numbers_for_client(self, client_number: int) -> list[int]:
+        """
+        Returns the account numbers belonging to a client, using the client_number index.
+
+        Args:
+            client_number (int): The client.
+
+        Returns:
+            list[int]: The account numbers, in ascending order.
+        """
+        rows = self._backend.query(
+            "SELECT account_number FROM accounts WHERE client_number = ? ORDER BY account_number",
+            (client_number,))
+        return [row[0] for row in rows]
+
+    def accounts_for_client(self, client_number: int) -> list[BankAccount]:
+        """
+        Returns a client's accounts with one indexed query.
+
+        Args:
+            client_number (int): The client.
+
+        Returns:
+            list[BankAccount]: The accounts, in ascending account-number order.
+        """
+        rows = self._backend.query(
+            "SELECT * FROM accounts WHERE client_number = ? ORDER BY account_number", (client_number,))
+        accounts = (self._account_from_row(row) for row in rows)
+        return [account for account in accounts if account is not None]
@@ -0,0 +1,121 @@
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+class FileLock:
+    """
+    An exclusive advisory lock shared by every thread and process that
+    writes a data file.
+
+    The lock is taken on a separate path + ".lock" file, because data
+    files replaced with os.replace() get a new inode and any lock held on
+    the old one would stop excluding anybody. Processes are excluded with
+    fcntl.flock (msvcrt.locking on Windows; where neither exists only this
+    process's threads are excluded). The lock is re-entrant within a thread,
+    so a locked method may call other locked methods.
+
+    Use file_lock(path) rather than creating FileLocks directly, so that
+    every writer of a file in this process shares one lock.
+    """
+
+    __slots__ = ("path", "_thread_lock", "_depth", "_file")
+
+    RETRY_INTERVAL = 0.01
+
+    def __init__(self, path: str):
+        """
+        Initializes the lock. The lock file is created on first acquire.
+
+        Args:
+            path (str): Path of the data file to lock.
+        """
+        self.path = path + ".lock"
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def acquire(self) -> None:
+        """Waits for and takes the lock."""
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._lock_file()
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self) -> None:
+        """Releases the lock once for each acquire."""
+        self._depth -= 1
+        try:
+            if self._depth == 0:
+                self._unlock_file()
+        finally:
+            self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+        return False
+
+    def _lock_file(self) -> None:
+        """Takes the lock held between processes."""
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "a+b")
+
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            self._file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_NBLCK, 1)
+                    return
+                except OSError:
+                    time.sleep(self.RETRY_INTERVAL)
+
+    def _unlock_file(self) -> None:
+        """Releases the lock held between processes."""
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+
+# Locks keyed by absolute data file path
+_file_locks = {}
+_file_locks_guard = threading.Lock()
+
+def file_lock(path: str) -> FileLock:
+    """
+    Returns the lock shared by every writer of a data file in this process.
+
+    Args:
+        path (str): Path of the data file.
+
+    Returns:
+        FileLock: The file's lock.
+    """
+    key = os.path.abspath(path)
+    with _file_locks_guard:
+        lock = _file_locks.get(key)
+        if lock is None:
+            lock = _file_locks[key] = FileLock(key)
+        return lock
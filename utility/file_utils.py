@@ -1,4 +1,127 @@
+import atexit
 import os
+import threading
+import time
+import weakref
+
+class EmailSink:
+    """
+    A buffered writer for 'simulated' emails.
+
+    Messages are appended to an in-memory buffer and written, in the order
+    they were sent, to a file that stays open between writes. The buffer is
+    flushed when it holds flush_size messages, when flush_interval seconds
+    have passed since the oldest buffered message was sent, and when the
+    interpreter exits. The subject and message may be any objects; they are
+    turned into text only when the buffer is written. The timer thread runs
+    only while messages are buffered.
+    """
+
+    DEFAULT_FLUSH_SIZE = 100
+    DEFAULT_FLUSH_INTERVAL = 1.0
+
+    def __init__(self, directory: str = "output", filename: str = "observer_emails.txt",
+                 flush_size: int = DEFAULT_FLUSH_SIZE, flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        """
+        Initializes the sink. The file is opened when the first message is flushed.
+
+        Args:
+            directory (str): Directory holding the email file.
+            filename (str): Name of the email file.
+            flush_size (int): Number of buffered messages that triggers a flush.
+            flush_interval (float): Longest time, in seconds, a message stays buffered.
+        """
+        self.path = os.path.join(directory, filename)
+        self.flush_size = max(int(flush_size), 1)
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._first_buffered_at = None
+        self._file = None
+        self._condition = threading.Condition(threading.Lock())
+        self._timer = None
+        _open_sinks.add(self)
+
+    def send(self, email_address, subject, message):
+        """
+        Buffers one 'simulated' email.
+
+        Args:
+            email_address (str):  The email address to which the 'simulated' message is sent.
+            subject (str):  The subject line for the 'simulated' message.
+            message (str): The message body for the 'simulated' message.
+        """
+        with self._condition:
+            self._buffer.append((email_address, subject, message))
+
+            if self._first_buffered_at is None:
+                self._first_buffered_at = time.monotonic()
+
+            if (len(self._buffer) >= self.flush_size
+                    or time.monotonic() - self._first_buffered_at >= self.flush_interval):
+                self._flush_locked()
+            else:
+                self._start_timer()
+
+    def flush(self):
+        """Writes every buffered message to the file."""
+        with self._condition:
+            self._flush_locked()
+
+    def close(self):
+        """Flushes the buffer, which stops the timer thread, and closes the file. A later send() reopens it."""
+        with self._condition:
+            self._flush_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _flush_locked(self):
+        """Writes the buffer; the caller must hold the lock."""
+        if not self._buffer:
+            return
+
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+
+        self._file.write("".join(f"---\nTo: {email_address}\nSubject: {subject}\nMessage: {message}\n---\n"
+                                 for email_address, subject, message in self._buffer))
+        self._file.flush()
+        self._buffer.clear()
+        self._first_buffered_at = None
+        self._condition.notify_all()
+
+    def _start_timer(self):
+        """Starts the background thread that flushes messages older than flush_interval; the caller holds the lock."""
+        if self._timer is None:
+            self._timer = threading.Thread(target=self._run_timer, name="email-sink", daemon=True)
+            self._timer.start()
+
+    def _run_timer(self):
+        """Flushes the buffer once its oldest message reaches flush_interval, and exits when it is empty."""
+        with self._condition:
+            while self._buffer:
+                delay = self._first_buffered_at + self.flush_interval - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                else:
+                    self._flush_locked()
+            self._timer = None
+
+# Sinks flushed and closed when the interpreter exits, held weakly so unused ones are collected
+_open_sinks = weakref.WeakSet()
+
+def _close_open_sinks():
+    """Closes every sink still in use."""
+    for sink in list(_open_sinks):
+        sink.close()
+
+atexit.register(_close_open_sinks)
+
+# Sink shared by every sender of 'simulated' emails
+email_sink = EmailSink()
 
 @staticmethod
 def simulate_send_email(email_address, subject, message):
@@ -6,14 +129,10 @@ def simulate_send_email(email_address, subject, message):
         Sends a 'simulated' email in the form of adding an email message 
         to a text file.  The message will appear in the 'observer_emails.txt' 
         file within the 'output' directory of the current project directory.
+        Messages are buffered by email_sink and written in order in batches.
         Args:
             email_address (str):  The email address to which the 'simulated' message is sent.
             subject (str):  The subject line for the 'simulated' message.
             message (str): The message body for the 'simulated' message.
         """
-        directory = "output"
-        filename = "observer_emails.txt"
-        path = os.path.join(directory, filename)
-        os.makedirs(directory, exist_ok=True)
-        with open(path, "a", encoding="utf-8") as file:
-            file.write(f"---\nTo: {email_address}\nSubject: {subject}\nMessage: {message}\n---\n")
\ No newline at end of file
+        email_sink.send(email_address, subject, message)